@@ -0,0 +1,464 @@
+# 2026-10-17 - 스마트 단어장 - 벤치마크용 대용량 DB 생성기
+# 파일 위치: C:\dev\word\benchmarks\data_generator.py - v1.0
+
+"""
+벤치마크용 합성 데이터베이스 생성
+- 프로필: 10k / 100k / 1m 단어 + 수백만 건 학습 이력 + 수천 건 시험
+- 같은 seed와 end_date면 항상 같은 데이터 (random.Random(seed)만 사용)
+- 기본 스키마에 직접 대량 INSERT 후 스키마 확장 단계를 적용해 검색 색인/일별 집계를 채움
+
+사용 예:
+    python benchmarks/data_generator.py --profile 10k --output benchmarks/data/10k.db
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+from database.db_connection import DBConnection
+from database.migrations import apply_migrations
+
+# 생성된 DB 기본 위치
+DATA_DIR = os.path.join(current_dir, 'data')
+
+# 프로필: 단어 수, 학습 이력 수, 시험 수, 기간(일)
+PROFILES = {
+    '10k': {'words': 10_000, 'history': 500_000, 'exams': 2_000, 'days': 365},
+    '100k': {'words': 100_000, 'history': 2_000_000, 'exams': 5_000, 'days': 730},
+    '1m': {'words': 1_000_000, 'history': 5_000_000, 'exams': 10_000, 'days': 1095},
+}
+
+ANSWERS_PER_SESSION = 40  # 플래시카드 세션당 답변 수
+QUESTIONS_PER_EXAM = 20  # 시험당 문항 수
+STUDIED_RATIO = 0.6  # 한 번이라도 학습한 단어 비율
+ACTIVE_DAY_RATIO = 0.8  # 학습한 날 비율 (나머지는 연속 학습 끊김)
+INSERT_BATCH_SIZE = 50_000
+
+# 영어 단어 음절 / 한국어 뜻 음절
+ENGLISH_ONSETS = ['b', 'c', 'd', 'f', 'g', 'h', 'l', 'm', 'n', 'p', 'r', 's', 't', 'v', 'w',
+                  'br', 'cl', 'cr', 'dr', 'fl', 'gr', 'pl', 'pr', 'sh', 'st', 'str', 'th', 'tr']
+ENGLISH_VOWELS = ['a', 'e', 'i', 'o', 'u', 'ea', 'ou', 'ai', 'io']
+ENGLISH_CODAS = ['', '', 'n', 'r', 's', 't', 'l', 'm', 'ck', 'nd', 'st', 'ng']
+ENGLISH_SUFFIXES = [''] * 6 + ['tion', 'ment', 'ness', 'able', 'ly', 'er', 'ing', 'ive', 'ous']
+KOREAN_SYLLABLES = list('가각간감강개거건검게결경계고공과관교구국군권규그근기길김나남내녀노'
+                        '다단대도동되두라래로리마만매명모무문물미민바반방배법변보부분불비사산'
+                        '상새생서선설성세소수시식신실심아안애야양어언여연영오용우운원위유으은'
+                        '음의이인일자작장재전정제조주중지진차착찰처천체초최추치친타태토통파판'
+                        '편평포표품하학한함합해행향현형호화확활회효후흐희')
+KOREAN_ENDINGS = ['', '', '하다', '적인', '되다', '의', '스러운']
+
+
+def close_database():
+    """
+    DBConnection 싱글톤 연결 종료 및 초기화 (다음 DBConnection()은 config.DATABASE_PATH로 새로 연결)
+    """
+    if DBConnection._instance is not None and DBConnection._instance._connection is not None:
+        DBConnection._instance.close()
+    
+    DBConnection._instance = None
+    DBConnection._connection = None
+
+
+def use_database(path):
+    """
+    DBConnection 싱글톤을 지정한 DB 파일로 다시 연결 (테스트 fixture와 같은 방식)
+    
+    Args:
+        path (str): DB 파일 경로
+    
+    Returns:
+        DBConnection: 새 연결
+    """
+    close_database()
+    config.DATABASE_PATH = path
+    return DBConnection()
+
+
+def _make_english(rng, used):
+    """
+    발음 가능한 합성 영어 단어 (중복 없음)
+    
+    Args:
+        rng (random.Random): 난수 생성기
+        used (set): 이미 만든 단어
+    
+    Returns:
+        str: 영어 단어
+    """
+    while True:
+        syllables = rng.choice((1, 2, 2, 2, 3))
+        word = ''.join(
+            rng.choice(ENGLISH_ONSETS) + rng.choice(ENGLISH_VOWELS) + rng.choice(ENGLISH_CODAS)
+            for _ in range(syllables)
+        ) + rng.choice(ENGLISH_SUFFIXES)
+        if word not in used:
+            used.add(word)
+            return word
+
+
+def _make_korean(rng):
+    """
+    합성 한국어 뜻 (가끔 쉼표로 여러 뜻)
+    
+    Args:
+        rng (random.Random): 난수 생성기
+    
+    Returns:
+        str: 한국어 뜻
+    """
+    meanings = []
+    for _ in range(1 if rng.random() < 0.8 else 2):
+        stem = ''.join(rng.choice(KOREAN_SYLLABLES) for _ in range(rng.choice((1, 2, 2, 3))))
+        meanings.append(stem + rng.choice(KOREAN_ENDINGS))
+    return ', '.join(meanings)
+
+
+def _timestamp(day, seconds):
+    """
+    날짜 + 하루 중 초 → ISO 8601 문자열
+    
+    Args:
+        day (date): 날짜
+        seconds (int): 0시 기준 초
+    
+    Returns:
+        str: 일시 문자열
+    """
+    return (datetime(day.year, day.month, day.day) + timedelta(seconds=seconds)).strftime(config.ISO8601_FORMAT)
+
+
+def _insert(connection, query, rows):
+    """
+    INSERT_BATCH_SIZE 단위로 나눠 executemany
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+        query (str): INSERT 쿼리
+        rows (iterable): 파라미터 목록 (제너레이터 가능)
+    
+    Returns:
+        int: 삽입한 행 수
+    """
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            connection.executemany(query, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        connection.executemany(query, batch)
+        count += len(batch)
+    return count
+
+
+class _WordState:
+    """
+    단어별 학습 누적값 (word_statistics 계산용, 배열로 보관)
+    """
+    
+    def __init__(self, word_count):
+        size = word_count + 1
+        self.attempts = [0] * size
+        self.correct = [0] * size
+        self.consecutive = [0] * size
+        self.last_study = [None] * size
+    
+    def record(self, word_id, is_correct, study_date):
+        self.attempts[word_id] += 1
+        if is_correct:
+            self.correct[word_id] += 1
+            self.consecutive[word_id] += 1
+        else:
+            self.consecutive[word_id] = 0
+        self.last_study[word_id] = study_date
+
+
+def _pick_word(rng, studied_count):
+    """
+    학습 단어 선택 (앞쪽 단어일수록 자주 학습하는 치우친 분포)
+    
+    Args:
+        rng (random.Random): 난수 생성기
+        studied_count (int): 학습 대상 단어 수
+    
+    Returns:
+        int: word_id
+    """
+    return int(studied_count * rng.random() ** 2) + 1
+
+
+def _is_correct(rng, word_id):
+    """
+    정답 여부 (단어마다 고정된 난이도)
+    
+    Args:
+        rng (random.Random): 난수 생성기
+        word_id (int): 단어 ID
+    
+    Returns:
+        int: 1 (정답) / 0 (오답)
+    """
+    difficulty = (word_id * 2654435761 % 1000) / 1000
+    return 1 if rng.random() < 0.95 - 0.5 * difficulty else 0
+
+
+def generate_database(path, profile='10k', seed=42, end_date=None, overrides=None):
+    """
+    합성 데이터베이스 생성 (기존 파일은 덮어씀)
+    
+    Args:
+        path (str): 생성할 DB 파일 경로
+        profile (str): PROFILES 키
+        seed (int): 난수 시드
+        end_date (date, optional): 마지막 학습일 (기본: 오늘)
+        overrides (dict, optional): 프로필 값 덮어쓰기 (예: {'history': 10000})
+    
+    Returns:
+        dict: 생성 요약 (행 수, 소요 시간)
+    """
+    spec = dict(PROFILES[profile], **(overrides or {}))
+    rng = random.Random(seed)
+    end_date = end_date or date.today()
+    start_date = end_date - timedelta(days=spec['days'] - 1)
+    started = time.perf_counter()
+    
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    for suffix in ('', '-wal', '-shm', '-journal'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    
+    connection = sqlite3.connect(path, isolation_level=None)
+    connection.execute("PRAGMA journal_mode = MEMORY")
+    connection.execute("PRAGMA synchronous = OFF")
+    for sql_file in ('schema.sql', 'init_data.sql'):
+        with open(os.path.join(project_root, 'database', sql_file), 'r', encoding='utf-8') as f:
+            connection.executescript(f.read())
+    # 세션보다 이력을 먼저 넣으므로 생성 중에는 외래키 검사 끔 (ID는 생성기가 보장)
+    connection.execute("PRAGMA foreign_keys = OFF")
+    
+    summary = {'profile': profile, 'seed': seed, 'end_date': end_date.isoformat()}
+    connection.execute("BEGIN")
+    
+    # 1. 단어
+    used = set()
+    created = _timestamp(start_date, 0)
+    summary['words'] = _insert(
+        connection,
+        "INSERT INTO words (word_id, english, korean, memo, is_favorite, created_date) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (
+                word_id, _make_english(rng, used), _make_korean(rng),
+                f"메모 {word_id}" if rng.random() < 0.2 else None,
+                1 if rng.random() < 0.05 else 0, created
+            )
+            for word_id in range(1, spec['words'] + 1)
+        )
+    )
+    del used
+    
+    # 2. 날짜별 학습 계획 (학습한 날만, 시간순)
+    days = [start_date + timedelta(days=offset) for offset in range(spec['days'])]
+    active_days = [day for day in days if rng.random() < ACTIVE_DAY_RATIO] or [end_date]
+    session_count = max(1, spec['history'] // ANSWERS_PER_SESSION)
+    sessions_by_day = [0] * len(active_days)
+    for _ in range(session_count):
+        sessions_by_day[rng.randrange(len(active_days))] += 1
+    exams_by_day = [0] * len(active_days)
+    for _ in range(spec['exams']):
+        exams_by_day[rng.randrange(len(active_days))] += 1
+    
+    state = _WordState(spec['words'])
+    studied_count = max(1, int(spec['words'] * STUDIED_RATIO))
+    sessions = []
+    history = []
+    exams = []
+    questions = []
+    wrong_notes = {}  # word_id: [exam_id, added_date, last_wrong_date, wrong_count]
+    resolved_notes = []
+    session_id = 0
+    exam_id = 0
+    history_total = 0
+    
+    def flush_history():
+        nonlocal history_total
+        connection.executemany(
+            "INSERT INTO learning_history (session_id, word_id, study_date, study_mode, is_correct, response_time) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            history
+        )
+        history_total += len(history)
+        history.clear()
+    
+    for day, session_total, exam_total in zip(active_days, sessions_by_day, exams_by_day):
+        # 3. 플래시카드 세션 + 학습 이력
+        for _ in range(session_total):
+            session_id += 1
+            seconds = rng.randrange(6 * 3600, 23 * 3600)
+            start_time = _timestamp(day, seconds)
+            study_mode = rng.choice(('flashcard_en_ko', 'flashcard_ko_en'))
+            correct = 0
+            for answer in range(ANSWERS_PER_SESSION):
+                word_id = _pick_word(rng, studied_count)
+                is_correct = _is_correct(rng, word_id)
+                study_date = _timestamp(day, seconds + answer * 8)
+                history.append((session_id, word_id, study_date, study_mode, is_correct, round(rng.uniform(1.0, 9.0), 1)))
+                state.record(word_id, is_correct, study_date)
+                correct += is_correct
+            end_time = _timestamp(day, seconds + ANSWERS_PER_SESSION * 8)
+            sessions.append((
+                session_id, 'flashcard', start_time, end_time, ANSWERS_PER_SESSION, correct,
+                ANSWERS_PER_SESSION - correct, round(correct * 100.0 / ANSWERS_PER_SESSION, 2),
+                rng.choice(('sequential', 'random', 'personalized'))
+            ))
+            if len(history) >= INSERT_BATCH_SIZE:
+                flush_history()
+        
+        # 4. 시험 + 문항 + 오답 노트
+        for _ in range(exam_total):
+            exam_id += 1
+            exam_date = _timestamp(day, rng.randrange(6 * 3600, 23 * 3600))
+            exam_type = rng.choice(('short_answer', 'multiple_choice'))
+            correct = 0
+            for number, word_id in enumerate(rng.sample(range(1, studied_count + 1), min(QUESTIONS_PER_EXAM, studied_count)), 1):
+                is_correct = _is_correct(rng, word_id)
+                correct += is_correct
+                questions.append((exam_id, word_id, number, f"answer{word_id}", f"answer{word_id}" if is_correct else "wrong", is_correct))
+                state.record(word_id, is_correct, exam_date)
+                
+                note = wrong_notes.get(word_id)
+                if not is_correct:
+                    if note:
+                        note[0], note[2], note[3] = exam_id, exam_date, note[3] + 1
+                    else:
+                        wrong_notes[word_id] = [exam_id, exam_date, exam_date, 1]
+                elif note and state.consecutive[word_id] >= config.CONSECUTIVE_CORRECT_TO_RESOLVE:
+                    resolved_notes.append((word_id, *wrong_notes.pop(word_id), exam_date))
+            
+            total = min(QUESTIONS_PER_EXAM, studied_count)
+            exams.append((
+                exam_id, exam_date, exam_type, 'en_to_ko', total, correct, total - correct,
+                round(correct * 100.0 / total, 1), rng.randrange(60, 900)
+            ))
+    flush_history()
+    
+    connection.executemany(
+        "INSERT INTO learning_sessions (session_id, session_type, start_time, end_time, total_words, "
+        "correct_count, wrong_count, accuracy_rate, study_mode) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        sessions
+    )
+    connection.executemany(
+        "INSERT INTO exam_history (exam_id, exam_date, exam_type, question_mode, total_questions, "
+        "correct_count, wrong_count, score, time_taken) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        exams
+    )
+    connection.executemany(
+        "INSERT INTO exam_questions (exam_id, word_id, question_number, correct_answer, user_answer, is_correct) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        questions
+    )
+    connection.executemany(
+        "INSERT INTO wrong_note (word_id, exam_id, added_date, wrong_count, is_resolved, resolved_date) "
+        "VALUES (?, ?, ?, ?, 1, ?)",
+        ((word_id, note_exam, added, count, resolved) for word_id, note_exam, added, _, count, resolved in resolved_notes)
+    )
+    connection.executemany(
+        "INSERT INTO wrong_note (word_id, exam_id, added_date, wrong_count) VALUES (?, ?, ?, ?)",
+        ((word_id, note[0], note[1], note[3]) for word_id, note in wrong_notes.items())
+    )
+    
+    # 5. 단어별 통계 (모든 단어, 학습 안 한 단어는 0)
+    def statistics_rows():
+        for word_id in range(1, spec['words'] + 1):
+            attempts = state.attempts[word_id]
+            correct = state.correct[word_id]
+            wrong_rate = round((attempts - correct) * 100.0 / attempts, 2) if attempts else 0.0
+            yield (
+                word_id, attempts, correct, attempts - correct, wrong_rate, state.last_study[word_id],
+                min(5, state.consecutive[word_id] + correct // 10) if attempts else 0,
+                state.consecutive[word_id]
+            )
+    
+    _insert(
+        connection,
+        "INSERT INTO word_statistics (word_id, total_attempts, correct_count, wrong_count, wrong_rate, "
+        "last_study_date, mastery_level, consecutive_correct) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        statistics_rows()
+    )
+    connection.execute("COMMIT")
+    
+    summary.update(
+        sessions=len(sessions), learning_history=history_total, exams=len(exams),
+        exam_questions=len(questions), wrong_notes=len(wrong_notes) + len(resolved_notes)
+    )
+    
+    # 6. 마이그레이션 (FTS/초성/트라이그램 색인, 복습 컬럼, 일별 집계 등을 기존 데이터로 채움)
+    apply_migrations(connection)
+    connection.execute("ANALYZE")
+    connection.commit()
+    connection.close()
+    
+    summary['seconds'] = round(time.perf_counter() - started, 1)
+    return summary
+
+
+def default_path(profile):
+    """
+    프로필별 기본 DB 경로
+    
+    Args:
+        profile (str): PROFILES 키
+    
+    Returns:
+        str: benchmarks/data/<profile>.db
+    """
+    return os.path.join(DATA_DIR, f"{profile}.db")
+
+
+def main(argv=None):
+    """
+    명령줄 실행
+    
+    Args:
+        argv (list, optional): 명령줄 인자
+    
+    Returns:
+        int: 종료 코드
+    """
+    parser = argparse.ArgumentParser(description='벤치마크용 합성 DB 생성')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='10k')
+    parser.add_argument('--output', default=None, help='DB 파일 경로 (기본: benchmarks/data/<profile>.db)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--end-date', type=date.fromisoformat, default=None, help='마지막 학습일 YYYY-MM-DD (기본: 오늘)')
+    parser.add_argument('--neighbors', action='store_true', help='유사 단어 색인도 계산 (큰 프로필은 오래 걸림)')
+    args = parser.parse_args(argv)
+    
+    path = args.output or default_path(args.profile)
+    summary = generate_database(path, args.profile, args.seed, args.end_date)
+    
+    if args.neighbors:
+        from models.word_model import WordModel
+        use_database(path)
+        summary['word_neighbors'] = WordModel().rebuild_neighbor_index()
+        close_database()
+    
+    print(f"생성 완료: {path}")
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+# 2026-10-17 - 스마트 단어장 - 벤치마크 실행기
+# 파일 위치: C:\dev\word\benchmarks\run_benchmarks.py - v1.0
+
+"""
+벤치마크 실행 및 결과(JSON) 저장/비교
+- 생성된 DB(data_generator)를 임시 파일로 복사한 뒤 실행 (원본은 그대로, 매번 같은 출발점)
+- 시나리오마다 준비 실행(warmup) 후 repeat회 측정 → min/median/mean/p95/max (밀리초)
+- --compare: 이전 결과 JSON과 median 비교
+- --trace: 실행 구간(Controller/Model/DB)을 Chrome 트레이스 JSON으로 저장 (utils.tracing)
+- 결과 JSON에 실행 중 누적 시간이 큰 SQL 상위 QUERY_REPORT_LIMIT개 포함 (database.query_stats)
+
+사용 예:
+    python benchmarks/data_generator.py --profile 10k
+    python benchmarks/run_benchmarks.py --profile 10k --output before.json
+    python benchmarks/run_benchmarks.py --profile 10k --compare before.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+from benchmarks.data_generator import PROFILES, close_database, default_path, generate_database, use_database
+from benchmarks.scenarios import SCENARIOS, Timer, build_context
+from database.query_stats import get_query_stats
+from utils.tracing import start_tracing, stop_tracing
+
+RESULTS_DIR = os.path.join(current_dir, 'results')
+QUERY_REPORT_LIMIT = 20  # 결과에 남길 SQL 수
+
+
+def _git_commit():
+    """
+    현재 git 커밋 (없으면 None)
+    
+    Returns:
+        str: 커밋 해시
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _summarize(samples):
+    """
+    측정값 요약 (밀리초)
+    
+    Args:
+        samples (list): 측정값 (초)
+    
+    Returns:
+        dict: runs, min, median, mean, p95, max
+    """
+    values = sorted(sample * 1000 for sample in samples)
+    p95_index = min(len(values) - 1, int(round(0.95 * (len(values) - 1))))
+    return {
+        'runs': len(values),
+        'min_ms': round(values[0], 3),
+        'median_ms': round(statistics.median(values), 3),
+        'mean_ms': round(statistics.fmean(values), 3),
+        'p95_ms': round(values[p95_index], 3),
+        'max_ms': round(values[-1], 3),
+    }
+
+
+def run_benchmarks(db_path, scenario_names=None, repeat=10, warmup=1, seed=42):
+    """
+    시나리오 실행
+    
+    Args:
+        db_path (str): 생성된 벤치마크 DB (복사본에서 실행)
+        scenario_names (list, optional): 실행할 시나리오 (기본: 전체)
+        repeat (int): 측정 횟수
+        warmup (int): 측정 전 준비 실행 횟수
+        seed (int): 검색어 선택 시드
+    
+    Returns:
+        dict: {시나리오 이름: 요약}
+    """
+    results = {}
+    original_path = config.DATABASE_PATH
+    
+    with tempfile.TemporaryDirectory(prefix='word_bench_') as work_dir:
+        work_db = os.path.join(work_dir, 'bench.db')
+        shutil.copyfile(db_path, work_db)
+        use_database(work_db)
+        
+        try:
+            context = build_context(work_dir, seed)
+            get_query_stats().reset()
+            for name in scenario_names or SCENARIOS:
+                scenario, description = SCENARIOS[name]
+                for _ in range(warmup):
+                    scenario(context, Timer())
+                
+                timer = Timer()
+                for _ in range(repeat):
+                    scenario(context, timer)
+                
+                results[name] = dict(_summarize(timer.samples), description=description)
+                print(f"  {name:<28} median {results[name]['median_ms']:>10.3f} ms  p95 {results[name]['p95_ms']:>10.3f} ms")
+        finally:
+            close_database()
+            config.DATABASE_PATH = original_path
+    
+    return results
+
+
+def compare_results(baseline, current):
+    """
+    두 결과의 median 비교 출력
+    
+    Args:
+        baseline (dict): 이전 결과 JSON
+        current (dict): 이번 결과 JSON
+    """
+    print(f"\n비교 기준: {baseline.get('commit')} ({baseline.get('timestamp')})")
+    for name, result in current['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name)
+        if not before:
+            print(f"  {name:<28} (기준 없음)")
+            continue
+        ratio = result['median_ms'] / before['median_ms'] if before['median_ms'] else float('inf')
+        print(f"  {name:<28} {before['median_ms']:>10.3f} → {result['median_ms']:>10.3f} ms  (x{ratio:.2f})")
+
+
+def main(argv=None):
+    """
+    명령줄 실행
+    
+    Args:
+        argv (list, optional): 명령줄 인자
+    
+    Returns:
+        int: 종료 코드
+    """
+    parser = argparse.ArgumentParser(description='스마트 단어장 벤치마크')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='10k')
+    parser.add_argument('--db', default=None, help='벤치마크 DB 경로 (기본: benchmarks/data/<profile>.db, 없으면 생성)')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=None)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None, help='결과 JSON 경로 (기본: benchmarks/results/<시각>_<profile>.json)')
+    parser.add_argument('--compare', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--db-profile', choices=sorted(config.DB_PERFORMANCE_PROFILES), default=None,
+                        help='SQLite 성능 프로필 (기본: config.DB_PERFORMANCE_PROFILE)')
+    parser.add_argument('--trace', default=None, help='트레이스 JSON 저장 경로 (chrome://tracing, ui.perfetto.dev)')
+    args = parser.parse_args(argv)
+    
+    if args.db_profile:
+        config.DB_PERFORMANCE_PROFILE = args.db_profile
+    
+    db_path = args.db or default_path(args.profile)
+    if not os.path.exists(db_path):
+        print(f"벤치마크 DB 생성: {db_path}")
+        generate_database(db_path, args.profile, args.seed)
+    
+    # 측정 중 INFO 로그 출력 비용 제외
+    logging.disable(logging.INFO)
+    
+    print(f"벤치마크 실행: {db_path}")
+    if args.trace:
+        start_tracing()
+    scenario_results = run_benchmarks(db_path, args.scenarios, args.repeat, args.warmup, args.seed)
+    if args.trace:
+        print(f"트레이스 구간 {stop_tracing(args.trace)}개 저장: {args.trace}")
+    
+    with sqlite3.connect(db_path) as connection:
+        row_counts = {
+            table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ('words', 'learning_history', 'learning_sessions', 'exam_history', 'wrong_note')
+        }
+    
+    timestamp = datetime.now()
+    result = {
+        'timestamp': timestamp.strftime(config.ISO8601_FORMAT),
+        'commit': _git_commit(),
+        'profile': args.profile,
+        'database': os.path.abspath(db_path),
+        'row_counts': row_counts,
+        'repeat': args.repeat,
+        'warmup': args.warmup,
+        'seed': args.seed,
+        'environment': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'db_pool_enabled': config.DB_POOL_ENABLED,
+            'db_performance_profile': config.DB_PERFORMANCE_PROFILE,
+        },
+        'scenarios': scenario_results,
+        'top_queries': get_query_stats().snapshot(limit=QUERY_REPORT_LIMIT),
+    }
+    
+    output = args.output or os.path.join(RESULTS_DIR, f"{timestamp:%Y%m%d_%H%M%S}_{args.profile}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), result)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+# 2026-10-17 - 스마트 단어장 - 벤치마크 시나리오
+# 파일 위치: C:\dev\word\benchmarks\scenarios.py - v1.0
+
+"""
+벤치마크 시나리오 (핫 패스별 시간 측정)
+- 시나리오 함수: scenario(context, timer)
+  측정할 구간만 `with timer:`로 감쌈 (준비/정리 작업은 측정에서 제외)
+- SCENARIOS: {이름: (함수, 설명)}
+"""
+
+import csv
+import os
+import random
+import sys
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+from controllers.exam_controller import ExamController
+from controllers.flashcard_controller import FlashcardController
+from controllers.statistics_controller import StatisticsController
+from controllers.word_controller import WordController
+from models.statistics_model import StatisticsModel
+from models.word_model import WordModel
+from utils.korean_helper import to_choseong
+
+IMPORT_ROWS = 5000  # CSV 임포트 시나리오 행 수
+SESSION_WORDS = 50  # 학습 세션 시나리오 단어 수
+EXAM_QUESTIONS = 20  # 시험 시나리오 문항 수
+
+
+class Timer:
+    """
+    구간 측정기 (with 블록 한 번 = 측정값 하나)
+    """
+    
+    def __init__(self):
+        self.samples = []
+        self._started = None
+    
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.samples.append(time.perf_counter() - self._started)
+        return False
+
+
+def build_context(work_dir, seed=42, sample_size=200):
+    """
+    시나리오 공통 입력 (검색어 등) 준비
+    
+    Args:
+        work_dir (str): 임시 파일(CSV) 디렉토리
+        seed (int): 검색어 선택 시드
+        sample_size (int): 검색어로 쓸 단어 수
+    
+    Returns:
+        dict: 시나리오 컨텍스트
+    """
+    rng = random.Random(seed)
+    word_model = WordModel()
+    words = word_model.sample_random_words(sample_size)
+    rng.shuffle(words)
+    
+    return {
+        'rng': rng,
+        'work_dir': work_dir,
+        'words': words,
+        'iteration': 0,
+    }
+
+
+def _next_word(context):
+    """
+    다음 검색어 단어 (순환) (내부 함수)
+    
+    Args:
+        context (dict): 시나리오 컨텍스트
+    
+    Returns:
+        dict: 단어 (english, korean 포함)
+    """
+    context['iteration'] += 1
+    return context['words'][context['iteration'] % len(context['words'])]
+
+
+def _misspell(rng, text):
+    """
+    글자 하나를 바꾼 오타 만들기 (내부 함수)
+    
+    Args:
+        rng (random.Random): 난수 생성기
+        text (str): 원본 단어
+    
+    Returns:
+        str: 오타 단어
+    """
+    if len(text) < 2:
+        return text + 'e'
+    position = rng.randrange(len(text))
+    return text[:position] + rng.choice('aeiou') + text[position + 1:]
+
+
+# === 검색 ===
+
+def search_english_prefix(context, timer):
+    """영어 접두어 검색 (FTS)"""
+    keyword = _next_word(context)['english'][:4]
+    with timer:
+        WordModel().search_words(keyword, 'english', limit=50)
+
+
+def search_korean(context, timer):
+    """한국어 뜻 검색"""
+    keyword = _next_word(context)['korean'].split(',')[0][:2]
+    with timer:
+        WordModel().search_words(keyword, 'korean', limit=50)
+
+
+def search_choseong(context, timer):
+    """초성 검색"""
+    keyword = to_choseong(_next_word(context)['korean'])[:2]
+    with timer:
+        WordModel().search_words_by_choseong(keyword, limit=50)
+
+
+def search_fuzzy(context, timer):
+    """오타 허용 검색"""
+    keyword = _misspell(context['rng'], _next_word(context)['english'])
+    with timer:
+        WordModel().search_words_fuzzy(keyword, limit=10)
+
+
+# === CSV ===
+
+def csv_export(context, timer):
+    """전체 단어 CSV 엑스포트"""
+    file_path = os.path.join(context['work_dir'], 'export.csv')
+    with timer:
+        WordController().export_to_csv(file_path)
+    os.remove(file_path)
+
+
+def csv_import(context, timer):
+    """새 단어 CSV 임포트 (IMPORT_ROWS행)"""
+    context['iteration'] += 1
+    file_path = os.path.join(context['work_dir'], 'import.csv')
+    with open(file_path, 'w', newline='', encoding=config.CSV_ENCODING) as f:
+        writer = csv.writer(f)
+        writer.writerow(['english', 'korean', 'memo'])
+        for i in range(IMPORT_ROWS):
+            writer.writerow([f"benchimport{context['iteration']}x{i}", f"벤치 임포트 {i}", ''])
+    
+    with timer:
+        WordController().import_from_csv(file_path)
+    os.remove(file_path)
+
+
+# === 학습 / 시험 ===
+
+def session_start_personalized(context, timer):
+    """개인화 학습 세션 시작"""
+    controller = FlashcardController()
+    with timer:
+        controller.start_session('flashcard_en_ko', 'personalized', word_count=SESSION_WORDS)
+    controller.end_session()
+
+
+def session_start_due(context, timer):
+    """복습 대상(due) 학습 세션 시작"""
+    controller = FlashcardController()
+    with timer:
+        controller.start_session('flashcard_en_ko', 'due', word_count=SESSION_WORDS)
+    controller.end_session()
+
+
+def _answer_exam(controller, rng):
+    """
+    시험 문항에 답안 입력 (절반 정도 정답) (내부 함수)
+    
+    Args:
+        controller (ExamController): 시험 진행 중인 컨트롤러
+        rng (random.Random): 난수 생성기
+    """
+    for question in controller.exam_questions:
+        answer = question['correct_answer'] if rng.random() < 0.5 else 'wrong'
+        controller.submit_answer(answer)
+
+
+def exam_create(context, timer):
+    """객관식 시험 생성 (개인화 출제)"""
+    controller = ExamController()
+    with timer:
+        controller.create_exam('multiple_choice', 'en_to_ko', EXAM_QUESTIONS, 'personalized')
+    _answer_exam(controller, context['rng'])
+    controller.finish_exam()
+
+
+def exam_finish(context, timer):
+    """시험 채점/종료 (통계, 오답 노트 반영 포함)"""
+    controller = ExamController()
+    controller.create_exam('short_answer', 'en_to_ko', EXAM_QUESTIONS, 'random')
+    _answer_exam(controller, context['rng'])
+    with timer:
+        controller.finish_exam()
+
+
+# === 통계 ===
+
+def dashboard(context, timer):
+    """통계 대시보드 한 화면 (오늘/주간/추이/숙지도/목표/오답 Top)"""
+    controller = StatisticsController()
+    with timer:
+        controller.get_today_summary()
+        controller.get_weekly_summary()
+        controller.get_learning_trend(30)
+        controller.get_mastery_distribution()
+        controller.calculate_goal_achievement()
+        controller.get_top_wrong_words(20)
+
+
+def streaks(context, timer):
+    """연속 학습일 요약"""
+    with timer:
+        StatisticsModel().get_streak_summary()
+
+
+# 시나리오 이름: (함수, 설명)
+SCENARIOS = {
+    'search_english_prefix': (search_english_prefix, '영어 접두어 검색'),
+    'search_korean': (search_korean, '한국어 뜻 검색'),
+    'search_choseong': (search_choseong, '초성 검색'),
+    'search_fuzzy': (search_fuzzy, '오타 허용 검색'),
+    'csv_export': (csv_export, '전체 CSV 엑스포트'),
+    'csv_import': (csv_import, f'CSV 임포트 {IMPORT_ROWS}행'),
+    'session_start_personalized': (session_start_personalized, '개인화 학습 세션 시작'),
+    'session_start_due': (session_start_due, '복습 대상 학습 세션 시작'),
+    'exam_create': (exam_create, '시험 생성'),
+    'exam_finish': (exam_finish, '시험 채점/종료'),
+    'dashboard': (dashboard, '통계 대시보드'),
+    'streaks': (streaks, '연속 학습일 요약'),
+}
@@ -42,6 +42,16 @@ LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 LOG_MAX_BYTES = 10 * 1024 * 1024  # 10MB
 LOG_BACKUP_COUNT = 5  # 백업 파일 개수
+LOG_QUEUE_ENABLED = True  # 큐 로깅 (파일/콘솔 출력은 별도 스레드에서)
+# 로거별 속도 제한 {로거 이름: (구간당 최대 건수, 구간 초)} - INFO 이하만 제한, 초과분은 다음 구간에 생략 건수로 기록
+LOG_RATE_LIMITS = {
+    'WordModel': (20, 1.0),
+    'StatisticsModel': (20, 1.0),
+    'LearningModel': (20, 1.0),
+    'ExamModel': (20, 1.0),
+    'controllers.flashcard_controller': (20, 1.0),
+    'controllers.exam_controller': (20, 1.0),
+}
 
 # ============================================================
 # 데이터베이스 설정
@@ -50,6 +60,82 @@ DB_TIMEOUT = 30.0  # 초
 DB_CHECK_SAME_THREAD = False  # 멀티스레드 지원
 DB_ISOLATION_LEVEL = None  # 자동 커밋 비활성화 (수동 관리)
 
+# 연결 풀 (쓰기 연결 1개 + 읽기 연결 N개, WAL 모드)
+DB_POOL_ENABLED = False  # True면 읽기 쿼리를 읽기 전용 연결 풀로 분산
+DB_POOL_READERS = 4  # 읽기 전용 연결 수
+DB_BUSY_TIMEOUT_MS = 5000  # PRAGMA busy_timeout (밀리초)
+DB_BUSY_RETRIES = 3  # SQLITE_BUSY 발생 시 재시도 횟수
+DB_BUSY_BACKOFF = 0.05  # 재시도 대기 시간 (초, 재시도마다 2배)
+
+# 성능 프로필 (연결마다 적용하는 PRAGMA) - 배포 환경별로 내구성과 속도를 명시적으로 선택
+# durable: 롤백 저널 + synchronous FULL (전원 차단에도 커밋 보존, 가장 느림)
+# balanced: WAL + synchronous NORMAL (전원 차단 시 마지막 커밋 일부 유실 가능, DB 손상 없음)
+# throughput: WAL + synchronous OFF (OS 충돌/전원 차단 시 DB 손상 가능 - 벤치마크/일괄 작업용)
+# 연결 풀 모드(DB_POOL_ENABLED)는 프로필과 관계없이 WAL 사용
+# 기본값은 기존 동작(durable), 배포 환경마다 balanced/throughput을 직접 선택
+DB_PERFORMANCE_PROFILE = 'durable'
+DB_PERFORMANCE_PROFILES = {
+    'durable': {
+        'journal_mode': 'delete',
+        'synchronous': 'full',
+        'cache_size': -2000,  # 음수 = KiB (약 2MB, SQLite 기본값)
+        'mmap_size': 0,
+        'temp_store': 'default',
+        'wal_autocheckpoint': 1000,  # 페이지
+    },
+    'balanced': {
+        'journal_mode': 'wal',
+        'synchronous': 'normal',
+        'cache_size': -16000,
+        'mmap_size': 64 * 1024 * 1024,
+        'temp_store': 'memory',
+        'wal_autocheckpoint': 1000,
+    },
+    'throughput': {
+        'journal_mode': 'wal',
+        'synchronous': 'off',
+        'cache_size': -64000,
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'memory',
+        'wal_autocheckpoint': 10000,
+    },
+}
+DB_PRAGMA_OVERRIDES = {}  # 프로필 값 개별 변경 (예: {'cache_size': -32000})
+DB_OPTIMIZE_ON_CLOSE = True  # 연결 종료 시 PRAGMA optimize (필요한 통계만 갱신)
+
+# 스트리밍 조회 (iter_query)
+DB_FETCH_BATCH_SIZE = 1000  # fetchmany 한 번에 가져올 행 수
+
+# 쿼리 계측 (정규화된 SQL별 호출 수/시간/행 수 집계)
+DB_QUERY_STATS_ENABLED = True
+DB_QUERY_HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)  # 지연 시간 히스토그램 구간 상한 (밀리초)
+DB_SLOW_QUERY_MS = 200  # 이 시간 이상 걸린 쿼리는 느린 쿼리 로그에 기록 (밀리초)
+DB_SLOW_QUERY_EXPLAIN = False  # 느린 쿼리의 EXPLAIN QUERY PLAN 기록 (SQL별 최초 1회)
+DB_SLOW_QUERY_LOG_FILE = os.path.join(LOG_DIR, 'slow_query.log')
+DB_QUERY_STATS_DUMP_ON_EXIT = False  # 프로그램 종료 시 집계 리포트 저장
+DB_QUERY_STATS_DUMP_FILE = os.path.join(LOG_DIR, 'query_stats.json')
+
+# 단어 검색 (FTS5 전문 검색 인덱스, 미지원 시 LIKE 검색)
+SEARCH_USE_FTS = True
+SEARCH_HIGHLIGHT_OPEN = '<b>'  # 검색 결과 snippet 강조 시작
+SEARCH_HIGHLIGHT_CLOSE = '</b>'  # 검색 결과 snippet 강조 끝
+
+# 오타 허용(유사) 검색 (트라이그램 색인 + 편집 거리)
+FUZZY_MAX_DISTANCE = 2  # 허용 편집 거리 상한 (짧은 단어는 자동으로 축소)
+FUZZY_CANDIDATE_FACTOR = 5  # 편집 거리 계산 후보 수 = 결과 수 × 배수
+
+# 유사 단어(이웃) 색인 - 객관식 오답 선택지
+NEIGHBOR_COUNT = 10  # 단어당 저장할 이웃 수
+NEIGHBOR_SIMILARITY_WEIGHTS = {
+    'english': 0.6,  # 영어 트라이그램 유사도
+    'korean': 0.3,   # 한국어 뜻 공통 음절
+    'length': 0.1    # 영어 길이 비율
+}
+NEIGHBOR_CANDIDATE_LIMIT = 30  # 단어당 유사도를 계산할 후보 수
+NEIGHBOR_MAX_POSTING = 500  # 일괄 계산 시 이보다 많은 단어가 공유하는 트라이그램/음절은 후보 검색에서 제외
+NEIGHBOR_PARALLEL_MIN_WORDS = 5000  # 이 이상이면 일괄 계산에 프로세스 풀 사용
+NEIGHBOR_INCREMENTAL_MAX_WORDS = 200  # 대량 추가 시 이보다 많으면 증분 대신 전체 재계산
+
 # ============================================================
 # 학습 설정 (기본값)
 # ============================================================
@@ -100,6 +186,12 @@ MASTERY_LEVELS = {
 MASTERY_LEVEL_UP_CONSECUTIVE = 3  # 연속 정답 N회 시 레벨 상승
 MASTERY_LEVEL_DOWN_CONSECUTIVE = 2  # 연속 오답 N회 시 레벨 하락
 
+# 간격 반복 복습 스케줄러 (word_statistics.next_review_date 갱신)
+REVIEW_SCHEDULER = 'sm2'  # 'sm2' | 'fsrs'
+REVIEW_MAX_INTERVAL = 365  # 최대 복습 간격 (일)
+SM2_INITIAL_EASE = 2.5  # SM-2 초기 난이도 계수
+FSRS_REQUEST_RETENTION = 0.9  # FSRS 목표 기억 유지율
+
 # ============================================================
 # 오답 노트 설정
 # ============================================================
@@ -113,6 +205,8 @@ CSV_ENCODING = 'utf-8-sig'  # UTF-8 with BOM (엑셀 호환)
 CSV_DELIMITER = ','
 CSV_REQUIRED_COLUMNS = ['english', 'korean']  # 필수 컬럼
 CSV_OPTIONAL_COLUMNS = ['memo']  # 선택 컬럼
+CSV_CHUNK_SIZE = 5000  # 스트리밍 읽기/임포트 청크 크기 (행)
+CSV_COUNT_BLOCK_SIZE = 1024 * 1024  # 행 수 계산 시 한 번에 스캔할 바이트
 
 # ============================================================
 # 시험 설정
@@ -120,6 +214,7 @@ CSV_OPTIONAL_COLUMNS = ['memo']  # 선택 컬럼
 # 객관식
 MULTIPLE_CHOICE_OPTIONS = 4  # 4지선다
 MIN_WORDS_FOR_MULTIPLE_CHOICE = 4  # 객관식 최소 단어 수
+EXAM_DISTRACTOR_POOL_SIZE = 200  # 시험당 한 번 추출하는 오답 선택지 후보 단어 수
 
 # 문항 수 범위
 MIN_EXAM_QUESTIONS = 5
@@ -160,12 +255,25 @@ TOP_WRONG_WORDS_LIMIT = 20  # 오답률 높은 단어
 DEBUG_MODE = False  # 개발 시 True로 변경
 SHOW_SQL_QUERIES = False  # SQL 쿼리 로그 출력
 
+# 트레이싱 (Controller/Model/DB 구간, Chrome/Perfetto 트레이스 JSON)
+TRACING_ENABLED = False  # True면 시작부터 기록, 종료 시 TRACE_FILE로 저장
+TRACE_FILE = os.path.join(LOG_DIR, 'traces', 'trace.json')
+TRACE_MAX_EVENTS = 200000  # 초과분은 버림 (메모리 상한)
+
 # ============================================================
 # 기타 설정
 # ============================================================
 # 자동 저장
 AUTO_SAVE_INTERVAL = 300  # 초 (5분)
 
-# 백업
+# 백업 (database/backup_service.py, SQLite 백업 API로 실행 중 복사)
 AUTO_BACKUP_ENABLED = True
-BACKUP_INTERVAL_DAYS = 7  # 일
\ No newline at end of file
+BACKUP_INTERVAL_DAYS = 7  # 일
+BACKUP_DIR = None  # None이면 DB 파일 옆 backups 디렉토리
+BACKUP_KEEP_COUNT = 5  # 보관 개수 (초과분 삭제)
+BACKUP_COMPRESS = True  # 최신 1개를 제외한 백업은 gzip 압축
+BACKUP_PAGES_PER_STEP = 256  # 백업 한 단계에 복사할 페이지 수 (단계 사이에는 잠금 없음)
+BACKUP_STEP_SLEEP = 0.005  # 단계 사이 대기 (초, 디스크 I/O 양보)
+BACKUP_MAX_RESTARTS = 3  # 복사 중 DB 변경으로 처음부터 다시 시작한 횟수 상한 (초과 시 WAL 스냅샷 복사 또는 다음 주기로 연기)
+BACKUP_CHECK_INTERVAL = 3600  # 백그라운드 스레드 확인 주기 (초)
+BACKUP_INITIAL_DELAY = 60  # 시작 후 첫 확인까지 대기 (초, 시작 속도 영향 없도록)
\ No newline at end of file
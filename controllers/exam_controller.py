@@ -14,6 +14,7 @@
 import sys
 import os
 import random
+import itertools
 from datetime import datetime
 
 # 프로젝트 루트를 sys.path에 추가
@@ -26,12 +27,14 @@ from models.word_model import WordModel
 from models.exam_model import ExamModel
 from models.statistics_model import StatisticsModel
 from utils.logger import get_logger
+from utils.tracing import trace_methods
 from utils.datetime_helper import get_current_datetime
 import config
 
 logger = get_logger(__name__)
 
 
+@trace_methods('controller')
 class ExamController:
     """시험 컨트롤러"""
     
@@ -84,93 +87,96 @@ class ExamController:
             if total_questions <= 0:
                 return (False, "문항 수는 1개 이상이어야 합니다.", None)
             
-            # 3. 단어 선택
-            all_words = self.word_model.get_all_words()
+            # 3. 단어 수 확인
+            word_total = self.word_model.get_word_count()
             
-            if not all_words:
+            if word_total == 0:
                 return (False, "시험 출제할 단어가 없습니다.", None)
             
-            if len(all_words) < total_questions:
+            if word_total < total_questions:
                 return (
                     False, 
-                    f"단어가 부족합니다. (필요: {total_questions}개, 보유: {len(all_words)}개)",
+                    f"단어가 부족합니다. (필요: {total_questions}개, 보유: {word_total}개)",
                     None
                 )
             
             # 4. 단어 정렬/선택
             if word_order == 'personalized':
-                # 개인화 점수 기반 정렬
-                words_with_score = []
-                for word in all_words:
-                    score = self.statistics_model.calculate_personalization_score(
-                        word['word_id']
-                    )
-                    words_with_score.append((word, score))
-                
-                words_with_score.sort(key=lambda x: x[1], reverse=True)
-                selected_words = [w[0] for w in words_with_score[:total_questions]]
+                # 개인화 점수 상위 N개 (SQL에서 점수 계산/정렬)
+                selected_words = self.statistics_model.get_personalized_words(limit=total_questions)
             else:  # random
-                selected_words = random.sample(all_words, total_questions)
-            
-            # 5. 시험 생성 (DB)
-            exam_id = self.exam_model.create_exam(
-                exam_type=exam_type,
-                question_mode=question_mode,
-                total_questions=total_questions,
-                time_limit=time_limit
-            )
-            
-            if not exam_id:
-                return (False, "시험 생성에 실패했습니다.", None)
-            
-            # 6. 문제 목록 생성
-            self.exam_questions = []
-            
-            for idx, word in enumerate(selected_words, 1):
-                # mixed 모드면 문제별로 랜덤 결정
-                if question_mode == 'mixed':
-                    current_mode = random.choice(['en_to_ko', 'ko_to_en'])
-                else:
-                    current_mode = question_mode
+                selected_words = self.word_model.sample_random_words(total_questions)
+            
+            # 객관식 오답 선택지 후보 (시험당 한 번만 조회)
+            # - 문항별 유사 단어(word_neighbors) 우선, 부족하면 무작위 후보 풀
+            distractor_pool = []
+            neighbor_map = {}
+            if exam_type == 'multiple_choice':
+                distractor_pool = self.word_model.sample_random_words(config.EXAM_DISTRACTOR_POOL_SIZE)
+                neighbor_map = self.word_model.get_neighbor_words(w['word_id'] for w in selected_words)
+            
+            # 5~7. 시험 및 문제 저장 (하나의 트랜잭션으로 커밋)
+            with self.exam_model.unit_of_work():
+                # 5. 시험 생성 (DB)
+                exam_id = self.exam_model.create_exam(
+                    exam_type=exam_type,
+                    question_mode=question_mode,
+                    total_questions=total_questions,
+                    time_limit=time_limit
+                )
                 
-                # 문제/정답 결정
-                if current_mode == 'en_to_ko':
-                    question_text = word['english']
-                    correct_answer = word['korean']
-                else:  # ko_to_en
-                    question_text = word['korean']
-                    correct_answer = word['english']
+                if not exam_id:
+                    return (False, "시험 생성에 실패했습니다.", None)
                 
-                # 객관식이면 선택지 생성
-                choices = None
-                if exam_type == 'multiple_choice':
-                    choices = self._generate_choices(
-                        word['word_id'],
-                        correct_answer,
-                        current_mode
-                    )
+                # 6. 문제 목록 생성
+                self.exam_questions = []
                 
-                # 문제 저장
-                question_id = self.exam_model.save_exam_question(
-                    exam_id=exam_id,
-                    word_id=word['word_id'],
-                    question_number=idx,
-                    correct_answer=correct_answer,
-                    choices=choices
-                )
+                for idx, word in enumerate(selected_words, 1):
+                    # mixed 모드면 문제별로 랜덤 결정
+                    if question_mode == 'mixed':
+                        current_mode = random.choice(['en_to_ko', 'ko_to_en'])
+                    else:
+                        current_mode = question_mode
+                    
+                    # 문제/정답 결정
+                    if current_mode == 'en_to_ko':
+                        question_text = word['english']
+                        correct_answer = word['korean']
+                    else:  # ko_to_en
+                        question_text = word['korean']
+                        correct_answer = word['english']
+                    
+                    # 객관식이면 선택지 생성
+                    choices = None
+                    if exam_type == 'multiple_choice':
+                        choices = self._generate_choices(
+                            word['word_id'],
+                            correct_answer,
+                            current_mode,
+                            distractor_pool,
+                            neighbor_map.get(word['word_id'], [])
+                        )
+                    
+                    # 문제 정보 저장 (question_id는 일괄 저장 후 채움)
+                    self.exam_questions.append({
+                        'question_id': None,
+                        'question_number': idx,
+                        'word_id': word['word_id'],
+                        'question_text': question_text,
+                        'correct_answer': correct_answer,
+                        'choices': choices,
+                        'user_answer': None
+                    })
+                
+                # 7. 문제 일괄 저장 (executemany 한 번)
+                question_ids = self.exam_model.save_exam_questions(exam_id, self.exam_questions)
+                if len(question_ids) != len(self.exam_questions):
+                    raise RuntimeError(f"문제 저장 실패: exam_id={exam_id}")
                 
-                # 문제 정보 저장
-                self.exam_questions.append({
-                    'question_id': question_id,
-                    'question_number': idx,
-                    'word_id': word['word_id'],
-                    'question_text': question_text,
-                    'correct_answer': correct_answer,
-                    'choices': choices,
-                    'user_answer': None
-                })
-            
-            # 7. 상태 초기화
+                for question in self.exam_questions:
+                    question['question_id'] = question_ids[question['question_number']]
+            
+            # 8. 상태 초기화
             self.current_exam_id = exam_id
             self.exam_type = exam_type
             self.question_mode = question_mode
@@ -188,39 +194,52 @@ class ExamController:
             self.logger.error(f"시험 생성 실패: {e}", exc_info=True)
             return (False, "시험 생성 중 오류가 발생했습니다.", None)
     
-    def _generate_choices(self, word_id, correct_answer, mode):
+    def _generate_choices(self, word_id, correct_answer, mode, distractor_pool, neighbors=None):
         """
         객관식 선택지 생성 (4지선다)
+        오답은 시험 생성 시 한 번 조회한 후보에서 선택 (문항마다 DB 조회 없음)
+        - 유사 단어(이웃)를 먼저 무작위 순서로 사용, 부족하면 무작위 후보 풀에서 보충
+        - 정답 단어 자신, 정답과 같은 뜻, 이미 고른 오답과 같은 뜻은 제외
         
         Args:
             word_id (int): 정답 단어 ID
             correct_answer (str): 정답
             mode (str): 'en_to_ko' or 'ko_to_en'
+            distractor_pool (list): 오답 후보 단어 리스트 (sample_random_words 결과)
+            neighbors (list, optional): 정답 단어의 유사 단어 리스트 (get_neighbor_words 결과)
         
         Returns:
             List[str]: [선택지1, 선택지2, 선택지3, 선택지4] (정답 포함, 셔플됨)
         """
         try:
-            # 오답 선택지로 사용할 단어들 가져오기
-            all_words = self.word_model.get_all_words()
+            answer_key = 'korean' if mode == 'en_to_ko' else 'english'
+            wrong_count = config.MULTIPLE_CHOICE_OPTIONS - 1
             
-            # 현재 단어 제외
-            other_words = [w for w in all_words if w['word_id'] != word_id]
+            # 비교는 채점과 같은 기준 (대소문자 무시, 공백 제거)
+            used = {str(correct_answer).strip().lower()}
+            wrong_choices = []
             
-            if len(other_words) < 3:
-                # 단어가 부족하면 정답만 반환
-                return [correct_answer]
+            neighbors = neighbors or []
+            candidates = itertools.chain(
+                random.sample(neighbors, len(neighbors)),
+                random.sample(distractor_pool, len(distractor_pool))
+            )
             
-            # 오답 3개 랜덤 선택
-            wrong_words = random.sample(other_words, 3)
+            for word in candidates:
+                choice = word[answer_key]
+                key = str(choice).strip().lower()
+                
+                if word['word_id'] == word_id or key in used:
+                    continue
+                
+                used.add(key)
+                wrong_choices.append(choice)
+                if len(wrong_choices) == wrong_count:
+                    break
             
-            # 오답 선택지 생성
-            wrong_choices = []
-            for word in wrong_words:
-                if mode == 'en_to_ko':
-                    wrong_choices.append(word['korean'])
-                else:  # ko_to_en
-                    wrong_choices.append(word['english'])
+            if len(wrong_choices) < wrong_count:
+                # 서로 다른 오답이 부족하면 정답만 반환
+                return [correct_answer]
             
             # 정답 + 오답 합치고 셔플
             choices = [correct_answer] + wrong_choices
@@ -311,7 +330,7 @@ class ExamController:
             self.current_question_index += 1
             
             self.logger.debug(
-                f"답안 제출: 문제 {question['question_number']} - {user_answer}"
+                "답안 제출: 문제 %s - %s", question['question_number'], user_answer
             )
             
             return (True, "답안이 제출되었습니다.")
@@ -367,61 +386,61 @@ class ExamController:
             if not self.current_exam_id:
                 return (False, "진행 중인 시험이 없습니다.", None)
             
-            # 1. 채점
-            correct_count = 0
-            wrong_count = 0
-            
-            for question in self.exam_questions:
-                user_answer = question.get('user_answer', '')
-                correct_answer = question['correct_answer']
+            # 1~4. 채점, 통계 반영, 시험 종료 처리 (하나의 트랜잭션으로 커밋)
+            with self.exam_model.unit_of_work():
+                # 1. 채점
+                correct_count = 0
+                wrong_count = 0
+                answers = []  # (question_id, user_answer, is_correct) - 답안 일괄 반영용
+                graded = []  # (word_id, is_correct) - 통계 일괄 반영용
                 
-                # 정답 확인 (대소문자 무시, 공백 제거)
-                if user_answer and str(user_answer).strip().lower() == str(correct_answer).strip().lower():
-                    is_correct = True
-                    correct_count += 1
-                else:
-                    is_correct = False
-                    wrong_count += 1
+                for question in self.exam_questions:
+                    user_answer = question.get('user_answer', '')
+                    correct_answer = question['correct_answer']
+                    
+                    # 정답 확인 (대소문자 무시, 공백 제거)
+                    if user_answer and str(user_answer).strip().lower() == str(correct_answer).strip().lower():
+                        is_correct = True
+                        correct_count += 1
+                    else:
+                        is_correct = False
+                        wrong_count += 1
+                    
+                    answers.append((question['question_id'], user_answer, is_correct))
+                    graded.append((question['word_id'], is_correct))
                 
-                # DB 업데이트
-                self.exam_model.update_exam_question(
-                    question_id=question['question_id'],
-                    user_answer=user_answer,
-                    is_correct=is_correct
+                # 답안 + 오답 노트 일괄 반영
+                if not self.exam_model.grade_exam(self.current_exam_id, answers):
+                    raise RuntimeError(f"채점 반영 실패: exam_id={self.current_exam_id}")
+                
+                # 통계 업데이트 (문항 전체를 UPSERT 한 번에, 실패 시 0 → 시험 전체 롤백)
+                if self.statistics_model.update_word_statistics_batch(graded) != len(graded):
+                    raise RuntimeError(f"통계 반영 실패: exam_id={self.current_exam_id}")
+                
+                # 연속 정답 기준을 넘은 단어의 오답 노트 자동 해결
+                self.exam_model.resolve_wrong_notes(
+                    word_id for word_id, is_correct in graded if is_correct
                 )
                 
-                # 통계 업데이트
-                self.statistics_model.update_word_statistics(
-                    question['word_id'],
-                    is_correct
+                # 2. 점수 계산
+                total_questions = len(self.exam_questions)
+                score = round((correct_count / total_questions * 100) if total_questions > 0 else 0.0, 1)
+                
+                # 3. 소요 시간 계산
+                if self.exam_start_time:
+                    time_taken = int((datetime.now() - self.exam_start_time).total_seconds())
+                else:
+                    time_taken = 0
+                
+                # 4. 시험 종료 처리 (DB)
+                success = self.exam_model.finish_exam(
+                    self.current_exam_id,
+                    score,
+                    time_taken
                 )
                 
-                # 오답이면 오답 노트에 추가
-                if not is_correct:
-                    self.exam_model.add_to_wrong_note(
-                        self.current_exam_id,
-                        question['word_id']
-                    )
-            
-            # 2. 점수 계산
-            total_questions = len(self.exam_questions)
-            score = round((correct_count / total_questions * 100) if total_questions > 0 else 0.0, 1)
-            
-            # 3. 소요 시간 계산
-            if self.exam_start_time:
-                time_taken = int((datetime.now() - self.exam_start_time).total_seconds())
-            else:
-                time_taken = 0
-            
-            # 4. 시험 종료 처리 (DB)
-            success = self.exam_model.finish_exam(
-                self.current_exam_id,
-                score,
-                time_taken
-            )
-            
-            if not success:
-                self.logger.warning("시험 종료 처리 실패")
+                if not success:
+                    raise RuntimeError(f"시험 종료 처리 실패: exam_id={self.current_exam_id}")
             
             # 5. 결과 데이터
             result = {
@@ -506,15 +525,23 @@ class ExamController:
     
     # === 오답 노트 ===
     
-    def get_wrong_notes(self):
+    def get_wrong_notes(self, limit=None, offset=0, order_by='recent'):
         """
-        오답 노트 조회
+        오답 노트 조회 (미해결, 페이지 단위)
+        
+        Args:
+            limit (int, optional): 조회 개수 (None이면 전체)
+            offset (int): 건너뛸 개수
+            order_by (str): 'recent' (최근 틀린 순) | 'frequent' (많이 틀린 순)
         
         Returns:
             Tuple[bool, str, List[Dict]]: (성공여부, 메시지, 오답 목록)
         """
         try:
-            wrong_notes = self.exam_model.get_unresolved_wrong_notes()
+            if order_by not in self.exam_model.WRONG_NOTE_ORDERS:
+                return (False, f"지원하지 않는 정렬 기준입니다: {order_by}", [])
+            
+            wrong_notes = self.exam_model.get_unresolved_wrong_notes(limit, offset, order_by)
             
             self.logger.debug(f"오답 노트 조회: {len(wrong_notes)}개")
             return (True, f"{len(wrong_notes)}개 오답 조회 완료", wrong_notes)
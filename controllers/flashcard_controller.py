@@ -25,12 +25,15 @@ if project_root not in sys.path:
 from models.word_model import WordModel
 from models.learning_model import LearningModel
 from models.statistics_model import StatisticsModel
+from models.exam_model import ExamModel
 from utils.logger import get_logger
+from utils.tracing import trace_methods
 from utils.datetime_helper import get_current_datetime
 
 logger = get_logger(__name__)
 
 
+@trace_methods('controller')
 class FlashcardController:
     """플래시카드 학습 컨트롤러"""
     
@@ -39,6 +42,7 @@ class FlashcardController:
         self.word_model = WordModel()
         self.learning_model = LearningModel()
         self.statistics_model = StatisticsModel()
+        self.exam_model = ExamModel()
         self.logger = logger
         
         # 세션 상태 관리
@@ -58,7 +62,7 @@ class FlashcardController:
         
         Args:
             study_mode (str): 'flashcard_en_ko' | 'flashcard_ko_en'
-            word_order (str): 'sequential' | 'random' | 'personalized'
+            word_order (str): 'sequential' | 'random' | 'personalized' | 'due'
             filter_favorite (bool): 즐겨찾기만 학습
             word_count (int, optional): 학습할 단어 수 (None이면 전체)
         
@@ -84,11 +88,22 @@ class FlashcardController:
             if not session_id:
                 return (False, "세션 생성에 실패했습니다.", 0)
             
-            # 4. 단어 목록 가져오기
-            if filter_favorite:
-                words = self.word_model.get_favorite_words()
+            # 4. 단어 목록 가져오기 (개인화는 SQL에서 점수 순 정렬 + 개수 제한)
+            limit = word_count if word_count and word_count > 0 else None
+            
+            if word_order == 'personalized':
+                words = self.statistics_model.get_personalized_words(
+                    limit=limit,
+                    filter_favorite=filter_favorite
+                )
+            elif word_order == 'due':
+                # 복습 예정일이 지난 단어 → 새 단어 순
+                words = self.statistics_model.get_due_words(
+                    limit=limit,
+                    filter_favorite=filter_favorite
+                )
             else:
-                words = self.word_model.get_all_words()
+                words = self.word_model.get_all_words(filter_favorite=filter_favorite)
             
             if not words:
                 self.learning_model.end_session(session_id, 0, 0, 0)
@@ -97,23 +112,11 @@ class FlashcardController:
             # 5. 단어 순서 결정
             if word_order == 'random':
                 random.shuffle(words)
-            elif word_order == 'personalized':
-                # 개인화 점수 기반 정렬
-                words_with_score = []
-                for word in words:
-                    score = self.statistics_model.calculate_personalization_score(
-                        word['word_id']
-                    )
-                    words_with_score.append((word, score))
-                
-                # 점수 높은 순 정렬 (우선순위 높은 단어부터)
-                words_with_score.sort(key=lambda x: x[1], reverse=True)
-                words = [w[0] for w in words_with_score]
-            # sequential은 DB 순서 그대로
+            # sequential은 DB 순서 그대로, personalized는 점수 순, due는 복습 예정일 순
             
             # 6. 단어 수 제한
-            if word_count and word_count > 0:
-                words = words[:word_count]
+            if limit:
+                words = words[:limit]
             
             # 7. 상태 초기화
             self.current_session_id = session_id
@@ -216,21 +219,28 @@ class FlashcardController:
             # 대소문자 무시, 앞뒤 공백 제거하여 비교
             is_correct = user_answer.strip().lower() == correct_answer.strip().lower()
             
-            # 4. 학습 이력 저장
-            success = self.learning_model.add_learning_history(
-                session_id=self.current_session_id,
-                word_id=word_id,
-                study_mode=self.study_mode,
-                is_correct=is_correct,
-                response_time=response_time,
-                user_answer=user_answer
-            )
-            
-            if not success:
-                self.logger.warning(f"학습 이력 저장 실패: word_id={word_id}")
-            
-            # 5. 통계 업데이트
-            self.statistics_model.update_word_statistics(word_id, is_correct)
+            # 4~5. 학습 이력 + 통계 반영 (하나의 트랜잭션으로 커밋)
+            with self.learning_model.unit_of_work():
+                # 4. 학습 이력 저장
+                success = self.learning_model.add_learning_history(
+                    session_id=self.current_session_id,
+                    word_id=word_id,
+                    study_mode=self.study_mode,
+                    is_correct=is_correct,
+                    response_time=response_time,
+                    user_answer=user_answer
+                )
+                
+                if not success:
+                    self.logger.warning(f"학습 이력 저장 실패: word_id={word_id}")
+                
+                # 5. 통계 업데이트 (실패 시 학습 이력까지 롤백)
+                if not self.statistics_model.update_word_statistics(word_id, is_correct):
+                    raise RuntimeError(f"통계 반영 실패: word_id={word_id}")
+                
+                # 연속 정답 기준을 넘으면 오답 노트 자동 해결
+                if is_correct:
+                    self.exam_model.resolve_wrong_notes([word_id])
             
             # 6. 결과 기록
             self.session_results.append((word_id, is_correct, response_time))
@@ -246,8 +256,7 @@ class FlashcardController:
             
             result_text = "정답" if is_correct else "오답"
             self.logger.debug(
-                f"답변 제출: {result_text} - {user_answer} "
-                f"({response_time:.1f}초)"
+                "답변 제출: %s - %s (%.1f초)", result_text, user_answer, response_time
             )
             
             return (True, result_text, result)
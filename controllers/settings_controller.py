@@ -22,11 +22,13 @@ if project_root not in sys.path:
 
 from models.settings_model import SettingsModel
 from utils.logger import get_logger
+from utils.tracing import trace_methods
 from utils.validators import validate_positive_integer, validate_setting_value
 
 logger = get_logger(__name__)
 
 
+@trace_methods('controller')
 class SettingsController:
     """설정 관리 컨트롤러"""
     
@@ -172,6 +174,7 @@ class SettingsController:
     def update_multiple_settings(self, settings_dict):
         """
         여러 설정 한번에 변경
+        모두 검증한 뒤 하나의 트랜잭션으로 저장 (하나라도 유효하지 않으면 변경 없음)
         
         Args:
             settings_dict (Dict): {key: value, ...}
@@ -183,34 +186,20 @@ class SettingsController:
             if not settings_dict or not isinstance(settings_dict, dict):
                 return (False, "유효하지 않은 설정 데이터입니다.", [])
             
-            failed_keys = []
-            success_count = 0
+            # 1. 전체 검증
+            errors = self.settings_model.validate_settings(settings_dict)
+            if errors:
+                for key, error_msg in errors.items():
+                    self.logger.warning(f"설정 검증 실패 ({key}): {error_msg}")
+                return (False, f"{len(errors)}개 설정 값이 유효하지 않아 변경하지 않았습니다.", list(errors))
             
-            for key, value in settings_dict.items():
-                success, message = self.update_setting(key, value)
-                if success:
-                    success_count += 1
-                else:
-                    failed_keys.append(key)
-                    self.logger.warning(f"설정 변경 실패: {key} - {message}")
-            
-            total_count = len(settings_dict)
+            # 2. 일괄 저장
+            if not self.settings_model.set_settings(settings_dict):
+                self.logger.error("다중 설정 저장 실패")
+                return (False, "설정 변경에 실패했습니다.", list(settings_dict))
             
-            if success_count == total_count:
-                self.logger.info(f"모든 설정 변경 완료: {success_count}개")
-                return (True, f"{success_count}개 설정이 변경되었습니다.", [])
-            elif success_count > 0:
-                self.logger.warning(
-                    f"일부 설정 변경: 성공 {success_count}개, 실패 {len(failed_keys)}개"
-                )
-                return (
-                    False, 
-                    f"{success_count}개 설정 변경 완료, {len(failed_keys)}개 실패",
-                    failed_keys
-                )
-            else:
-                self.logger.error("모든 설정 변경 실패")
-                return (False, "모든 설정 변경에 실패했습니다.", failed_keys)
+            self.logger.info(f"모든 설정 변경 완료: {len(settings_dict)}개")
+            return (True, f"{len(settings_dict)}개 설정이 변경되었습니다.", [])
                 
         except Exception as e:
             self.logger.error(f"다중 설정 변경 실패: {e}", exc_info=True)
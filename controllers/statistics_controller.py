@@ -27,11 +27,13 @@ from models.learning_model import LearningModel
 from models.exam_model import ExamModel
 from models.settings_model import SettingsModel
 from utils.logger import get_logger
+from utils.tracing import trace_methods
 from utils.datetime_helper import get_current_datetime, get_date_range
 
 logger = get_logger(__name__)
 
 
+@trace_methods('controller')
 class StatisticsController:
     """통계 컨트롤러"""
     
@@ -211,10 +213,8 @@ class StatisticsController:
             today_stats = self.statistics_model.get_today_statistics()
             actual_words = today_stats.get('total_words', 0)
             
-            # 시간은 세션 기반으로 계산 (향후 개선 가능)
-            # 현재는 간단히 세션당 평균 시간으로 추정
-            sessions = today_stats.get('sessions', 0)
-            estimated_time = sessions * 10  # 세션당 10분 가정
+            # 학습 시간은 daily_stats에 누적된 세션/시험 소요 시간 (분)
+            estimated_time = today_stats.get('study_time', 0)
             
             # 3. 달성률 계산
             word_achievement = (actual_words / word_goal * 100) if word_goal > 0 else 0.0
@@ -318,26 +318,13 @@ class StatisticsController:
     
     def calculate_streak_days(self):
         """
-        연속 학습 일수 계산
+        연속 학습 일수 계산 (오늘로 끝나는 연속 구간, 기간 제한 없음)
         
         Returns:
             Tuple[bool, str, int]: (성공여부, 메시지, 연속 일수)
         """
         try:
-            # 오늘부터 거꾸로 계산
-            streak = 0
-            current_date = datetime.now()
-            
-            # 최대 30일까지만 확인
-            for i in range(30):
-                check_date = (current_date - timedelta(days=i)).isoformat()
-                day_stats = self.statistics_model.get_daily_statistics(check_date)
-                
-                if day_stats and day_stats.get('total_words', 0) > 0:
-                    streak += 1
-                else:
-                    # 학습하지 않은 날 발견 시 중단
-                    break
+            streak = self.statistics_model.get_streak_summary()['current_streak']
             
             self.logger.debug(f"연속 학습 일수: {streak}일")
             
@@ -348,4 +335,29 @@ class StatisticsController:
             
         except Exception as e:
             self.logger.error(f"연속 학습 일수 계산 실패: {e}", exc_info=True)
-            return (False, "계산 중 오류가 발생했습니다.", 0)
\ No newline at end of file
+            return (False, "계산 중 오류가 발생했습니다.", 0)
+    
+    def get_streak_summary(self):
+        """
+        연속 학습 기록 요약
+        
+        Returns:
+            Tuple[bool, str, Dict]: (성공여부, 메시지, 연속 학습 기록)
+            {
+                'current_streak': 7,
+                'longest_streak': 30,
+                'streaks': [{'start_date': '2026-10-11', 'end_date': '2026-10-17', 'days': 7}, ...]
+            }
+        """
+        try:
+            summary = self.statistics_model.get_streak_summary()
+            
+            self.logger.debug(
+                f"연속 학습 기록: 현재 {summary['current_streak']}일, "
+                f"최장 {summary['longest_streak']}일"
+            )
+            return (True, "연속 학습 기록", summary)
+            
+        except Exception as e:
+            self.logger.error(f"연속 학습 기록 조회 실패: {e}", exc_info=True)
+            return (False, "통계 조회 중 오류가 발생했습니다.", None)
\ No newline at end of file
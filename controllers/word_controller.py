@@ -13,6 +13,7 @@
 
 import sys
 import os
+import itertools
 
 # 프로젝트 루트를 sys.path에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -23,12 +24,15 @@ if project_root not in sys.path:
 from models.word_model import WordModel
 from models.statistics_model import StatisticsModel
 from utils.logger import get_logger
+from utils.tracing import trace_methods
 from utils.validators import validate_word
-from utils.csv_handler import read_csv, write_csv
+from utils.csv_handler import iter_csv, count_csv_rows, validate_csv_structure, write_csv_rows
+from utils.korean_helper import is_choseong_query
 
 logger = get_logger(__name__)
 
 
+@trace_methods('controller')
 class WordController:
     """단어 관리 컨트롤러"""
     
@@ -74,7 +78,9 @@ class WordController:
         
         Args:
             keyword (str): 검색 키워드
-            search_in (str): 검색 대상 ('english', 'korean', 'memo', 'all')
+            search_in (str): 검색 대상 ('english', 'korean', 'memo', 'all', 'choseong', 'fuzzy')
+                             'all'에 초성만 입력하면 초성 검색
+                             'all'/'english' 결과가 없으면 오타 허용 검색으로 재시도
         
         Returns:
             Tuple[bool, str, List[Dict]]: (성공여부, 메시지, 검색 결과)
@@ -85,20 +91,22 @@ class WordController:
             
             keyword = keyword.strip()
             
-            # search_in에 따라 검색
-            if search_in == 'all':
-                results = self.word_model.search_words(keyword)
-            elif search_in == 'english':
-                results = self.word_model.search_words_by_english(keyword)
-            elif search_in == 'korean':
-                results = self.word_model.search_words_by_korean(keyword)
-            elif search_in == 'memo':
-                results = self.word_model.search_words_by_memo(keyword)
-            else:
+            if search_in not in ('english', 'korean', 'memo', 'all', 'choseong', 'fuzzy'):
                 return (False, f"잘못된 검색 대상: {search_in}", [])
             
+            if search_in == 'all' and is_choseong_query(keyword):
+                search_in = 'choseong'
+            
+            # 검색 인덱스(FTS5) 사용 시 관련도 순 정렬
+            results = self.word_model.search_words(keyword, search_in)
+            
             self.logger.debug(f"단어 검색 ({search_in}): '{keyword}' - {len(results)}개")
             
+            if not results and search_in in ('all', 'english'):
+                results = self.word_model.search_words_fuzzy(keyword)
+                if results:
+                    return (True, f"'{keyword}'와(과) 비슷한 단어 {len(results)}개", results)
+            
             if results:
                 return (True, f"{len(results)}개 단어 검색 완료", results)
             else:
@@ -310,69 +318,58 @@ class WordController:
     
     # === CSV 임포트/엑스포트 ===
     
-    def import_from_csv(self, file_path, skip_duplicates=True):
+    def import_from_csv(self, file_path, skip_duplicates=True, progress_callback=None):
         """
-        CSV 임포트
+        CSV 임포트 (파일을 청크 단위로 스트리밍, 전체를 메모리에 올리지 않음)
         
         Args:
             file_path (str): CSV 파일 경로
             skip_duplicates (bool): 중복 단어 건너뛰기
+            progress_callback (callable, optional): 청크마다 호출
+                                                    callback(read_rows, total_rows)
         
         Returns:
             Tuple[bool, str, Dict]: (성공여부, 메시지, 통계)
             통계 = {'success': 18, 'duplicate': 2, 'error': 0}
         """
         try:
-            # 1. CSV 파일 읽기
-            words_data = read_csv(file_path)
-            
-            if words_data is None:
+            # 1. CSV 구조(헤더/필수 컬럼) 확인
+            is_valid, error_msg, _ = validate_csv_structure(file_path, preview_lines=0)
+            if not is_valid:
+                self.logger.warning(f"CSV 구조 오류 ({file_path}): {error_msg}")
                 return (False, "CSV 파일을 읽을 수 없습니다.", None)
             
-            if not words_data:
+            chunk_progress = None
+            if progress_callback:
+                total_rows = count_csv_rows(file_path)
+                
+                def chunk_progress(read_rows, skipped_rows):
+                    progress_callback(read_rows, total_rows)
+            
+            # 2. 일괄 임포트 (청크 스트리밍 → 임시 테이블 → 집합 기반 중복 판정, 한 트랜잭션)
+            words_data = itertools.chain.from_iterable(
+                iter_csv(file_path, progress_callback=chunk_progress)
+            )
+            result = self.word_model.bulk_import(words_data, skip_duplicates)
+            
+            if result['aborted']:
+                # DB 오류로 전체 롤백 (빈 파일과 구분)
+                self.logger.error("CSV 임포트 중단 (%s): %s", file_path, '; '.join(result['errors']))
+                return (False, f"CSV 임포트 중 오류가 발생해 추가된 단어가 없습니다. ({result['errors'][0]})", None)
+            
+            if result['total'] == 0:
                 return (False, "CSV 파일이 비어있습니다.", None)
             
-            # 2. 통계 초기화
             stats = {
-                'success': 0,
-                'duplicate': 0,
-                'error': 0
+                'success': result['success'],
+                'duplicate': result['duplicate'],
+                'error': result['failed'] - result['duplicate']
             }
             
-            # 3. 단어별로 임포트
-            for word_data in words_data:
-                english = word_data.get('english', '').strip()
-                korean = word_data.get('korean', '').strip()
-                memo = word_data.get('memo', '').strip() or None
-                
-                # 검증
-                is_valid, error_msg = validate_word(english, korean, memo)
-                if not is_valid:
-                    self.logger.warning(f"CSV 단어 검증 실패: {english} - {error_msg}")
-                    stats['error'] += 1
-                    continue
-                
-                # 중복 체크
-                existing = self.word_model.get_word_by_english(english)
-                if existing:
-                    if skip_duplicates:
-                        self.logger.debug(f"중복 단어 건너뜀: {english}")
-                        stats['duplicate'] += 1
-                        continue
-                    else:
-                        # 중복이어도 추가 시도 (실패할 것임)
-                        pass
-                
-                # 단어 추가
-                word_id = self.word_model.add_word(english, korean, memo)
-                if word_id:
-                    # 통계 초기화
-                    self.statistics_model.initialize_word_statistics(word_id)
-                    stats['success'] += 1
-                else:
-                    stats['error'] += 1
-            
-            # 4. 결과 메시지 생성
+            for error in result['errors']:
+                self.logger.debug(f"CSV 임포트 제외: {error}")
+            
+            # 3. 결과 메시지 생성
             total = stats['success'] + stats['duplicate'] + stats['error']
             message = f"CSV 임포트 완료: 성공 {stats['success']}개"
             
@@ -391,6 +388,10 @@ class WordController:
             else:
                 return (False, "임포트된 단어가 없습니다.", stats)
                 
+        except ValueError as e:
+            # 스트리밍 도중 읽기 실패 (인코딩 오류 등) - 트랜잭션 롤백됨
+            self.logger.error(f"CSV 임포트 중 파일 읽기 실패 ({file_path}): {e}")
+            return (False, "CSV 파일을 읽을 수 없습니다.", None)
         except Exception as e:
             self.logger.error(f"CSV 임포트 실패 ({file_path}): {e}", exc_info=True)
             return (False, "CSV 임포트 중 오류가 발생했습니다.", None)
@@ -415,26 +416,17 @@ class WordController:
                     if word:
                         words.append(word)
             else:
-                words = self.word_model.get_all_words()
-            
-            if not words:
-                return (False, "내보낼 단어가 없습니다.")
+                # 전체 내보내기는 스트리밍 (단어장 전체를 메모리에 올리지 않음)
+                words = self.word_model.iter_export_to_csv()
             
-            # 2. CSV 데이터 준비
-            csv_data = []
-            for word in words:
-                csv_data.append({
-                    'english': word['english'],
-                    'korean': word['korean'],
-                    'memo': word['memo'] or ''
-                })
-            
-            # 3. CSV 파일 쓰기
-            success = write_csv(file_path, csv_data)
+            # 2. CSV 파일 쓰기 (english, korean, memo만 기록)
+            success, row_count = write_csv_rows(file_path, words)
             
             if success:
-                self.logger.info(f"CSV 엑스포트 완료: {file_path} - {len(words)}개")
-                return (True, f"{len(words)}개 단어가 내보내기 되었습니다.")
+                self.logger.info(f"CSV 엑스포트 완료: {file_path} - {row_count}개")
+                return (True, f"{row_count}개 단어가 내보내기 되었습니다.")
+            elif row_count == 0:
+                return (False, "내보낼 단어가 없습니다.")
             else:
                 self.logger.error(f"CSV 엑스포트 실패: {file_path}")
                 return (False, "CSV 파일 쓰기에 실패했습니다.")
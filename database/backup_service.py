@@ -0,0 +1,478 @@
+# 2026-10-17 - 스마트 단어장 - 데이터베이스 백업
+# 파일 위치: C:\dev\word\database\backup_service.py - v1.0
+
+"""
+SQLite 백업 API(sqlite3.Connection.backup) 기반 온라인 백업
+- 별도 읽기 전용 연결에서 BACKUP_PAGES_PER_STEP 페이지씩 복사 (단계 사이에는 잠금을 잡지 않아 앱은 계속 동작)
+- 복사 중 다른 연결이 DB를 수정하면 SQLite가 처음부터 다시 복사함
+  BACKUP_MAX_RESTARTS회를 넘으면 WAL 모드는 한 번에 스냅샷 복사 (WAL에서는 읽기가 쓰기를 막지 않음),
+  롤백 저널 모드는 쓰기를 막게 되므로 다음 주기로 연기
+- 보관: 최신 1개는 그대로, 나머지는 gzip 압축, BACKUP_KEEP_COUNT개 초과분 삭제
+- 백그라운드 스레드가 BACKUP_CHECK_INTERVAL초마다 주기(BACKUP_INTERVAL_DAYS) 확인
+  (config.AUTO_BACKUP_ENABLED와 auto_backup_enabled 설정이 모두 켜져 있을 때만)
+- 복원: 무결성 검사 → 현재 DB 백업(pre_restore) → 백업 API로 교체
+
+명령줄: python database/maintenance.py backup | list-backups | verify-backup <경로> | restore-backup <경로>
+"""
+
+import glob
+import gzip
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import closing, contextmanager
+from datetime import datetime
+from urllib.request import pathname2url
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+from database.db_connection import get_db_connection
+from models.settings_model import SettingsModel
+from utils.logger import get_logger, log_exception
+
+logger = get_logger(__name__)
+
+PARTIAL_SUFFIX = '.partial'  # 복사/압축 중인 임시 파일
+
+
+class BackupRestarted(Exception):
+    """
+    복사 중 DB 변경으로 재시작이 BACKUP_MAX_RESTARTS회를 넘음
+    """
+
+
+def _open_read_only(path):
+    """
+    읽기 전용 연결 (내부 함수)
+    
+    Args:
+        path (str): DB 파일 경로
+    
+    Returns:
+        sqlite3.Connection: 연결 객체
+    """
+    uri = f"file:{pathname2url(os.path.abspath(path))}?mode=ro"
+    connection = sqlite3.connect(uri, uri=True, timeout=config.DB_TIMEOUT, check_same_thread=False)
+    connection.execute(f"PRAGMA busy_timeout = {int(config.DB_BUSY_TIMEOUT_MS)}")
+    return connection
+
+
+class BackupService:
+    """
+    온라인 백업/보관/검증/복원
+    """
+    
+    def __init__(self, backup_dir=None):
+        """
+        Args:
+            backup_dir (str, optional): 백업 디렉토리 (기본: config.BACKUP_DIR 또는 DB 파일 옆 backups)
+        """
+        self._backup_dir = backup_dir
+        self._lock = threading.Lock()  # 백업/정리/복원은 한 번에 하나
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    @property
+    def backup_dir(self):
+        """
+        백업 디렉토리 (DB 경로가 바뀌어도 따라가도록 매번 계산)
+        
+        Returns:
+            str: 디렉토리 경로
+        """
+        if self._backup_dir:
+            return self._backup_dir
+        if config.BACKUP_DIR:
+            return config.BACKUP_DIR
+        return os.path.join(os.path.dirname(os.path.abspath(config.DATABASE_PATH)), 'backups')
+    
+    def _name_prefix(self):
+        """
+        백업 파일 이름 접두어 (DB 파일 이름 기준) (내부 메서드)
+        
+        Returns:
+            str: 예) vocabulary_
+        """
+        return os.path.splitext(os.path.basename(config.DATABASE_PATH))[0] + '_'
+    
+    def _new_backup_path(self, label=None):
+        """
+        새 백업 파일 경로 (이름 정렬 = 시간 순) (내부 메서드)
+        
+        Args:
+            label (str, optional): 이름 뒤에 붙일 표시 (예: pre_restore)
+        
+        Returns:
+            str: 경로
+        """
+        stem = self._name_prefix() + datetime.now().strftime('%Y%m%d_%H%M%S')
+        suffix = f"_{label}" if label else ''
+        path = os.path.join(self.backup_dir, f"{stem}{suffix}.db")
+        
+        counter = 1
+        while os.path.exists(path) or os.path.exists(path + '.gz'):
+            path = os.path.join(self.backup_dir, f"{stem}_{counter}{suffix}.db")
+            counter += 1
+        return path
+    
+    def list_backups(self):
+        """
+        백업 목록 (최신 순)
+        
+        Returns:
+            list: [{'path', 'name', 'size', 'modified', 'compressed'}, ...]
+        """
+        pattern = os.path.join(glob.escape(self.backup_dir), glob.escape(self._name_prefix()))
+        paths = glob.glob(pattern + '*.db') + glob.glob(pattern + '*.db.gz')
+        
+        backups = []
+        for path in paths:
+            stat = os.stat(path)
+            backups.append({
+                'path': path,
+                'name': os.path.basename(path),
+                'size': stat.st_size,
+                'modified': datetime.fromtimestamp(stat.st_mtime).strftime(config.DATETIME_FORMAT),
+                'compressed': path.endswith('.gz'),
+            })
+        backups.sort(key=lambda backup: backup['name'], reverse=True)
+        return backups
+    
+    def _copy(self, source, target, pages):
+        """
+        백업 API로 단계별 복사 (내부 메서드)
+        
+        Args:
+            source (sqlite3.Connection): 원본 연결
+            target (sqlite3.Connection): 대상 연결
+            pages (int): 단계당 페이지 수 (-1이면 한 번에)
+        
+        Raises:
+            BackupRestarted: 재시작 횟수 초과
+        """
+        state = {'remaining': None, 'restarts': 0}
+        
+        def progress(status, remaining, total):
+            # 남은 페이지가 늘어나면 원본이 바뀌어 처음부터 다시 복사하는 중
+            if state['remaining'] is not None and remaining > state['remaining']:
+                state['restarts'] += 1
+                if state['restarts'] > config.BACKUP_MAX_RESTARTS:
+                    raise BackupRestarted()
+            state['remaining'] = remaining
+            if remaining and config.BACKUP_STEP_SLEEP:
+                time.sleep(config.BACKUP_STEP_SLEEP)
+        
+        source.backup(target, pages=pages, progress=progress)
+    
+    def create_backup(self, label=None):
+        """
+        현재 DB 백업 (앱 실행 중에도 안전)
+        
+        Args:
+            label (str, optional): 파일 이름 표시
+        
+        Returns:
+            str: 백업 파일 경로 (실패/연기 시 None)
+        """
+        if not os.path.exists(config.DATABASE_PATH):
+            logger.warning(f"백업할 DB 파일이 없습니다: {config.DATABASE_PATH}")
+            return None
+        
+        with self._lock:
+            os.makedirs(self.backup_dir, exist_ok=True)
+            path = self._new_backup_path(label)
+            partial = path + PARTIAL_SUFFIX
+            started = time.perf_counter()
+            
+            try:
+                with closing(_open_read_only(config.DATABASE_PATH)) as source, closing(sqlite3.connect(partial)) as target:
+                    try:
+                        self._copy(source, target, config.BACKUP_PAGES_PER_STEP)
+                    except BackupRestarted:
+                        journal_mode = source.execute("PRAGMA journal_mode").fetchone()[0].lower()
+                        if journal_mode != 'wal':
+                            logger.warning("백업 중 DB 변경이 계속되어 다음 주기로 연기")
+                            return None
+                        logger.info("백업 중 DB 변경이 계속되어 WAL 스냅샷으로 한 번에 복사")
+                        self._copy(source, target, -1)
+                    
+                    # 원본이 WAL 모드면 복사본도 WAL로 표시됨 → 파일 하나로 완결되도록 변경
+                    target.execute("PRAGMA journal_mode = DELETE")
+                    check = target.execute("PRAGMA quick_check").fetchone()[0]
+                    if check != 'ok':
+                        raise sqlite3.DatabaseError(f"백업 검사 실패: {check}")
+                
+                os.replace(partial, path)
+                logger.info(
+                    "백업 완료: %s (%.1fMB, %.1f초)",
+                    path, os.path.getsize(path) / (1024 * 1024), time.perf_counter() - started
+                )
+                return path
+            
+            except (sqlite3.Error, OSError) as e:
+                log_exception(logger, e, "백업 실패")
+                return None
+            finally:
+                if os.path.exists(partial):
+                    os.remove(partial)
+    
+    def _compress(self, path):
+        """
+        백업 파일 gzip 압축 후 원본 삭제 (내부 메서드)
+        
+        Args:
+            path (str): 백업 파일 경로
+        
+        Returns:
+            str: 압축 파일 경로
+        """
+        compressed = path + '.gz'
+        partial = compressed + PARTIAL_SUFFIX
+        try:
+            with open(path, 'rb') as src, gzip.open(partial, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(partial, compressed)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        os.remove(path)
+        return compressed
+    
+    def rotate_backups(self):
+        """
+        보관 정책 적용 (최신 1개 외 압축, BACKUP_KEEP_COUNT개 초과분 삭제)
+        
+        Returns:
+            int: 삭제한 백업 수
+        """
+        removed = 0
+        with self._lock:
+            for index, backup in enumerate(self.list_backups()):
+                try:
+                    if index >= config.BACKUP_KEEP_COUNT:
+                        os.remove(backup['path'])
+                        removed += 1
+                    elif index > 0 and config.BACKUP_COMPRESS and not backup['compressed']:
+                        self._compress(backup['path'])
+                except OSError as e:
+                    logger.error(f"백업 정리 실패 ({backup['name']}): {e}")
+        
+        if removed:
+            logger.info(f"오래된 백업 {removed}개 삭제")
+        return removed
+    
+    @contextmanager
+    def _open_backup(self, path):
+        """
+        백업 파일을 읽기 전용으로 열기 (압축 파일은 임시 파일로 풀어서) (내부 메서드)
+        
+        Args:
+            path (str): 백업 파일 경로
+        
+        Yields:
+            sqlite3.Connection: 읽기 전용 연결
+        """
+        temp_path = None
+        if path.endswith('.gz'):
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(os.path.abspath(path)), suffix='.db' + PARTIAL_SUFFIX, delete=False
+            ) as dst, gzip.open(path, 'rb') as src:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+                temp_path = dst.name
+        
+        connection = None
+        try:
+            connection = _open_read_only(temp_path or path)
+            yield connection
+        finally:
+            if connection is not None:
+                connection.close()
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def verify_backup(self, path):
+        """
+        백업 무결성 검사 (PRAGMA integrity_check)
+        
+        Args:
+            path (str): 백업 파일 경로
+        
+        Returns:
+            dict: {'ok': bool, 'message': str, 'schema_version': int, 'word_count': int}
+        """
+        result = {'ok': False, 'message': '', 'schema_version': None, 'word_count': None}
+        if not os.path.exists(path):
+            result['message'] = f"백업 파일이 없습니다: {path}"
+            return result
+        
+        try:
+            with self._open_backup(path) as connection:
+                problems = [row[0] for row in connection.execute("PRAGMA integrity_check")]
+                if problems != ['ok']:
+                    result['message'] = "무결성 검사 실패: " + '; '.join(problems[:5])
+                    return result
+                
+                result['schema_version'] = connection.execute("PRAGMA user_version").fetchone()[0]
+                result['word_count'] = connection.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+        except (sqlite3.Error, OSError, EOFError) as e:
+            result['message'] = f"백업을 열 수 없습니다: {e}"
+            return result
+        
+        result['ok'] = True
+        result['message'] = "정상"
+        return result
+    
+    def restore_backup(self, path):
+        """
+        백업으로 DB 복원 (검증 → 현재 DB를 pre_restore로 백업 → 교체 → 설정 캐시 다시 읽기)
+        
+        Args:
+            path (str): 백업 파일 경로
+        
+        Returns:
+            bool: 성공 여부
+        """
+        verification = self.verify_backup(path)
+        if not verification['ok']:
+            logger.error(f"복원 중단 - {verification['message']}")
+            return False
+        
+        if self.create_backup(label='pre_restore') is None:
+            logger.error("복원 중단 - 현재 DB 백업 실패")
+            return False
+        
+        with self._lock:
+            try:
+                with self._open_backup(path) as source:
+                    get_db_connection().restore_from(source)
+            except (sqlite3.Error, OSError) as e:
+                log_exception(logger, e, "복원 실패")
+                return False
+        
+        # 같은 DBConnection을 쓰므로 설정 캐시가 복원 전 값으로 남음 → 다시 읽고 리스너에 알림
+        SettingsModel().reload_cache()
+        
+        logger.info(f"백업 복원 완료: {path}")
+        return True
+    
+    def is_backup_due(self):
+        """
+        자동 백업 주기(BACKUP_INTERVAL_DAYS) 도래 여부
+        
+        Returns:
+            bool: 최근 백업이 없거나 주기가 지났으면 True
+        """
+        backups = self.list_backups()
+        if not backups:
+            return True
+        age = time.time() - os.path.getmtime(backups[0]['path'])
+        return age >= config.BACKUP_INTERVAL_DAYS * 86400
+    
+    def is_auto_backup_enabled(self):
+        """
+        자동 백업 사용 여부 (config.AUTO_BACKUP_ENABLED + auto_backup_enabled 설정)
+        
+        Returns:
+            bool: 사용 여부
+        """
+        if not config.AUTO_BACKUP_ENABLED:
+            return False
+        rows = get_db_connection().execute_query(
+            "SELECT setting_value FROM user_settings WHERE setting_key = 'auto_backup_enabled'"
+        )
+        return not rows or rows[0]['setting_value'].lower() == 'true'
+    
+    def run_scheduled_backup(self):
+        """
+        자동 백업 확인 1회 (사용 중이고 주기가 되었으면 백업 후 정리)
+        
+        Returns:
+            str: 백업 파일 경로 (백업하지 않았으면 None)
+        """
+        if not self.is_auto_backup_enabled() or not self.is_backup_due():
+            return None
+        
+        path = self.create_backup()
+        if path:
+            self.rotate_backups()
+        return path
+    
+    def start_scheduler(self):
+        """
+        자동 백업 스레드 시작 (데몬 스레드, 이미 실행 중이면 무시)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_scheduler, name='backup-scheduler', daemon=True)
+        self._thread.start()
+        logger.info("자동 백업 스레드 시작")
+    
+    def stop_scheduler(self, timeout=None):
+        """
+        자동 백업 스레드 종료 (진행 중인 백업은 끝날 때까지 대기)
+        
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초)
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _run_scheduler(self):
+        """
+        자동 백업 스레드 본체 (내부 메서드)
+        """
+        wait = config.BACKUP_INITIAL_DELAY
+        while not self._stop_event.wait(wait):
+            try:
+                self.run_scheduled_backup()
+            except Exception as e:
+                log_exception(logger, e, "자동 백업 오류")
+            wait = config.BACKUP_CHECK_INTERVAL
+
+
+# 프로세스 전역 백업 서비스
+_backup_service = None
+
+
+def get_backup_service():
+    """
+    BackupService 싱글톤 반환
+    
+    Returns:
+        BackupService: 백업 서비스
+    """
+    global _backup_service
+    if _backup_service is None:
+        _backup_service = BackupService()
+    return _backup_service
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=" * 50)
+    print("백업 서비스 테스트")
+    print("=" * 50)
+    
+    get_db_connection()  # DB 파일이 없으면 생성
+    service = get_backup_service()
+    backup_path = service.create_backup()
+    print(f"\n백업: {backup_path}")
+    if backup_path:
+        print(f"검증: {service.verify_backup(backup_path)}")
+    
+    service.rotate_backups()
+    for backup in service.list_backups():
+        print(f"  {backup['name']} ({backup['size']} bytes, 압축: {backup['compressed']})")
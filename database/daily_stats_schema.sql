@@ -0,0 +1,130 @@
+-- 2026-10-17 - 스마트 단어장 - 일별 학습 통계 집계 테이블
+-- 파일 위치: C:\dev\word\database\daily_stats_schema.sql - v1.0
+-- learning_sessions / exam_history를 날짜 + 세션 타입별로 미리 합산
+-- 트리거가 변경 전(OLD) 기여분을 빼고 변경 후(NEW) 기여분을 더함 (증분 갱신)
+-- - 학습 세션: end_time이 기록된(종료된) 세션만 집계
+-- - 시험: 채점된(correct_count + wrong_count > 0) 시험만 집계
+-- ============================================================
+-- daily_stats 테이블
+-- ============================================================
+CREATE TABLE IF NOT EXISTS daily_stats (
+    stat_date TEXT NOT NULL,
+    session_type TEXT NOT NULL CHECK(session_type IN ('flashcard', 'exam')),
+    sessions INTEGER NOT NULL DEFAULT 0,
+    total_words INTEGER NOT NULL DEFAULT 0,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    wrong_count INTEGER NOT NULL DEFAULT 0,
+    accuracy_sum REAL NOT NULL DEFAULT 0.0,
+    study_seconds INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (stat_date, session_type)
+) WITHOUT ROWID;
+-- ============================================================
+-- 학습 세션 트리거
+-- ============================================================
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_session_insert AFTER INSERT ON learning_sessions
+WHEN new.end_time IS NOT NULL BEGIN
+    INSERT INTO daily_stats (stat_date, session_type, sessions, total_words, correct_count, wrong_count, accuracy_sum, study_seconds)
+    VALUES (
+        date(new.start_time), new.session_type, 1, new.total_words, new.correct_count, new.wrong_count,
+        new.accuracy_rate, MAX(CAST((julianday(new.end_time) - julianday(new.start_time)) * 86400 AS INTEGER), 0)
+    )
+    ON CONFLICT(stat_date, session_type) DO UPDATE SET
+        sessions = sessions + excluded.sessions,
+        total_words = total_words + excluded.total_words,
+        correct_count = correct_count + excluded.correct_count,
+        wrong_count = wrong_count + excluded.wrong_count,
+        accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+        study_seconds = study_seconds + excluded.study_seconds;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_session_update AFTER UPDATE ON learning_sessions BEGIN
+    INSERT INTO daily_stats (stat_date, session_type, sessions, total_words, correct_count, wrong_count, accuracy_sum, study_seconds)
+    SELECT
+        date(old.start_time), old.session_type, -1, -old.total_words, -old.correct_count, -old.wrong_count,
+        -old.accuracy_rate, -MAX(CAST((julianday(old.end_time) - julianday(old.start_time)) * 86400 AS INTEGER), 0)
+    WHERE old.end_time IS NOT NULL
+    ON CONFLICT(stat_date, session_type) DO UPDATE SET
+        sessions = sessions + excluded.sessions,
+        total_words = total_words + excluded.total_words,
+        correct_count = correct_count + excluded.correct_count,
+        wrong_count = wrong_count + excluded.wrong_count,
+        accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+        study_seconds = study_seconds + excluded.study_seconds;
+    INSERT INTO daily_stats (stat_date, session_type, sessions, total_words, correct_count, wrong_count, accuracy_sum, study_seconds)
+    SELECT
+        date(new.start_time), new.session_type, 1, new.total_words, new.correct_count, new.wrong_count,
+        new.accuracy_rate, MAX(CAST((julianday(new.end_time) - julianday(new.start_time)) * 86400 AS INTEGER), 0)
+    WHERE new.end_time IS NOT NULL
+    ON CONFLICT(stat_date, session_type) DO UPDATE SET
+        sessions = sessions + excluded.sessions,
+        total_words = total_words + excluded.total_words,
+        correct_count = correct_count + excluded.correct_count,
+        wrong_count = wrong_count + excluded.wrong_count,
+        accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+        study_seconds = study_seconds + excluded.study_seconds;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_session_delete AFTER DELETE ON learning_sessions
+WHEN old.end_time IS NOT NULL BEGIN
+    UPDATE daily_stats
+    SET sessions = sessions - 1,
+        total_words = total_words - old.total_words,
+        correct_count = correct_count - old.correct_count,
+        wrong_count = wrong_count - old.wrong_count,
+        accuracy_sum = accuracy_sum - old.accuracy_rate,
+        study_seconds = study_seconds - MAX(CAST((julianday(old.end_time) - julianday(old.start_time)) * 86400 AS INTEGER), 0)
+    WHERE stat_date = date(old.start_time) AND session_type = old.session_type;
+END;
+-- ============================================================
+-- 시험 트리거
+-- ============================================================
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_exam_insert AFTER INSERT ON exam_history
+WHEN new.correct_count + new.wrong_count > 0 BEGIN
+    INSERT INTO daily_stats (stat_date, session_type, sessions, total_words, correct_count, wrong_count, accuracy_sum, study_seconds)
+    VALUES (
+        date(new.exam_date), 'exam', 1, new.correct_count + new.wrong_count, new.correct_count, new.wrong_count,
+        new.score, COALESCE(new.time_taken, 0)
+    )
+    ON CONFLICT(stat_date, session_type) DO UPDATE SET
+        sessions = sessions + excluded.sessions,
+        total_words = total_words + excluded.total_words,
+        correct_count = correct_count + excluded.correct_count,
+        wrong_count = wrong_count + excluded.wrong_count,
+        accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+        study_seconds = study_seconds + excluded.study_seconds;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_exam_update AFTER UPDATE ON exam_history BEGIN
+    INSERT INTO daily_stats (stat_date, session_type, sessions, total_words, correct_count, wrong_count, accuracy_sum, study_seconds)
+    SELECT
+        date(old.exam_date), 'exam', -1, -(old.correct_count + old.wrong_count), -old.correct_count, -old.wrong_count,
+        -old.score, -COALESCE(old.time_taken, 0)
+    WHERE old.correct_count + old.wrong_count > 0
+    ON CONFLICT(stat_date, session_type) DO UPDATE SET
+        sessions = sessions + excluded.sessions,
+        total_words = total_words + excluded.total_words,
+        correct_count = correct_count + excluded.correct_count,
+        wrong_count = wrong_count + excluded.wrong_count,
+        accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+        study_seconds = study_seconds + excluded.study_seconds;
+    INSERT INTO daily_stats (stat_date, session_type, sessions, total_words, correct_count, wrong_count, accuracy_sum, study_seconds)
+    SELECT
+        date(new.exam_date), 'exam', 1, new.correct_count + new.wrong_count, new.correct_count, new.wrong_count,
+        new.score, COALESCE(new.time_taken, 0)
+    WHERE new.correct_count + new.wrong_count > 0
+    ON CONFLICT(stat_date, session_type) DO UPDATE SET
+        sessions = sessions + excluded.sessions,
+        total_words = total_words + excluded.total_words,
+        correct_count = correct_count + excluded.correct_count,
+        wrong_count = wrong_count + excluded.wrong_count,
+        accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+        study_seconds = study_seconds + excluded.study_seconds;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_exam_delete AFTER DELETE ON exam_history
+WHEN old.correct_count + old.wrong_count > 0 BEGIN
+    UPDATE daily_stats
+    SET sessions = sessions - 1,
+        total_words = total_words - (old.correct_count + old.wrong_count),
+        correct_count = correct_count - old.correct_count,
+        wrong_count = wrong_count - old.wrong_count,
+        accuracy_sum = accuracy_sum - old.score,
+        study_seconds = study_seconds - COALESCE(old.time_taken, 0)
+    WHERE stat_date = date(old.exam_date) AND session_type = 'exam';
+END;
@@ -3,14 +3,23 @@
 
 """
 SQLite 데이터베이스 연결 관리 (Singleton 패턴)
-- 단일 연결 보장
-- 최초 실행 시 스키마 자동 생성
-- 트랜잭션 관리
+- 단일 연결 보장 (쓰기 연결)
+- 연결 풀 모드: 쓰기 연결 1개 + 읽기 전용 연결 N개 (WAL 모드)
+- SQLITE_BUSY 재시도 (지수 백오프)
+- 시작 시 스키마 마이그레이션 (PRAGMA user_version, 최초 실행 시 스키마 생성 포함)
+- 트랜잭션 관리 (Unit of Work, SAVEPOINT 중첩)
+- 쿼리 계측: SQL별 실행 시간/행 수 집계, 느린 쿼리 로그 (database.query_stats)
+- 성능 프로필: 연결마다 config.DB_PERFORMANCE_PROFILE의 PRAGMA 적용, 종료 시 PRAGMA optimize
 """
 
 import sqlite3
 import os
 import sys
+import time
+import queue
+import threading
+from contextlib import contextmanager
+from urllib.request import pathname2url
 
 # 프로젝트 루트를 sys.path에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -20,9 +29,62 @@ if project_root not in sys.path:
 
 import config
 from utils.logger import get_logger
+from database.migrations import apply_migrations, object_exists
+from database.query_stats import get_query_stats, normalize_sql
+from utils.tracing import add_complete_event, is_tracing
 
 logger = get_logger(__name__)
 
+# 성능 프로필 PRAGMA (journal_mode는 DB 파일 단위라 쓰기 연결에서 한 번만 설정)
+PERFORMANCE_PRAGMAS = ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store', 'wal_autocheckpoint')
+CONNECTION_PRAGMAS = PERFORMANCE_PRAGMAS[1:]
+
+# PRAGMA 조회 결과(숫자) → 설정 이름
+_PRAGMA_VALUE_NAMES = {
+    'synchronous': {0: 'off', 1: 'normal', 2: 'full', 3: 'extra'},
+    'temp_store': {0: 'default', 1: 'file', 2: 'memory'},
+}
+
+DEFAULT_PERFORMANCE_PROFILE = 'durable'
+_warned_profiles = set()  # 경고를 이미 남긴 알 수 없는 프로필 이름 (연결마다 반복하지 않음)
+
+
+def get_performance_profile_name():
+    """
+    실제 적용할 성능 프로필 이름
+    알 수 없는 프로필 이름이면 경고 후 'durable' 사용
+    
+    Returns:
+        str: 프로필 이름
+    """
+    name = config.DB_PERFORMANCE_PROFILE
+    if name in config.DB_PERFORMANCE_PROFILES:
+        return name
+    
+    if name not in _warned_profiles:
+        _warned_profiles.add(name)
+        logger.warning(
+            f"알 수 없는 성능 프로필: {name!r} (사용 가능: {', '.join(sorted(config.DB_PERFORMANCE_PROFILES))})"
+            f" - {DEFAULT_PERFORMANCE_PROFILE} 사용"
+        )
+    return DEFAULT_PERFORMANCE_PROFILE
+
+
+def get_performance_pragmas():
+    """
+    현재 성능 프로필의 PRAGMA 값 (config.DB_PRAGMA_OVERRIDES 반영)
+    
+    Returns:
+        dict: {PRAGMA 이름: 값}
+    """
+    profile = config.DB_PERFORMANCE_PROFILES[get_performance_profile_name()]
+    pragmas = {**profile, **config.DB_PRAGMA_OVERRIDES}
+    for name, value in pragmas.items():
+        # 설정 파일 값이 그대로 SQL에 들어가므로 이름/숫자만 허용
+        if name not in PERFORMANCE_PRAGMAS or not str(value).lstrip('-').isalnum():
+            raise ValueError(f"잘못된 PRAGMA 설정: {name} = {value}")
+    return pragmas
+
 
 class DBConnection:
     """
@@ -30,13 +92,25 @@ class DBConnection:
     """
     _instance = None
     _connection = None
+    _reader_pool = None
+    _pool_enabled = False
+    _tx_depth = 0
+    _tx_owner = None
+    fts_enabled = False
     
     def __new__(cls):
         """
         Singleton 패턴 구현
         """
         if cls._instance is None:
-            cls._instance = super(DBConnection, cls).__new__(cls)
+            instance = super(DBConnection, cls).__new__(cls)
+            # 쓰기 연결 직렬화용 락 (같은 스레드 재진입 허용)
+            instance._write_lock = threading.RLock()
+            instance._pool_lock = threading.Lock()
+            instance._reader_count = 0
+            instance._tx_depth = 0
+            instance._tx_owner = None
+            cls._instance = instance
         return cls._instance
     
     def __init__(self):
@@ -50,7 +124,7 @@ class DBConnection:
         """
         데이터베이스 초기화
         - DB 파일이 없으면 생성
-        - 스키마 및 초기 데이터 실행
+        - 스키마 마이그레이션 (신규/빈 DB는 스키마 및 초기 데이터 생성)
         """
         try:
             # resources 디렉토리 생성
@@ -59,67 +133,220 @@ class DBConnection:
                 os.makedirs(db_dir)
                 logger.info(f"데이터베이스 디렉토리 생성: {db_dir}")
             
-            # DB 파일 존재 여부 확인
-            db_exists = os.path.exists(config.DATABASE_PATH)
-            
-            # 데이터베이스 연결
-            self._connection = sqlite3.connect(
-                config.DATABASE_PATH,
-                timeout=config.DB_TIMEOUT,
-                check_same_thread=config.DB_CHECK_SAME_THREAD,
-                isolation_level=config.DB_ISOLATION_LEVEL
-            )
+            # 데이터베이스 연결 (쓰기 연결)
+            self._connection = self._open_connection()
             
-            # Row를 dict처럼 사용 가능하도록 설정
-            self._connection.row_factory = sqlite3.Row
-            
-            # 외래키 제약조건 활성화
-            self._connection.execute("PRAGMA foreign_keys = ON")
+            # 저널 모드 (연결 풀 모드는 읽기가 커밋을 기다리지 않도록 항상 WAL)
+            self._pool_enabled = config.DB_POOL_ENABLED
+            journal_mode = str(get_performance_pragmas().get('journal_mode', '')).lower()
+            if self._pool_enabled:
+                journal_mode = 'wal'
+            if journal_mode:
+                applied = self._connection.execute(f"PRAGMA journal_mode = {journal_mode}").fetchone()[0].lower()
+                if applied != journal_mode:
+                    logger.warning(f"저널 모드 전환 실패 ({journal_mode} → {applied})")
+                if self._pool_enabled and applied != 'wal':
+                    logger.warning("WAL 모드가 아니므로 단일 연결 모드로 동작")
+                    self._pool_enabled = False
             
             logger.info(f"데이터베이스 연결 성공: {config.DATABASE_PATH}")
             
-            # 최초 실행 시 스키마 및 초기 데이터 생성
-            if not db_exists:
-                logger.info("최초 실행 감지 - 스키마 생성 시작")
-                self._create_schema()
-                self._insert_initial_data()
-                logger.info("데이터베이스 초기화 완료")
+            # 스키마 마이그레이션 (이미 최신이면 user_version 확인만)
+            apply_migrations(self._connection)
+            self.fts_enabled = object_exists(self._connection, 'words_fts')
+            
+            # 읽기 전용 연결 풀 (연결은 필요할 때 생성)
+            if self._pool_enabled:
+                self._reader_pool = queue.LifoQueue()
+                self._reader_count = 0
+                logger.info(f"연결 풀 모드 활성화: 읽기 연결 최대 {config.DB_POOL_READERS}개")
             
         except sqlite3.Error as e:
             logger.error(f"데이터베이스 초기화 실패: {e}")
             raise
     
-    def _create_schema(self):
+    def _open_connection(self, read_only=False):
         """
-        스키마 생성 (schema.sql 실행)
+        SQLite 연결 생성 및 공통 설정 적용
+        
+        Args:
+            read_only (bool): True면 읽기 전용(mode=ro) 연결
+        
+        Returns:
+            sqlite3.Connection: 연결 객체
         """
-        schema_file = os.path.join(
-            os.path.dirname(__file__),
-            'schema.sql'
-        )
+        if read_only:
+            uri = f"file:{pathname2url(os.path.abspath(config.DATABASE_PATH))}?mode=ro"
+            connection = sqlite3.connect(
+                uri,
+                uri=True,
+                timeout=config.DB_TIMEOUT,
+                check_same_thread=False,
+                isolation_level=config.DB_ISOLATION_LEVEL
+            )
+        else:
+            connection = sqlite3.connect(
+                config.DATABASE_PATH,
+                timeout=config.DB_TIMEOUT,
+                check_same_thread=config.DB_CHECK_SAME_THREAD,
+                isolation_level=config.DB_ISOLATION_LEVEL
+            )
+        
+        # Row를 dict처럼 사용 가능하도록 설정
+        connection.row_factory = sqlite3.Row
+        
+        # 외래키 제약조건 활성화
+        connection.execute("PRAGMA foreign_keys = ON")
         
-        if not os.path.exists(schema_file):
-            logger.error(f"schema.sql 파일을 찾을 수 없습니다: {schema_file}")
-            raise FileNotFoundError(f"schema.sql not found: {schema_file}")
+        # 잠금 대기 시간
+        connection.execute(f"PRAGMA busy_timeout = {int(config.DB_BUSY_TIMEOUT_MS)}")
         
-        self.execute_script(schema_file)
-        logger.info("스키마 생성 완료")
+        # 성능 프로필 (연결 단위 PRAGMA)
+        for name, value in get_performance_pragmas().items():
+            if name in CONNECTION_PRAGMAS:
+                connection.execute(f"PRAGMA {name} = {value}")
+        
+        return connection
     
-    def _insert_initial_data(self):
+    def _acquire_reader(self):
         """
-        초기 데이터 삽입 (init_data.sql 실행)
+        읽기 전용 연결 가져오기 (풀이 비어 있으면 최대 개수까지 생성, 초과 시 대기)
+        
+        Returns:
+            sqlite3.Connection: 읽기 전용 연결
         """
-        init_file = os.path.join(
-            os.path.dirname(__file__),
-            'init_data.sql'
-        )
+        try:
+            return self._reader_pool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._pool_lock:
+            can_create = self._reader_count < config.DB_POOL_READERS
+            if can_create:
+                self._reader_count += 1
+        
+        if can_create:
+            try:
+                return self._open_connection(read_only=True)
+            except sqlite3.Error:
+                with self._pool_lock:
+                    self._reader_count -= 1
+                raise
+        
+        return self._reader_pool.get()
+    
+    @contextmanager
+    def _reader(self):
+        """
+        읽기 전용 연결 대여 (컨텍스트 종료 시 풀에 반환)
+        """
+        connection = self._acquire_reader()
+        try:
+            yield connection
+        finally:
+            self._reader_pool.put(connection)
+    
+    def _use_reader_pool(self):
+        """
+        현재 읽기 쿼리를 읽기 연결 풀로 보낼지 여부
+        
+        Returns:
+            bool: 풀 사용 여부
+        """
+        # 자신이 연 트랜잭션 안에서는 커밋 전 데이터를 보도록 쓰기 연결 사용
+        if self._in_transaction():
+            return False
+        return self._pool_enabled and self._reader_pool is not None
+    
+    def _in_transaction(self):
+        """
+        현재 스레드가 transaction() 블록 안에 있는지 여부
+        
+        Returns:
+            bool: 트랜잭션 진행 여부
+        """
+        return self._tx_depth > 0 and self._tx_owner == threading.get_ident()
+    
+    def _run_with_retry(self, operation):
+        """
+        SQLITE_BUSY(database is locked) 발생 시 지수 백오프로 재시도
+        
+        Args:
+            operation (callable): 실행할 함수
+        
+        Returns:
+            operation의 반환값
+        """
+        delay = config.DB_BUSY_BACKOFF
+        for attempt in range(config.DB_BUSY_RETRIES + 1):
+            try:
+                return operation()
+            except sqlite3.OperationalError as e:
+                if not self._is_busy_error(e) or attempt >= config.DB_BUSY_RETRIES:
+                    raise
+                logger.warning(f"데이터베이스 잠김, {delay:.2f}초 후 재시도 ({attempt + 1}/{config.DB_BUSY_RETRIES})")
+                time.sleep(delay)
+                delay *= 2
+    
+    @staticmethod
+    def _is_busy_error(error):
+        """
+        SQLITE_BUSY / SQLITE_LOCKED 오류 여부
+        
+        Args:
+            error (sqlite3.OperationalError): 오류 객체
+        
+        Returns:
+            bool: 잠금 관련 오류 여부
+        """
+        message = str(error).lower()
+        return 'locked' in message or 'busy' in message
+    
+    def _record_query(self, connection, query, params, elapsed, rows=0, failed=False):
+        """
+        쿼리 실행 시간/행 수 기록 (config.DB_QUERY_STATS_ENABLED)
+        트레이싱 중이면 'db' 구간 기록 (종료 시각 = 현재, iter_query는 합산 시간)
+        느린 쿼리는 같은 연결에서 EXPLAIN QUERY PLAN 기록 (config.DB_SLOW_QUERY_EXPLAIN, SQL별 최초 1회)
+        
+        Args:
+            connection (sqlite3.Connection): 쿼리를 실행한 연결 (잠금 보유 중)
+            query (str): SQL 쿼리
+            params (tuple): 파라미터 (EXPLAIN용)
+            elapsed (float): 실행 시간 (초)
+            rows (int): 반환/처리 행 수
+            failed (bool): 실행 실패 여부
+        """
+        if is_tracing():
+            add_complete_event(
+                normalize_sql(query)[:120], 'db', time.perf_counter() - elapsed, elapsed,
+                {'rows': rows, 'failed': failed} if failed else {'rows': rows}
+            )
         
-        if not os.path.exists(init_file):
-            logger.warning(f"init_data.sql 파일을 찾을 수 없습니다: {init_file}")
+        if not config.DB_QUERY_STATS_ENABLED:
             return
         
-        self.execute_script(init_file)
-        logger.info("초기 데이터 삽입 완료")
+        stats = get_query_stats()
+        slow_sql = stats.record(query, elapsed, rows, failed)
+        if slow_sql is None or failed or not config.DB_SLOW_QUERY_EXPLAIN or not stats.needs_plan(slow_sql):
+            return
+        
+        try:
+            plan = connection.execute(f"EXPLAIN QUERY PLAN {query}", params or ()).fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"EXPLAIN QUERY PLAN 실패: {e}")
+            return
+        stats.set_plan(slow_sql, [row[-1] for row in plan])
+    
+    @staticmethod
+    def _execute(cursor, query, params):
+        """
+        파라미터 유무에 따라 쿼리 실행 (내부 헬퍼)
+        """
+        if params:
+            cursor.execute(query, params)
+        else:
+            cursor.execute(query)
+        return cursor
     
     def get_connection(self):
         """
@@ -146,9 +373,10 @@ class DBConnection:
             with open(sql_file_path, 'r', encoding='utf-8') as f:
                 sql_script = f.read()
             
-            cursor = self._connection.cursor()
-            cursor.executescript(sql_script)
-            self._connection.commit()
+            with self._write_lock:
+                cursor = self._connection.cursor()
+                cursor.executescript(sql_script)
+                self._connection.commit()
             
             logger.info(f"SQL 스크립트 실행 완료: {sql_file_path}")
             return True
@@ -163,6 +391,8 @@ class DBConnection:
     def execute_query(self, query, params=None):
         """
         SELECT 쿼리 실행
+        - 연결 풀 모드: 읽기 전용 연결에서 실행 (쓰기 커밋을 기다리지 않음)
+        - 단일 연결 모드: 쓰기 연결에서 실행
         
         Args:
             query (str): SQL 쿼리
@@ -171,16 +401,23 @@ class DBConnection:
         Returns:
             list: 결과 행 리스트 (dict 형태)
         """
+        connection = self._connection
+        started = time.perf_counter()
         try:
-            cursor = self._connection.cursor()
-            
-            if params:
-                cursor.execute(query, params)
+            if self._use_reader_pool():
+                with self._reader() as connection:
+                    rows = self._run_with_retry(
+                        lambda: self._execute(connection.cursor(), query, params).fetchall()
+                    )
+                    self._record_query(connection, query, params, time.perf_counter() - started, len(rows))
             else:
-                cursor.execute(query)
+                with self._write_lock:
+                    rows = self._run_with_retry(
+                        lambda: self._execute(connection.cursor(), query, params).fetchall()
+                    )
+                    self._record_query(connection, query, params, time.perf_counter() - started, len(rows))
             
             # Row 객체를 dict로 변환
-            rows = cursor.fetchall()
             result = [dict(row) for row in rows]
             
             if config.SHOW_SQL_QUERIES:
@@ -189,42 +426,117 @@ class DBConnection:
             return result
             
         except sqlite3.Error as e:
+            self._record_query(connection, query, params, time.perf_counter() - started, failed=True)
             logger.error(f"쿼리 실행 실패: {e}\nQuery: {query}\nParams: {params}")
             return []
     
-    def execute_update(self, query, params=None):
+    def iter_query(self, query, params=None, batch_size=None):
         """
-        INSERT/UPDATE/DELETE 쿼리 실행
+        SELECT 쿼리 스트리밍 실행 (제너레이터)
+        - fetchmany로 batch_size 행씩 가져와 한 행씩 반환
+        - 전체 결과를 리스트로 만들지 않으므로 메모리 사용량 일정
+        - 연결 풀 모드에서는 순회가 끝날 때까지 읽기 연결 1개를 점유
+          (끝까지 순회하거나 close() 호출 필요)
         
         Args:
             query (str): SQL 쿼리
             params (tuple, optional): 파라미터
+            batch_size (int, optional): fetchmany 크기 (기본값: config.DB_FETCH_BATCH_SIZE)
+        
+        Yields:
+            sqlite3.Row: 결과 행 (row['컬럼명']으로 접근)
+        """
+        batch_size = batch_size or config.DB_FETCH_BATCH_SIZE
+        row_count = 0
+        # 실행 시간은 쿼리 실행 + fetchmany 구간만 합산 (호출자가 행을 처리하는 시간 제외)
+        elapsed = 0.0
+        connection = self._connection
         
-        Returns:
-            int: lastrowid (INSERT) 또는 rowcount (UPDATE/DELETE)
-        """
         try:
-            cursor = self._connection.cursor()
-            
-            if params:
-                cursor.execute(query, params)
+            if self._use_reader_pool():
+                with self._reader() as connection:
+                    started = time.perf_counter()
+                    cursor = self._run_with_retry(
+                        lambda: self._execute(connection.cursor(), query, params)
+                    )
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        elapsed += time.perf_counter() - started
+                        if not rows:
+                            break
+                        row_count += len(rows)
+                        yield from rows
+                        started = time.perf_counter()
+                    self._record_query(connection, query, params, elapsed, row_count)
             else:
-                cursor.execute(query)
-            
-            self._connection.commit()
-            
-            # INSERT의 경우 lastrowid, 나머지는 rowcount
-            result = cursor.lastrowid if cursor.lastrowid > 0 else cursor.rowcount
+                started = time.perf_counter()
+                with self._write_lock:
+                    cursor = self._run_with_retry(
+                        lambda: self._execute(connection.cursor(), query, params)
+                    )
+                while True:
+                    with self._write_lock:
+                        rows = cursor.fetchmany(batch_size)
+                    elapsed += time.perf_counter() - started
+                    if not rows:
+                        break
+                    row_count += len(rows)
+                    yield from rows
+                    started = time.perf_counter()
+                with self._write_lock:
+                    self._record_query(connection, query, params, elapsed, row_count)
             
             if config.SHOW_SQL_QUERIES:
-                logger.debug(f"Update: {query}, Params: {params}, Result: {result}")
-            
-            return result
-            
+                logger.debug(f"Stream query: {query}, Params: {params}, Rows: {row_count}")
+                
         except sqlite3.Error as e:
-            logger.error(f"업데이트 실행 실패: {e}\nQuery: {query}\nParams: {params}")
-            self._connection.rollback()
-            return None
+            self._record_query(connection, query, params, elapsed, row_count, failed=True)
+            logger.error(f"스트리밍 쿼리 실행 실패: {e}\nQuery: {query}\nParams: {params}")
+    
+    def execute_update(self, query, params=None, return_rowcount=False):
+        """
+        INSERT/UPDATE/DELETE 쿼리 실행
+        
+        Args:
+            query (str): SQL 쿼리
+            params (tuple, optional): 파라미터
+            return_rowcount (bool): True면 항상 처리된 행 수 반환
+                                    (lastrowid는 연결 단위 값이라 UPDATE/DELETE 뒤에도
+                                     직전 INSERT의 rowid가 남아 있음)
+        
+        Returns:
+            int: lastrowid (INSERT) 또는 rowcount (UPDATE/DELETE, return_rowcount=True)
+        """
+        with self._write_lock:
+            started = time.perf_counter()
+            try:
+                cursor = self._run_with_retry(
+                    lambda: self._execute(self._connection.cursor(), query, params)
+                )
+                
+                # transaction() 블록 안에서는 블록 종료 시 한 번만 커밋
+                if not self._in_transaction():
+                    self._connection.commit()
+                self._record_query(self._connection, query, params, time.perf_counter() - started, max(cursor.rowcount, 0))
+                
+                # INSERT의 경우 lastrowid, 나머지는 rowcount
+                if return_rowcount:
+                    result = cursor.rowcount
+                else:
+                    result = cursor.lastrowid if cursor.lastrowid > 0 else cursor.rowcount
+                
+                if config.SHOW_SQL_QUERIES:
+                    logger.debug(f"Update: {query}, Params: {params}, Result: {result}")
+                
+                return result
+                
+            except sqlite3.Error as e:
+                self._record_query(self._connection, query, params, time.perf_counter() - started, failed=True)
+                logger.error(f"업데이트 실행 실패: {e}\nQuery: {query}\nParams: {params}")
+                # 트랜잭션 중이면 실패한 문장만 취소됨 (나머지는 블록 종료 시 결정)
+                if not self._in_transaction():
+                    self._connection.rollback()
+                return None
     
     def execute_many(self, query, params_list):
         """
@@ -237,25 +549,97 @@ class DBConnection:
         Returns:
             int: 처리된 행 수
         """
-        try:
-            cursor = self._connection.cursor()
-            cursor.executemany(query, params_list)
-            self._connection.commit()
+        with self._write_lock:
+            # 트랜잭션 밖이면 직접 BEGIN (자동 커밋 모드에서 행마다 커밋되지 않도록)
+            own_transaction = not self._in_transaction()
+            started = time.perf_counter()
+            try:
+                if own_transaction and not self._connection.in_transaction:
+                    self._run_with_retry(lambda: self._connection.execute("BEGIN IMMEDIATE"))
+                
+                cursor = self._connection.cursor()
+                cursor.executemany(query, params_list)
+                
+                if own_transaction:
+                    self._connection.commit()
+                
+                # EXPLAIN용 파라미터는 첫 행 (리스트로 받은 경우만)
+                first_params = params_list[0] if isinstance(params_list, (list, tuple)) and params_list else None
+                self._record_query(self._connection, query, first_params, time.perf_counter() - started, max(cursor.rowcount, 0))
+                logger.debug(f"Batch update: {cursor.rowcount} rows affected")
+                return cursor.rowcount
+                
+            except sqlite3.Error as e:
+                self._record_query(self._connection, query, None, time.perf_counter() - started, failed=True)
+                logger.error(f"일괄 처리 실패: {e}\nQuery: {query}")
+                if own_transaction and self._connection.in_transaction:
+                    self._connection.rollback()
+                return 0
+    
+    @contextmanager
+    def transaction(self):
+        """
+        트랜잭션 컨텍스트 (Unit of Work)
+        - 블록 안의 execute_update/execute_many는 문장별 커밋을 하지 않음
+        - 블록 종료 시 한 번만 커밋, 예외 발생 시 전체 롤백
+        - 중첩 사용 시 SAVEPOINT로 처리 (안쪽 블록만 롤백 가능)
+        - 블록이 끝날 때까지 쓰기 연결을 점유 (다른 스레드의 쓰기는 대기)
+        
+        사용 예:
+            with db.transaction():
+                db.execute_update(...)
+                db.execute_update(...)
+        
+        Yields:
+            DBConnection: 자기 자신
+        """
+        with self._write_lock:
+            depth = self._tx_depth
+            savepoint = f"uow_{depth}"
             
-            logger.debug(f"Batch update: {cursor.rowcount} rows affected")
-            return cursor.rowcount
+            if depth == 0:
+                self._run_with_retry(lambda: self._connection.execute("BEGIN IMMEDIATE"))
+                self._tx_owner = threading.get_ident()
+            else:
+                self._connection.execute(f"SAVEPOINT {savepoint}")
+            self._tx_depth = depth + 1
             
-        except sqlite3.Error as e:
-            logger.error(f"일괄 처리 실패: {e}\nQuery: {query}")
-            self._connection.rollback()
-            return 0
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth = depth
+                try:
+                    if depth == 0:
+                        self._tx_owner = None
+                        self._connection.rollback()
+                        logger.debug("트랜잭션 롤백")
+                    else:
+                        self._connection.execute(f"ROLLBACK TO {savepoint}")
+                        self._connection.execute(f"RELEASE {savepoint}")
+                except sqlite3.Error as e:
+                    logger.error(f"트랜잭션 롤백 실패: {e}")
+                raise
+            else:
+                self._tx_depth = depth
+                if depth == 0:
+                    self._tx_owner = None
+                    try:
+                        self._connection.commit()
+                    except sqlite3.Error as e:
+                        logger.error(f"트랜잭션 커밋 실패: {e}")
+                        self._connection.rollback()
+                        raise
+                    logger.debug("트랜잭션 커밋")
+                else:
+                    self._connection.execute(f"RELEASE {savepoint}")
     
     def begin_transaction(self):
         """
         트랜잭션 시작
         """
         try:
-            self._connection.execute("BEGIN")
+            with self._write_lock:
+                self._connection.execute("BEGIN")
             logger.debug("트랜잭션 시작")
         except sqlite3.Error as e:
             logger.error(f"트랜잭션 시작 실패: {e}")
@@ -265,7 +649,8 @@ class DBConnection:
         트랜잭션 커밋
         """
         try:
-            self._connection.commit()
+            with self._write_lock:
+                self._connection.commit()
             logger.debug("트랜잭션 커밋")
         except sqlite3.Error as e:
             logger.error(f"커밋 실패: {e}")
@@ -276,16 +661,34 @@ class DBConnection:
         트랜잭션 롤백
         """
         try:
-            self._connection.rollback()
+            with self._write_lock:
+                self._connection.rollback()
             logger.debug("트랜잭션 롤백")
         except sqlite3.Error as e:
             logger.error(f"롤백 실패: {e}")
     
     def close(self):
         """
-        데이터베이스 연결 종료
-        """
+        데이터베이스 연결 종료 (읽기 연결 풀 포함)
+        """
+        if self._reader_pool is not None:
+            while True:
+                try:
+                    self._reader_pool.get_nowait().close()
+                except queue.Empty:
+                    break
+                except sqlite3.Error as e:
+                    logger.error(f"읽기 연결 종료 실패: {e}")
+            self._reader_pool = None
+            self._reader_count = 0
+        
         if self._connection:
+            if config.DB_OPTIMIZE_ON_CLOSE:
+                try:
+                    with self._write_lock:
+                        self._connection.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.warning(f"PRAGMA optimize 실패: {e}")
             try:
                 self._connection.close()
                 logger.info("데이터베이스 연결 종료")
@@ -293,6 +696,61 @@ class DBConnection:
             except sqlite3.Error as e:
                 logger.error(f"연결 종료 실패: {e}")
     
+    def restore_from(self, source):
+        """
+        다른 DB 연결의 내용으로 현재 DB 전체 교체 (SQLite 백업 API, 복원용)
+        복원 후 마이그레이션 적용 (예전 버전 백업 대비)
+        
+        Args:
+            source (sqlite3.Connection): 복원할 DB 연결
+        
+        Raises:
+            sqlite3.Error: 트랜잭션 진행 중이거나 복사 실패
+        """
+        with self._write_lock:
+            if self._connection.in_transaction:
+                raise sqlite3.OperationalError("트랜잭션 진행 중에는 복원할 수 없습니다")
+            
+            source.backup(self._connection)
+            apply_migrations(self._connection)
+            self.fts_enabled = object_exists(self._connection, 'words_fts')
+        logger.info("데이터베이스 복원 완료")
+    
+    def get_pragma_diagnostics(self):
+        """
+        성능 PRAGMA 설정값과 실제 적용값 비교 (쓰기 연결 기준)
+        mmap_size처럼 빌드 제한으로 설정값과 다를 수 있음
+        
+        Returns:
+            dict: {'profile': 적용된 프로필 이름, 'configured_profile': 설정한 프로필 이름,
+                   'pool_enabled': bool,
+                   'pragmas': {이름: {'configured': 값, 'effective': 값, 'matches': bool}}}
+        """
+        configured = get_performance_pragmas()
+        if self._pool_enabled:
+            configured['journal_mode'] = 'wal'
+        
+        pragmas = {}
+        with self._write_lock:
+            for name in PERFORMANCE_PRAGMAS:
+                value = self._connection.execute(f"PRAGMA {name}").fetchone()[0]
+                effective = _PRAGMA_VALUE_NAMES.get(name, {}).get(value, value)
+                if isinstance(effective, str):
+                    effective = effective.lower()
+                expected = configured.get(name)
+                pragmas[name] = {
+                    'configured': expected,
+                    'effective': effective,
+                    'matches': expected is None or str(expected).lower() == str(effective),
+                }
+        
+        return {
+            'profile': get_performance_profile_name(),
+            'configured_profile': config.DB_PERFORMANCE_PROFILE,
+            'pool_enabled': self._pool_enabled,
+            'pragmas': pragmas,
+        }
+    
     def get_table_names(self):
         """
         데이터베이스의 모든 테이블 이름 조회
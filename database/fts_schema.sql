@@ -0,0 +1,33 @@
+-- 2026-10-17 - 스마트 단어장 - 전문 검색(FTS5) 인덱스
+-- 파일 위치: C:\dev\word\database\fts_schema.sql - v1.0
+-- words 테이블을 미러링하는 외부 콘텐츠(content='words') FTS5 테이블
+-- 트리거로 words 변경 사항을 자동 반영
+-- ============================================================
+-- words_fts 가상 테이블 (english, korean, memo 검색)
+-- ============================================================
+CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+    english,
+    korean,
+    memo,
+    content='words',
+    content_rowid='word_id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+-- ============================================================
+-- 동기화 트리거
+-- ============================================================
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_insert AFTER INSERT ON words BEGIN
+    INSERT INTO words_fts (rowid, english, korean, memo)
+    VALUES (new.word_id, new.english, new.korean, new.memo);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_delete AFTER DELETE ON words BEGIN
+    INSERT INTO words_fts (words_fts, rowid, english, korean, memo)
+    VALUES ('delete', old.word_id, old.english, old.korean, old.memo);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_words_fts_update AFTER UPDATE OF english, korean, memo ON words BEGIN
+    INSERT INTO words_fts (words_fts, rowid, english, korean, memo)
+    VALUES ('delete', old.word_id, old.english, old.korean, old.memo);
+    INSERT INTO words_fts (rowid, english, korean, memo)
+    VALUES (new.word_id, new.english, new.korean, new.memo);
+END;
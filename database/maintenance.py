@@ -0,0 +1,220 @@
+# 2026-10-17 - 스마트 단어장 - 데이터베이스 유지보수 명령
+# 파일 위치: C:\dev\word\database\maintenance.py - v1.0
+
+"""
+데이터베이스 유지보수 명령줄 도구
+
+사용 예:
+    python database/maintenance.py rebuild-daily-stats
+    python database/maintenance.py rebuild-neighbors --workers 4
+    python database/maintenance.py pragmas
+    python database/maintenance.py backup
+    python database/maintenance.py restore-backup resources/backups/vocabulary_20261017_120000.db.gz
+"""
+
+import argparse
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from database.backup_service import get_backup_service
+from database.db_connection import get_db_connection
+from models.statistics_model import StatisticsModel
+from models.word_model import WordModel
+
+
+def rebuild_daily_stats(args):
+    """
+    daily_stats 집계 테이블 재구성
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인자
+    
+    Returns:
+        int: 종료 코드
+    """
+    count = StatisticsModel().rebuild_daily_stats()
+    if count is None:
+        print("일별 통계 재집계 실패 (로그 확인)")
+        return 1
+    
+    print(f"일별 통계 재집계 완료: {count}행")
+    return 0
+
+
+def rebuild_neighbors(args):
+    """
+    유사 단어(이웃) 색인 재계산 (큰 단어장은 프로세스 풀 사용)
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인자 (workers)
+    
+    Returns:
+        int: 종료 코드
+    """
+    count = WordModel().rebuild_neighbor_index(workers=args.workers)
+    if count is None:
+        print("유사 단어 색인 재계산 실패 (로그 확인)")
+        return 1
+    
+    print(f"유사 단어 색인 재계산 완료: {count}행")
+    return 0
+
+
+def show_pragmas(args):
+    """
+    성능 프로필 PRAGMA 설정값/실제 적용값 출력
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인자
+    
+    Returns:
+        int: 종료 코드 (설정과 다른 값이 있으면 1)
+    """
+    diagnostics = get_db_connection().get_pragma_diagnostics()
+    print(f"성능 프로필: {diagnostics['profile']} (연결 풀: {diagnostics['pool_enabled']})")
+    if diagnostics['configured_profile'] != diagnostics['profile']:
+        print(f" ! 알 수 없는 프로필 설정: {diagnostics['configured_profile']}")
+    for name, values in diagnostics['pragmas'].items():
+        mark = ' ' if values['matches'] else '!'
+        print(f" {mark} {name:<20} 설정 {str(values['configured']):<12} 적용 {values['effective']}")
+    
+    return 0 if all(values['matches'] for values in diagnostics['pragmas'].values()) else 1
+
+
+def backup(args):
+    """
+    지금 백업 후 보관 정책 적용
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인자
+    
+    Returns:
+        int: 종료 코드
+    """
+    # 쓰기 연결을 먼저 열어 둠 (WAL 모드 DB는 읽기 전용 연결만으로 열 수 없을 수 있음)
+    get_db_connection()
+    service = get_backup_service()
+    path = service.create_backup()
+    if path is None:
+        print("백업 실패 (로그 확인)")
+        return 1
+    
+    service.rotate_backups()
+    print(f"백업 완료: {path}")
+    return 0
+
+
+def list_backups(args):
+    """
+    백업 목록 출력 (최신 순)
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인자
+    
+    Returns:
+        int: 종료 코드
+    """
+    service = get_backup_service()
+    backups = service.list_backups()
+    print(f"백업 디렉토리: {service.backup_dir} ({len(backups)}개)")
+    for item in backups:
+        print(f"  {item['name']:<45} {item['size'] / (1024 * 1024):>8.1f}MB  {item['modified']}")
+    return 0
+
+
+def verify_backup(args):
+    """
+    백업 무결성 검사
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인자 (path)
+    
+    Returns:
+        int: 종료 코드
+    """
+    result = get_backup_service().verify_backup(args.path)
+    if not result['ok']:
+        print(f"검사 실패: {result['message']}")
+        return 1
+    
+    print(f"검사 통과: 스키마 v{result['schema_version']}, 단어 {result['word_count']}개")
+    return 0
+
+
+def restore_backup(args):
+    """
+    백업 검사 후 복원 (현재 DB는 pre_restore 백업으로 보관)
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인자 (path)
+    
+    Returns:
+        int: 종료 코드
+    """
+    if not get_backup_service().restore_backup(args.path):
+        print("복원 실패 (로그 확인)")
+        return 1
+    
+    print(f"복원 완료: {args.path}")
+    return 0
+
+
+# 명령 이름: (처리 함수, 도움말, 추가 인자 [(이름, 옵션), ...])
+COMMANDS = {
+    'rebuild-daily-stats': (rebuild_daily_stats, 'daily_stats 집계 테이블 재구성', []),
+    'rebuild-neighbors': (rebuild_neighbors, '유사 단어(이웃) 색인 재계산', [
+        ('--workers', {'type': int, 'default': None, 'help': '프로세스 수 (기본: 단어 수에 따라 자동)'}),
+    ]),
+    'pragmas': (show_pragmas, '성능 프로필 PRAGMA 적용값 확인', []),
+    'backup': (backup, '지금 백업 (보관 정책 적용)', []),
+    'list-backups': (list_backups, '백업 목록', []),
+    'verify-backup': (verify_backup, '백업 무결성 검사', [
+        ('path', {'help': '백업 파일 경로 (.db 또는 .db.gz)'}),
+    ]),
+    'restore-backup': (restore_backup, '백업 검사 후 복원', [
+        ('path', {'help': '백업 파일 경로 (.db 또는 .db.gz)'}),
+    ]),
+}
+
+
+def build_parser():
+    """
+    명령줄 인자 파서 생성
+    
+    Returns:
+        argparse.ArgumentParser: 파서
+    """
+    parser = argparse.ArgumentParser(description='스마트 단어장 데이터베이스 유지보수')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    for name, (handler, help_text, arguments) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        for argument, options in arguments:
+            subparser.add_argument(argument, **options)
+        subparser.set_defaults(handler=handler)
+    
+    return parser
+
+
+def main(argv=None):
+    """
+    명령 실행
+    
+    Args:
+        argv (list, optional): 명령줄 인자 (기본: sys.argv[1:])
+    
+    Returns:
+        int: 종료 코드
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
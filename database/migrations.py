@@ -0,0 +1,573 @@
+# 2026-10-17 - 스마트 단어장 - 스키마 마이그레이션
+# 파일 위치: C:\dev\word\database\migrations.py - v1.0
+
+"""
+PRAGMA user_version 기반 스키마 마이그레이션
+- MIGRATIONS: (버전, 이름, 함수) 순서대로 적용, 적용 후 user_version = 마지막 버전
+- 신규 DB(빈 파일 포함) / 기존 DB 모두 DBConnection 초기화 시 실행
+- 이미 최신이면 PRAGMA user_version 한 번 읽고 끝 (시작 비용 없음)
+- 밀린 단계 전체를 한 트랜잭션으로 적용: 실패 시 모두 롤백하고 예외 전달 (반쯤 적용된 스키마 없음)
+- 모든 단계는 멱등(idempotent): user_version 도입 전 DB(0)에 이미 있는 객체는 건너뜀
+- 단계 함수는 커밋/BEGIN/executescript 금지 (executescript는 진행 중인 트랜잭션을 커밋함)
+- 실행 환경에 따라 건너뛸 수 있는 단계(FTS5 검색 인덱스)는 버전과 별도로 시작할 때마다 확인해 보충
+
+새 스키마 변경은 MIGRATIONS 끝에 다음 버전으로 추가 (기존 단계는 수정하지 않음)
+"""
+
+import sqlite3
+import os
+import sys
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+from utils.logger import get_logger
+from utils.korean_helper import build_choseong_suffixes
+from utils.fuzzy_helper import make_trigrams, normalize_for_fuzzy
+from utils.neighbor_index import build_neighbor_rows
+
+logger = get_logger(__name__)
+
+
+def object_exists(connection, name, object_type='table'):
+    """
+    sqlite_master 객체 존재 여부
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+        name (str): 객체 이름
+        object_type (str): 'table', 'index', 'trigger'
+    
+    Returns:
+        bool: 존재 여부
+    """
+    row = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = ? AND name = ?",
+        (object_type, name)
+    ).fetchone()
+    return row is not None
+
+
+def is_fts5_available(connection):
+    """
+    SQLite 빌드의 FTS5 지원 여부
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 지원 여부
+    """
+    try:
+        row = connection.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()
+        return bool(row and row[0])
+    except sqlite3.Error:
+        return False
+
+
+def _read_sql_file(file_name):
+    """
+    database 디렉토리의 SQL 파일 읽기
+    
+    Args:
+        file_name (str): 파일 이름
+    
+    Returns:
+        str: SQL 스크립트
+    """
+    with open(os.path.join(current_dir, file_name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def split_sql_script(script):
+    """
+    SQL 스크립트를 문장 단위로 분리 (트리거 BEGIN ... END 본문의 ;는 나누지 않음)
+    
+    Args:
+        script (str): SQL 스크립트
+    
+    Returns:
+        list: 문장 목록
+    """
+    statements = []
+    buffer = ''
+    for line in script.splitlines(keepends=True):
+        if not buffer and (not line.strip() or line.lstrip().startswith('--')):
+            continue
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ''
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+
+def _execute_script(connection, script):
+    """
+    SQL 스크립트를 현재 트랜잭션 안에서 실행 (executescript와 달리 커밋하지 않음)
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+        script (str): SQL 스크립트
+    """
+    for statement in split_sql_script(script):
+        connection.execute(statement)
+
+
+def create_initial_schema(connection):
+    """
+    v1.0 스키마(schema.sql) 및 초기 데이터(init_data.sql) 생성
+    user_version 도입 전에 만들어진 DB(words 테이블 있음)는 건너뜀
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    """
+    if object_exists(connection, 'words'):
+        return
+    
+    logger.info("최초 실행 감지 - 스키마 생성 시작")
+    _execute_script(connection, _read_sql_file('schema.sql'))
+    _execute_script(connection, _read_sql_file('init_data.sql'))
+
+
+def _word_search_index_exists(connection):
+    """
+    words_fts 및 동기화 트리거 존재 여부 (내부 함수)
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 존재 여부
+    """
+    return object_exists(connection, 'words_fts') and object_exists(connection, 'trg_words_fts_update', 'trigger')
+
+
+def ensure_word_search_index(connection):
+    """
+    FTS5 전문 검색 인덱스(words_fts) 및 동기화 트리거 생성
+    최초 생성 시 기존 words 데이터로 인덱스 재구성
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 검색 인덱스 사용 가능 여부
+    """
+    if not is_fts5_available(connection):
+        logger.warning("FTS5 미지원 SQLite - LIKE 검색으로 동작")
+        return False
+    
+    if _word_search_index_exists(connection):
+        return True
+    
+    _execute_script(connection, _read_sql_file('fts_schema.sql'))
+    connection.execute("INSERT INTO words_fts (words_fts) VALUES ('rebuild')")
+    logger.info("전문 검색 인덱스(words_fts) 생성 완료")
+    return True
+
+
+def ensure_choseong_index(connection):
+    """
+    한글 초성 검색 색인(word_choseong) 생성
+    - 단어별 초성 문자열의 모든 접미사를 저장 (접두/중간 일치를 인덱스 범위 검색으로 처리)
+    - 색인이 없는 기존 단어는 채워 넣음
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 색인 사용 가능 여부
+    """
+    _execute_script(connection, """
+        CREATE TABLE IF NOT EXISTS word_choseong (
+            word_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            suffix TEXT NOT NULL,
+            PRIMARY KEY (word_id, position),
+            FOREIGN KEY (word_id) REFERENCES words(word_id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_word_choseong_suffix ON word_choseong(suffix, position);
+    """)
+    
+    missing = connection.execute("""
+        SELECT w.word_id, w.korean
+        FROM words w
+        WHERE NOT EXISTS (SELECT 1 FROM word_choseong wc WHERE wc.word_id = w.word_id)
+    """).fetchall()
+    
+    if missing:
+        connection.executemany(
+            "INSERT OR REPLACE INTO word_choseong (word_id, position, suffix) VALUES (?, ?, ?)",
+            (
+                (row[0], position, suffix)
+                for row in missing
+                for position, suffix in build_choseong_suffixes(row[1])
+            )
+        )
+        logger.info(f"초성 검색 색인 생성: {len(missing)}개 단어")
+    return True
+
+
+def ensure_trigram_index(connection):
+    """
+    오타 허용 검색용 트라이그램 색인(word_trigrams) 생성
+    - (트라이그램, 단어 길이, word_id) 순 기본키: 길이 범위까지 인덱스로 좁힘
+    - 색인이 없는 기존 단어는 채워 넣음
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 색인 사용 가능 여부
+    """
+    _execute_script(connection, """
+        CREATE TABLE IF NOT EXISTS word_trigrams (
+            trigram TEXT NOT NULL,
+            word_length INTEGER NOT NULL,
+            word_id INTEGER NOT NULL,
+            PRIMARY KEY (trigram, word_length, word_id),
+            FOREIGN KEY (word_id) REFERENCES words(word_id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_word_trigrams_word ON word_trigrams(word_id);
+    """)
+    
+    missing = connection.execute("""
+        SELECT w.word_id, w.english
+        FROM words w
+        WHERE NOT EXISTS (SELECT 1 FROM word_trigrams wt WHERE wt.word_id = w.word_id)
+    """).fetchall()
+    
+    if missing:
+        connection.executemany(
+            "INSERT OR IGNORE INTO word_trigrams (trigram, word_length, word_id) VALUES (?, ?, ?)",
+            (
+                (trigram, len(normalize_for_fuzzy(row[1])), row[0])
+                for row in missing
+                for trigram in make_trigrams(row[1])
+            )
+        )
+        logger.info(f"트라이그램 색인 생성: {len(missing)}개 단어")
+    return True
+
+
+def ensure_neighbor_index(connection):
+    """
+    유사 단어(이웃) 색인(word_neighbors) 생성
+    - 객관식 오답 선택지를 단어당 상위 K개 유사 단어에서 바로 조회
+    - 최초 생성 시 단어가 적으면 바로 계산, 많으면 유지보수 명령으로 계산하도록 안내
+      (python database/maintenance.py rebuild-neighbors, 프로세스 풀 사용)
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 색인 사용 가능 여부
+    """
+    is_new = not object_exists(connection, 'word_neighbors')
+    
+    _execute_script(connection, """
+        CREATE TABLE IF NOT EXISTS word_neighbors (
+            word_id INTEGER NOT NULL,
+            neighbor_id INTEGER NOT NULL,
+            similarity REAL NOT NULL,
+            PRIMARY KEY (word_id, neighbor_id),
+            FOREIGN KEY (word_id) REFERENCES words(word_id) ON DELETE CASCADE,
+            FOREIGN KEY (neighbor_id) REFERENCES words(word_id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_word_neighbors_neighbor ON word_neighbors(neighbor_id);
+    """)
+    
+    if is_new:
+        word_count = connection.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+        if word_count > config.NEIGHBOR_PARALLEL_MIN_WORDS:
+            logger.warning(
+                f"유사 단어 색인 미생성 ({word_count}개 단어) - "
+                "python database/maintenance.py rebuild-neighbors 실행 필요"
+            )
+        elif word_count:
+            words = connection.execute("SELECT word_id, english, korean FROM words").fetchall()
+            rows = build_neighbor_rows(words, workers=1)
+            connection.executemany(
+                "INSERT INTO word_neighbors (word_id, neighbor_id, similarity) VALUES (?, ?, ?)",
+                rows
+            )
+            logger.info(f"유사 단어 색인 생성: {word_count}개 단어")
+    return True
+
+
+# 복습 스케줄러 상태 컬럼 (word_statistics)
+REVIEW_COLUMNS = [
+    ('review_interval', 'REAL DEFAULT 0'),
+    ('ease_factor', 'REAL'),
+    ('repetition', 'INTEGER DEFAULT 0'),
+    ('stability', 'REAL'),
+    ('difficulty', 'REAL'),
+]
+
+
+def ensure_review_schedule(connection):
+    """
+    간격 반복 복습용 컬럼 및 복습 예정일 인덱스 생성
+    - word_statistics에 스케줄러 상태 컬럼 추가 (없는 컬럼만)
+    - next_review_date 인덱스: 복습 대상 조회를 인덱스 범위 검색으로 처리
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 사용 가능 여부
+    """
+    existing = {row[1] for row in connection.execute("PRAGMA table_info(word_statistics)")}
+    
+    for column, definition in REVIEW_COLUMNS:
+        if column not in existing:
+            connection.execute(f"ALTER TABLE word_statistics ADD COLUMN {column} {definition}")
+    
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_stats_next_review ON word_statistics(next_review_date)"
+    )
+    return True
+
+
+# daily_stats 전체 재집계 (트리거와 같은 집계 기준)
+DAILY_STATS_REBUILD_QUERIES = (
+    "DELETE FROM daily_stats",
+    """
+        INSERT INTO daily_stats (
+            stat_date, session_type, sessions, total_words,
+            correct_count, wrong_count, accuracy_sum, study_seconds
+        )
+        SELECT stat_date, session_type, COUNT(*), SUM(total_words),
+               SUM(correct_count), SUM(wrong_count), SUM(accuracy), SUM(study_seconds)
+        FROM (
+            SELECT
+                date(start_time) as stat_date,
+                session_type,
+                total_words,
+                correct_count,
+                wrong_count,
+                accuracy_rate as accuracy,
+                MAX(CAST((julianday(end_time) - julianday(start_time)) * 86400 AS INTEGER), 0) as study_seconds
+            FROM learning_sessions
+            WHERE end_time IS NOT NULL
+            UNION ALL
+            SELECT
+                date(exam_date),
+                'exam',
+                correct_count + wrong_count,
+                correct_count,
+                wrong_count,
+                score,
+                COALESCE(time_taken, 0)
+            FROM exam_history
+            WHERE correct_count + wrong_count > 0
+        )
+        GROUP BY stat_date, session_type
+    """
+)
+
+
+def rebuild_daily_stats(connection):
+    """
+    daily_stats를 원본 테이블에서 다시 집계 (커밋은 호출자가 처리)
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        int: 집계된 (날짜, 세션 타입) 행 수
+    """
+    for query in DAILY_STATS_REBUILD_QUERIES:
+        connection.execute(query)
+    return connection.execute("SELECT COUNT(*) FROM daily_stats").fetchone()[0]
+
+
+def ensure_daily_stats(connection):
+    """
+    일별 학습 통계 집계 테이블(daily_stats) 및 증분 갱신 트리거 생성
+    최초 생성 시 기존 세션/시험 기록으로 집계
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 사용 가능 여부
+    """
+    if object_exists(connection, 'daily_stats') and object_exists(connection, 'trg_daily_stats_exam_delete', 'trigger'):
+        return True
+    
+    _execute_script(connection, _read_sql_file('daily_stats_schema.sql'))
+    count = rebuild_daily_stats(connection)
+    logger.info(f"일별 통계 집계 테이블(daily_stats) 생성 완료: {count}행")
+    return True
+
+
+def ensure_wrong_note_upsert(connection):
+    """
+    오답 노트 UPSERT/목록 조회용 스키마
+    - last_wrong_date 컬럼: 마지막으로 틀린 일시 (최근 순 정렬)
+    - 미해결 노트는 단어당 1행: 부분 UNIQUE 인덱스 (ON CONFLICT 대상)
+      기존 중복 미해결 행은 최신 행 하나로 합침 (wrong_count 합산, 남길 행만 갱신해야 합계가 한 번만 더해짐)
+    - 최근 순/자주 틀린 순 목록용 부분 인덱스 (해결된 과거 기록은 포함하지 않음)
+      is_resolved 단일 인덱스는 플래너가 이 인덱스 대신 고르므로 삭제
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        bool: 사용 가능 여부
+    """
+    if object_exists(connection, 'idx_wrong_note_unresolved_word', 'index'):
+        return True
+    
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(wrong_note)")}
+    
+    if 'last_wrong_date' not in columns:
+        connection.execute("ALTER TABLE wrong_note ADD COLUMN last_wrong_date TEXT")
+        connection.execute("UPDATE wrong_note SET last_wrong_date = added_date")
+    
+    connection.execute("""
+        UPDATE wrong_note
+        SET wrong_count = (
+                SELECT SUM(d.wrong_count) FROM wrong_note d
+                WHERE d.word_id = wrong_note.word_id AND d.is_resolved = 0
+            ),
+            added_date = (
+                SELECT MIN(d.added_date) FROM wrong_note d
+                WHERE d.word_id = wrong_note.word_id AND d.is_resolved = 0
+            ),
+            last_wrong_date = (
+                SELECT MAX(d.last_wrong_date) FROM wrong_note d
+                WHERE d.word_id = wrong_note.word_id AND d.is_resolved = 0
+            )
+        WHERE note_id IN (
+            SELECT MAX(note_id) FROM wrong_note
+            WHERE is_resolved = 0
+            GROUP BY word_id
+            HAVING COUNT(*) > 1
+        )
+    """)
+    connection.execute("""
+        DELETE FROM wrong_note
+        WHERE is_resolved = 0
+        AND note_id NOT IN (
+            SELECT MAX(note_id) FROM wrong_note
+            WHERE is_resolved = 0
+            GROUP BY word_id
+        )
+    """)
+    
+    connection.execute("""
+        CREATE INDEX IF NOT EXISTS idx_wrong_note_unresolved_recent
+        ON wrong_note(last_wrong_date, note_id) WHERE is_resolved = 0
+    """)
+    connection.execute("""
+        CREATE INDEX IF NOT EXISTS idx_wrong_note_unresolved_frequent
+        ON wrong_note(wrong_count, last_wrong_date, note_id) WHERE is_resolved = 0
+    """)
+    connection.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_wrong_note_unresolved_word
+        ON wrong_note(word_id) WHERE is_resolved = 0
+    """)
+    connection.execute("DROP INDEX IF EXISTS idx_wrong_note_resolved")
+    logger.info("오답 노트 UPSERT 인덱스 생성 완료")
+    return True
+
+
+# (버전, 이름, 함수) - 버전 오름차순, 이미 배포된 단계는 수정/삭제 금지
+MIGRATIONS = [
+    (1, 'initial_schema', create_initial_schema),
+    (2, 'word_search_index', ensure_word_search_index),
+    (3, 'choseong_index', ensure_choseong_index),
+    (4, 'trigram_index', ensure_trigram_index),
+    (5, 'review_schedule', ensure_review_schedule),
+    (6, 'daily_stats', ensure_daily_stats),
+    (7, 'neighbor_index', ensure_neighbor_index),
+    (8, 'wrong_note_upsert', ensure_wrong_note_upsert),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(connection):
+    """
+    현재 스키마 버전 (PRAGMA user_version)
+    
+    Args:
+        connection (sqlite3.Connection): 연결 객체
+    
+    Returns:
+        int: 스키마 버전 (0 = 신규 DB 또는 user_version 도입 전 DB)
+    """
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(connection):
+    """
+    밀린 마이그레이션을 한 트랜잭션으로 적용
+    
+    Args:
+        connection (sqlite3.Connection): 쓰기 연결 (트랜잭션 밖이어야 함)
+    
+    Returns:
+        int: 적용 후 스키마 버전
+    
+    Raises:
+        sqlite3.Error: 단계 실패 (전체 롤백, user_version 그대로)
+    """
+    version = get_schema_version(connection)
+    if version >= LATEST_VERSION:
+        if version > LATEST_VERSION:
+            logger.warning(f"앱보다 새로운 스키마 버전 ({version} > {LATEST_VERSION})")
+        repair_word_search_index(connection)
+        return version
+    
+    pending = [(number, name, step) for number, name, step in MIGRATIONS if number > version]
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        for number, name, step in pending:
+            step(connection)
+            logger.info(f"마이그레이션 적용: v{number} {name}")
+        connection.execute(f"PRAGMA user_version = {LATEST_VERSION}")
+        connection.commit()
+    except (sqlite3.Error, OSError) as e:
+        connection.rollback()
+        logger.error(f"마이그레이션 실패 (v{version} → v{LATEST_VERSION}, 전체 롤백): {e}")
+        raise
+    
+    logger.info(f"스키마 버전: v{version} → v{LATEST_VERSION}")
+    return LATEST_VERSION
+
+
+def repair_word_search_index(connection):
+    """
+    건너뛴 FTS5 검색 인덱스 보충 (apply_migrations에서 매번 호출)
+    v2(word_search_index)는 FTS5 미지원 SQLite에서 건너뛰어도 버전이 올라가므로,
+    이후 FTS5를 지원하는 SQLite로 실행되면 여기서 생성
+    실패해도 LIKE 검색으로 동작하므로 기록만 하고 계속
+    
+    Args:
+        connection (sqlite3.Connection): 쓰기 연결 (트랜잭션 밖이어야 함)
+    
+    Returns:
+        bool: 새로 생성했으면 True
+    """
+    if _word_search_index_exists(connection) or not is_fts5_available(connection):
+        return False
+    
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        ensure_word_search_index(connection)
+        connection.commit()
+    except (sqlite3.Error, OSError) as e:
+        connection.rollback()
+        logger.error(f"전문 검색 인덱스 보충 실패 (LIKE 검색으로 동작): {e}")
+        return False
+    
+    logger.info("건너뛴 전문 검색 인덱스(words_fts) 보충")
+    return True
@@ -0,0 +1,322 @@
+# 2026-10-17 - 스마트 단어장 - 쿼리 계측
+# 파일 위치: C:\dev\word\database\query_stats.py - v1.0
+
+"""
+쿼리 계측 (DBConnection에서 호출)
+- 정규화된 SQL별 호출 수, 실행 시간(합계/최소/최대), 반환/처리 행 수, 지연 시간 히스토그램 집계
+  정규화: 공백 정리, 문자열/숫자 리터럴 → ?, (?, ?, ...) 목록 → (?...) (IN 목록 길이와 무관하게 같은 키)
+- 느린 쿼리 로그 (config.DB_SLOW_QUERY_MS 이상, config.DB_SLOW_QUERY_LOG_FILE)
+  config.DB_SLOW_QUERY_EXPLAIN이면 SQL별 최초 1회 EXPLAIN QUERY PLAN 함께 기록
+- 리포트: get_query_stats().format_report() / dump_report(path)
+  config.DB_QUERY_STATS_DUMP_ON_EXIT이면 프로그램 종료 시 자동 저장
+
+집계는 프로세스 메모리에만 보관 (재시작 시 초기화)
+"""
+
+import atexit
+import bisect
+import json
+import os
+import re
+import sys
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+from utils.logger import get_logger, setup_logger
+
+logger = get_logger(__name__)
+slow_logger = setup_logger('slow_query', log_file=config.DB_SLOW_QUERY_LOG_FILE)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(query):
+    """
+    집계 키용 SQL 정규화
+    
+    Args:
+        query (str): SQL 쿼리
+    
+    Returns:
+        str: 정규화된 SQL
+    """
+    sql = _STRING_LITERAL.sub('?', query)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = _WHITESPACE.sub(' ', sql).strip()
+    return _PLACEHOLDER_LIST.sub('(?...)', sql)
+
+
+class _Entry:
+    """
+    SQL 하나의 집계값
+    """
+    __slots__ = ('calls', 'errors', 'total', 'min', 'max', 'rows', 'histogram', 'plan')
+    
+    def __init__(self, bucket_count):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.rows = 0
+        self.histogram = [0] * bucket_count
+        self.plan = None
+
+
+class QueryStats:
+    """
+    정규화된 SQL별 실행 통계 (스레드 안전)
+    """
+    
+    MAX_STATEMENTS = 5000  # 동적 SQL이 계속 늘어날 때 메모리 상한
+    
+    def __init__(self, buckets_ms=None):
+        """
+        Args:
+            buckets_ms (tuple, optional): 히스토그램 구간 상한 (밀리초, 기본: config.DB_QUERY_HISTOGRAM_BUCKETS_MS)
+        """
+        self.buckets_ms = tuple(buckets_ms or config.DB_QUERY_HISTOGRAM_BUCKETS_MS)
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def record(self, query, elapsed, rows=0, failed=False):
+        """
+        쿼리 실행 1회 기록
+        
+        Args:
+            query (str): SQL 쿼리 (정규화 전)
+            elapsed (float): 실행 시간 (초)
+            rows (int): 반환/처리 행 수
+            failed (bool): 실행 실패 여부
+        
+        Returns:
+            str: 정규화된 SQL (느린 쿼리일 때만, 아니면 None)
+        """
+        sql = normalize_sql(query)
+        elapsed_ms = elapsed * 1000
+        bucket = bisect.bisect_left(self.buckets_ms, elapsed_ms)
+        
+        with self._lock:
+            entry = self._entries.get(sql)
+            if entry is None:
+                if len(self._entries) >= self.MAX_STATEMENTS:
+                    return None
+                entry = self._entries[sql] = _Entry(len(self.buckets_ms) + 1)
+            entry.calls += 1
+            entry.total += elapsed
+            entry.rows += rows or 0
+            entry.histogram[bucket] += 1
+            if entry.min is None or elapsed < entry.min:
+                entry.min = elapsed
+            if elapsed > entry.max:
+                entry.max = elapsed
+            if failed:
+                entry.errors += 1
+        
+        if elapsed_ms >= config.DB_SLOW_QUERY_MS:
+            slow_logger.warning("느린 쿼리 %.1fms (행 %s): %s", elapsed_ms, rows, sql)
+            return sql
+        return None
+    
+    def needs_plan(self, sql):
+        """
+        EXPLAIN QUERY PLAN을 아직 기록하지 않은 SQL인지 여부
+        
+        Args:
+            sql (str): 정규화된 SQL
+        
+        Returns:
+            bool: 기록 필요 여부
+        """
+        with self._lock:
+            entry = self._entries.get(sql)
+            return entry is not None and entry.plan is None
+    
+    def set_plan(self, sql, plan):
+        """
+        EXPLAIN QUERY PLAN 결과 저장 및 느린 쿼리 로그에 기록
+        
+        Args:
+            sql (str): 정규화된 SQL
+            plan (list): 계획 단계 문자열 목록
+        """
+        with self._lock:
+            entry = self._entries.get(sql)
+            if entry is not None:
+                entry.plan = plan
+        slow_logger.warning("쿼리 계획: %s\n  %s", sql, '\n  '.join(plan))
+    
+    def _percentile_bucket(self, histogram, calls, fraction):
+        """
+        히스토그램에서 백분위가 속한 구간 상한 (내부 함수)
+        
+        Args:
+            histogram (list): 구간별 건수
+            calls (int): 전체 건수
+            fraction (float): 백분위 (0.0 ~ 1.0)
+        
+        Returns:
+            float: 구간 상한 (밀리초, 마지막 구간은 None)
+        """
+        target = calls * fraction
+        cumulative = 0
+        for index, count in enumerate(histogram):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets_ms[index] if index < len(self.buckets_ms) else None
+        return None
+    
+    def snapshot(self, sort_by='total_ms', limit=None):
+        """
+        집계 결과 조회
+        
+        Args:
+            sort_by (str): 정렬 기준 ('total_ms', 'calls', 'max_ms', 'avg_ms', 'rows')
+            limit (int, optional): 최대 SQL 수
+        
+        Returns:
+            list: [{'sql', 'calls', 'errors', 'total_ms', 'avg_ms', 'min_ms', 'max_ms',
+                    'rows', 'p50_le_ms', 'p95_le_ms', 'histogram', 'plan'}, ...]
+        """
+        with self._lock:
+            items = [
+                (sql, entry.calls, entry.errors, entry.total, entry.min, entry.max,
+                 entry.rows, list(entry.histogram), entry.plan)
+                for sql, entry in self._entries.items()
+            ]
+        
+        labels = [f"<={bound}ms" for bound in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+        result = []
+        for sql, calls, errors, total, minimum, maximum, rows, histogram, plan in items:
+            result.append({
+                'sql': sql,
+                'calls': calls,
+                'errors': errors,
+                'total_ms': round(total * 1000, 3),
+                'avg_ms': round(total * 1000 / calls, 3),
+                'min_ms': round((minimum or 0) * 1000, 3),
+                'max_ms': round(maximum * 1000, 3),
+                'rows': rows,
+                'p50_le_ms': self._percentile_bucket(histogram, calls, 0.5),
+                'p95_le_ms': self._percentile_bucket(histogram, calls, 0.95),
+                'histogram': dict(zip(labels, histogram)),
+                'plan': plan,
+            })
+        
+        result.sort(key=lambda item: item[sort_by], reverse=True)
+        return result[:limit] if limit else result
+    
+    def format_report(self, sort_by='total_ms', limit=20):
+        """
+        집계 결과를 표 형태 문자열로 반환
+        
+        Args:
+            sort_by (str): 정렬 기준
+            limit (int): 최대 SQL 수
+        
+        Returns:
+            str: 리포트
+        """
+        rows = self.snapshot(sort_by, limit)
+        lines = [f"쿼리 통계 (상위 {len(rows)}개, 정렬: {sort_by})",
+                 f"{'calls':>8} {'total_ms':>11} {'avg_ms':>9} {'max_ms':>9} {'p95<=':>7} {'rows':>9}  sql"]
+        for row in rows:
+            p95 = row['p95_le_ms'] if row['p95_le_ms'] is not None else f">{self.buckets_ms[-1]}"
+            sql = row['sql'] if len(row['sql']) <= 100 else row['sql'][:97] + '...'
+            lines.append(
+                f"{row['calls']:>8} {row['total_ms']:>11.1f} {row['avg_ms']:>9.3f} "
+                f"{row['max_ms']:>9.1f} {p95:>7} {row['rows']:>9}  {sql}"
+            )
+        return '\n'.join(lines)
+    
+    def reset(self):
+        """
+        집계 초기화
+        """
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+# 프로세스 전역 집계
+_query_stats = QueryStats()
+
+
+def get_query_stats():
+    """
+    프로세스 전역 QueryStats 반환
+    
+    Returns:
+        QueryStats: 쿼리 통계
+    """
+    return _query_stats
+
+
+def dump_report(path=None, sort_by='total_ms'):
+    """
+    집계 결과를 JSON 파일로 저장
+    
+    Args:
+        path (str, optional): 저장 경로 (기본: config.DB_QUERY_STATS_DUMP_FILE)
+        sort_by (str): 정렬 기준
+    
+    Returns:
+        str: 저장 경로
+    """
+    path = path or config.DB_QUERY_STATS_DUMP_FILE
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    report = {
+        'timestamp': datetime.now().strftime(config.ISO8601_FORMAT),
+        'slow_query_ms': config.DB_SLOW_QUERY_MS,
+        'statements': _query_stats.snapshot(sort_by),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def _dump_on_exit():
+    """
+    종료 시 리포트 저장 (config.DB_QUERY_STATS_DUMP_ON_EXIT) (내부 함수)
+    """
+    if not config.DB_QUERY_STATS_DUMP_ON_EXIT or not len(_query_stats):
+        return
+    try:
+        path = dump_report()
+        logger.info("쿼리 통계 저장: %s\n%s", path, _query_stats.format_report(limit=10))
+    except OSError as e:
+        logger.error(f"쿼리 통계 저장 실패: {e}")
+
+
+# 로거 큐 종료(utils.logger)보다 먼저 실행되도록 로거 생성 후 등록 (atexit는 역순 실행)
+atexit.register(_dump_on_exit)
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=" * 50)
+    print("query_stats 테스트")
+    print("=" * 50)
+    
+    print(normalize_sql("SELECT *  FROM words\n WHERE word_id IN (1, 2, 3) AND english = 'it''s'"))
+    
+    stats = QueryStats()
+    for i in range(100):
+        stats.record(f"SELECT * FROM words WHERE word_id = {i}", 0.0005 * (i % 10), rows=1)
+    stats.record("UPDATE words SET memo = ? WHERE word_id = ?", 0.02, rows=1)
+    print(stats.format_report())
@@ -123,7 +123,6 @@ CREATE TABLE IF NOT EXISTS wrong_note (
     FOREIGN KEY (exam_id) REFERENCES exam_history(exam_id) ON DELETE SET NULL
 );
 CREATE INDEX IF NOT EXISTS idx_wrong_note_word_id ON wrong_note(word_id);
-CREATE INDEX IF NOT EXISTS idx_wrong_note_resolved ON wrong_note(is_resolved);
 CREATE INDEX IF NOT EXISTS idx_wrong_note_added_date ON wrong_note(added_date);
 -- ============================================================
 -- 8. user_settings 테이블 (사용자 설정)
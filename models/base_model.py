@@ -7,11 +7,13 @@
 - 공통 DB 연산 메서드
 - 에러 처리 및 로깅
 - 트랜잭션 관리
+- 하위 클래스 공개 메서드는 트레이싱 구간으로 기록 (utils.tracing, 기록 중일 때만)
 """
 
 import sqlite3
 import sys
 import os
+from contextlib import contextmanager
 
 # 프로젝트 루트를 sys.path에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,6 +23,7 @@ if project_root not in sys.path:
 
 from database.db_connection import get_db_connection
 from utils.logger import get_logger
+from utils.tracing import span, trace_methods
 
 
 class BaseModel:
@@ -29,6 +32,13 @@ class BaseModel:
     공통 데이터베이스 연산 제공
     """
     
+    def __init_subclass__(cls, **kwargs):
+        """
+        하위 클래스 공개 메서드를 'model' 트레이싱 구간으로 감쌈
+        """
+        super().__init_subclass__(**kwargs)
+        trace_methods('model')(cls)
+    
     def __init__(self):
         """
         초기화
@@ -40,7 +50,7 @@ class BaseModel:
     
     def execute_query(self, query, params=None):
         """
-        SELECT 쿼리 실행
+        SELECT 쿼리 실행 (연결 풀 모드에서는 읽기 전용 연결 사용)
         
         Args:
             query (str): SQL 쿼리
@@ -57,20 +67,38 @@ class BaseModel:
             self.logger.error(f"쿼리 실행 오류: {e}\nQuery: {query}\nParams: {params}")
             return []
     
-    def execute_update(self, query, params=None):
+    def iter_query(self, query, params=None, batch_size=None):
+        """
+        SELECT 쿼리 스트리밍 실행 (제너레이터)
+        
+        Args:
+            query (str): SQL 쿼리
+            params (tuple, optional): 쿼리 파라미터
+            batch_size (int, optional): fetchmany 크기
+        
+        Yields:
+            sqlite3.Row: 결과 행 (오류 시 순회 중단)
+        """
+        try:
+            yield from self.db.iter_query(query, params, batch_size)
+        except Exception as e:
+            self.logger.error(f"스트리밍 쿼리 오류: {e}\nQuery: {query}\nParams: {params}")
+    
+    def execute_update(self, query, params=None, return_rowcount=False):
         """
-        INSERT/UPDATE/DELETE 쿼리 실행
+        INSERT/UPDATE/DELETE 쿼리 실행 (항상 쓰기 연결 사용)
         
         Args:
             query (str): SQL 쿼리
             params (tuple, optional): 쿼리 파라미터
+            return_rowcount (bool): True면 항상 처리된 행 수 반환 (UPDATE/DELETE 건수 확인용)
         
         Returns:
-            int: lastrowid (INSERT) 또는 rowcount (UPDATE/DELETE)
+            int: lastrowid (INSERT) 또는 rowcount (UPDATE/DELETE, return_rowcount=True)
                  오류 시 None 반환
         """
         try:
-            result = self.db.execute_update(query, params)
+            result = self.db.execute_update(query, params, return_rowcount)
             return result
         except Exception as e:
             self.logger.error(f"업데이트 실행 오류: {e}\nQuery: {query}\nParams: {params}")
@@ -95,6 +123,46 @@ class BaseModel:
             self.logger.error(f"일괄 처리 오류: {e}\nQuery: {query}")
             return 0
     
+    def _require_write(self, result, expected=None, action='쓰기'):
+        """
+        unit_of_work 블록 안 쓰기 결과 확인 (내부 메서드)
+        execute_update/execute_many는 오류를 삼키고 None/0을 반환하므로,
+        실패하면 예외를 던져 블록 전체를 롤백시킴
+        
+        Args:
+            result (int): execute_update / execute_many 반환값
+            expected (int, optional): 기대하는 처리 행 수 (execute_many 건수 확인용)
+            action (str): 예외 메시지에 넣을 작업 이름
+        
+        Returns:
+            int: result
+        
+        Raises:
+            RuntimeError: 실패 (None) 또는 처리 행 수가 expected와 다를 때
+        """
+        if result is None or (expected is not None and result != expected):
+            raise RuntimeError(f"{action} 실패 (처리 {result}행, 기대 {expected}행)")
+        return result
+    
+    @contextmanager
+    def unit_of_work(self):
+        """
+        작업 단위 트랜잭션 컨텍스트
+        블록 안의 모든 쓰기를 한 번에 커밋 (중첩 시 SAVEPOINT)
+        블록 전체(커밋 포함)를 트레이싱 구간으로 기록
+        
+        사용 예:
+            with self.unit_of_work():
+                self.execute_update(...)
+                self.execute_update(...)
+        
+        Yields:
+            DBConnection: DBConnection.transaction()이 반환하는 값
+        """
+        with span(f"{type(self).__name__}.unit_of_work", 'model'):
+            with self.db.transaction() as db:
+                yield db
+    
     def begin_transaction(self):
         """
         트랜잭션 시작
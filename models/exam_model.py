@@ -7,6 +7,7 @@
 - 문제 저장/업데이트
 - 시험 이력 조회
 - 오답 문제 관리
+- 오답 노트 (UPSERT, 자동 해결, 페이지 조회)
 """
 
 import sys
@@ -19,6 +20,7 @@ project_root = os.path.dirname(current_dir)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+import config
 from models.base_model import BaseModel
 from utils.datetime_helper import get_current_datetime
 from utils.validators import validate_exam_settings
@@ -120,12 +122,92 @@ class ExamModel(BaseModel):
         
         if question_id:
             self.logger.debug(
-                f"문제 저장: exam_id={exam_id}, Q{question_number}, "
-                f"정답={'O' if is_correct else 'X'}"
+                "문제 저장: exam_id=%s, Q%s, 정답=%s", exam_id, question_number, 'O' if is_correct else 'X'
             )
         
         return question_id
     
+    def save_exam_questions(self, exam_id, questions):
+        """
+        시험 문제 일괄 저장 (executemany 한 번)
+        
+        Args:
+            exam_id (int): 시험 ID
+            questions (list): [{'word_id', 'question_number', 'correct_answer', 'choices'(선택)}, ...]
+        
+        Returns:
+            dict: {question_number: question_id} (실패 시 빈 dict)
+        """
+        query = """
+            INSERT INTO exam_questions
+                (exam_id, word_id, question_number, correct_answer, is_correct, choices)
+            VALUES (?, ?, ?, ?, 0, ?)
+        """
+        params_list = [
+            (
+                exam_id,
+                question['word_id'],
+                question['question_number'],
+                question['correct_answer'],
+                json.dumps(question['choices'], ensure_ascii=False) if question.get('choices') else None
+            )
+            for question in questions
+        ]
+        
+        count = self.execute_many(query, params_list)
+        if count != len(params_list):
+            self.logger.error(f"문제 일괄 저장 실패: exam_id={exam_id}")
+            return {}
+        
+        rows = self.execute_query(
+            "SELECT question_number, question_id FROM exam_questions WHERE exam_id = ?",
+            (exam_id,)
+        )
+        self.logger.debug(f"문제 일괄 저장: exam_id={exam_id}, {count}문항")
+        return {row['question_number']: row['question_id'] for row in rows}
+    
+    def grade_exam(self, exam_id, answers):
+        """
+        시험 답안 일괄 채점 반영
+        - 답안: executemany UPDATE 한 번
+        - 오답 노트: 이 시험의 오답 단어를 INSERT ... SELECT UPSERT 한 문장으로 반영
+          (config.WRONG_NOTE_AUTO_ADD가 꺼져 있으면 생략)
+        호출자가 트랜잭션(unit_of_work)으로 감싸면 한 번에 커밋
+        
+        Args:
+            exam_id (int): 시험 ID
+            answers (list): [(question_id, user_answer, is_correct), ...]
+        
+        Returns:
+            bool: 성공 여부
+        """
+        query = """
+            UPDATE exam_questions
+            SET user_answer = ?,
+                is_correct = ?
+            WHERE question_id = ?
+        """
+        params_list = [
+            (user_answer, 1 if is_correct else 0, question_id)
+            for question_id, user_answer, is_correct in answers
+        ]
+        
+        if self.execute_many(query, params_list) != len(params_list):
+            self.logger.error(f"답안 일괄 반영 실패: exam_id={exam_id}")
+            return False
+        
+        if not config.WRONG_NOTE_AUTO_ADD:
+            return True
+        
+        result = self.execute_update(
+            self.UPSERT_WRONG_NOTE_QUERY.format(source="""
+                SELECT DISTINCT word_id, exam_id, :wrong_date AS wrong_date FROM exam_questions
+                WHERE exam_id = :exam_id AND is_correct = 0
+            """),
+            {'exam_id': exam_id, 'wrong_date': get_current_datetime()}
+        )
+        return result is not None
+    
     def update_exam_question(self, question_id, user_answer, is_correct, 
                             response_time=None):
         """
@@ -161,6 +243,7 @@ class ExamModel(BaseModel):
     def finish_exam(self, exam_id, score, time_taken):
         """
         시험 종료 및 채점
+        일별 집계(daily_stats)는 exam_history 트리거가 같은 문장에서 증분 갱신
         
         Args:
             exam_id (int): 시험 ID
@@ -311,6 +394,141 @@ class ExamModel(BaseModel):
         
         return result
     
+    # === 오답 노트 ===
+    
+    # 오답 노트 UPSERT (source: word_id, exam_id, 틀린 일시를 내는 SELECT)
+    # - 미해결 노트는 단어당 1행 (부분 UNIQUE 인덱스 idx_wrong_note_unresolved_word)
+    # - 이미 있으면 새 행 대신 wrong_count 증가 + 최근 시험/일시 갱신
+    # - WHERE true: INSERT ... SELECT 뒤 ON CONFLICT 구문 모호성 방지
+    UPSERT_WRONG_NOTE_QUERY = """
+        INSERT INTO wrong_note (word_id, exam_id, added_date, last_wrong_date)
+        SELECT word_id, exam_id, wrong_date, wrong_date
+        FROM ({source})
+        WHERE true
+        ON CONFLICT(word_id) WHERE is_resolved = 0 DO UPDATE SET
+            wrong_count = wrong_count + 1,
+            exam_id = COALESCE(excluded.exam_id, exam_id),
+            last_wrong_date = excluded.last_wrong_date
+    """
+    
+    # 오답 노트 정렬 기준 (부분 인덱스 순서와 같음)
+    WRONG_NOTE_ORDERS = {
+        'recent': "n.last_wrong_date DESC, n.note_id DESC",
+        'frequent': "n.wrong_count DESC, n.last_wrong_date DESC, n.note_id DESC",
+    }
+    
+    def add_to_wrong_note(self, exam_id, word_id):
+        """
+        오답 노트에 추가 (미해결 노트가 있으면 wrong_count 증가)
+        
+        Args:
+            exam_id (int): 시험 ID (시험 외 오답이면 None)
+            word_id (int): 단어 ID
+        
+        Returns:
+            bool: 성공 여부
+        """
+        result = self.execute_update(
+            self.UPSERT_WRONG_NOTE_QUERY.format(source="SELECT :word_id AS word_id, :exam_id AS exam_id, :wrong_date AS wrong_date"),
+            {'word_id': word_id, 'exam_id': exam_id, 'wrong_date': get_current_datetime()}
+        )
+        return result is not None
+    
+    def get_unresolved_wrong_notes(self, limit=None, offset=0, order_by='recent'):
+        """
+        미해결 오답 노트 목록 (페이지 단위)
+        부분 인덱스 순서대로 읽으므로 해결된 과거 기록이 많아도 조회 비용은 페이지 크기에 비례
+        
+        Args:
+            limit (int, optional): 조회 개수 (None이면 전체)
+            offset (int): 건너뛸 개수
+            order_by (str): 'recent' (최근 틀린 순) | 'frequent' (많이 틀린 순)
+        
+        Returns:
+            list: 오답 노트 리스트 (단어 정보 포함)
+        """
+        order_clause = self.WRONG_NOTE_ORDERS.get(order_by, self.WRONG_NOTE_ORDERS['recent'])
+        query = f"""
+            SELECT 
+                n.note_id,
+                n.word_id,
+                n.exam_id,
+                n.wrong_count,
+                n.added_date,
+                n.last_wrong_date,
+                w.english,
+                w.korean,
+                w.memo
+            FROM wrong_note n
+            JOIN words w ON n.word_id = w.word_id
+            WHERE n.is_resolved = 0
+            ORDER BY {order_clause}
+            LIMIT ? OFFSET ?
+        """
+        return self.execute_query(query, (limit if limit else -1, offset))
+    
+    def get_wrong_note_count(self):
+        """
+        미해결 오답 노트 수 (페이지 계산용)
+        
+        Returns:
+            int: 미해결 노트 수
+        """
+        return self.get_count('wrong_note', 'is_resolved = 0')
+    
+    def mark_wrong_note_resolved(self, word_id):
+        """
+        오답 노트 해결 처리 (수동)
+        
+        Args:
+            word_id (int): 단어 ID
+        
+        Returns:
+            bool: 해결된 노트가 있으면 True
+        """
+        query = """
+            UPDATE wrong_note
+            SET is_resolved = 1,
+                resolved_date = ?
+            WHERE word_id = ? AND is_resolved = 0
+        """
+        result = self.execute_update(query, (get_current_datetime(), word_id), return_rowcount=True)
+        return bool(result)
+    
+    def resolve_wrong_notes(self, word_ids):
+        """
+        연속 정답 기준(config.CONSECUTIVE_CORRECT_TO_RESOLVE)을 넘은 단어의 오답 노트 일괄 해결
+        word_statistics 갱신 후 호출 (같은 트랜잭션 권장)
+        
+        Args:
+            word_ids (iterable): 방금 학습한 단어 ID 목록
+        
+        Returns:
+            int: 해결 처리된 노트 수
+        """
+        query = """
+            UPDATE wrong_note
+            SET is_resolved = 1,
+                resolved_date = ?
+            WHERE is_resolved = 0
+            AND word_id IN (
+                SELECT ws.word_id
+                FROM word_statistics ws
+                WHERE ws.word_id IN (SELECT value FROM json_each(?))
+                AND ws.consecutive_correct >= ?
+            )
+        """
+        params = (
+            get_current_datetime(),
+            json.dumps(sorted(set(word_ids))),
+            config.CONSECUTIVE_CORRECT_TO_RESOLVE
+        )
+        result = self.execute_update(query, params, return_rowcount=True) or 0
+        
+        if result:
+            self.logger.info("오답 노트 자동 해결: %d개", result)
+        return result
+    
     def get_exam_statistics(self, exam_id):
         """
         시험 통계 상세
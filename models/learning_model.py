@@ -64,6 +64,7 @@ class LearningModel(BaseModel):
     def end_session(self, session_id, total_words, correct_count, wrong_count):
         """
         세션 종료 및 통계 업데이트
+        일별 집계(daily_stats)는 learning_sessions 트리거가 같은 문장에서 증분 갱신
         
         Args:
             session_id (int): 세션 ID
@@ -152,8 +153,7 @@ class LearningModel(BaseModel):
         
         if history_id:
             self.logger.debug(
-                f"학습 이력 추가: word_id={word_id}, "
-                f"정답={is_correct}, 모드={study_mode}"
+                "학습 이력 추가: word_id=%s, 정답=%s, 모드=%s", word_id, is_correct, study_mode
             )
         
         return history_id
@@ -182,6 +182,29 @@ class LearningModel(BaseModel):
         result = self.execute_query(query, (session_id,))
         return result
     
+    def iter_session_history(self, session_id, batch_size=None):
+        """
+        특정 세션의 학습 이력 스트리밍 조회 (get_session_history의 제너레이터 버전)
+        
+        Args:
+            session_id (int): 세션 ID
+            batch_size (int, optional): fetchmany 크기
+        
+        Yields:
+            sqlite3.Row: 학습 이력 행 (단어 정보 포함)
+        """
+        query = """
+            SELECT 
+                lh.*,
+                w.english,
+                w.korean
+            FROM learning_history lh
+            JOIN words w ON lh.word_id = w.word_id
+            WHERE lh.session_id = ?
+            ORDER BY lh.history_id
+        """
+        yield from self.iter_query(query, (session_id,), batch_size)
+    
     def get_session_info(self, session_id):
         """
         세션 정보 조회
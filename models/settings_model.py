@@ -6,10 +6,12 @@
 - 설정 조회/변경
 - 타입 변환
 - 기본값 초기화
+- 설정 캐시 (write-through) 및 변경 리스너
 """
 
 import sys
 import os
+import threading
 
 # 프로젝트 루트를 sys.path에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -26,97 +28,178 @@ class SettingsModel(BaseModel):
     """
     설정 모델 클래스
     user_settings 테이블 관리
+    
+    설정 캐시:
+    - 전체 설정을 처음 조회할 때 한 번 읽어 타입 변환한 값으로 보관 (모든 인스턴스 공유)
+    - 변경/추가/삭제는 DB에 쓴 뒤 캐시에 바로 반영 (write-through)
+    - DB 연결이 바뀌면(테스트 등) 다시 읽음
+    - 변경 리스너: listener(key, old_value, new_value) (삭제 시 new_value는 None)
     """
     
-    def get_setting(self, key):
+    # 기본값 정의 (init_data.sql과 동일)
+    DEFAULT_SETTINGS = {
+        'daily_word_goal': '50',
+        'daily_time_goal': '30',
+        'flashcard_time_limit': '0',
+        'exam_time_limit': '0',
+        'question_time_limit': '30',
+        'theme_mode': 'light',
+        'font_size': '14',
+        'show_pronunciation': 'false',
+        'auto_save_enabled': 'true',
+        'auto_backup_enabled': 'true'
+    }
+    
+    # 프로세스 공유 캐시 {key: (설정 행 dict, 변환된 값)}
+    _cache = None
+    _cache_db = None
+    _cache_lock = threading.RLock()
+    _listeners = []
+    
+    # === 캐시 ===
+    
+    def load_cache(self):
         """
-        설정 값 조회 (타입 변환 적용)
-        
-        Args:
-            key (str): 설정 키
+        설정 캐시 (다시) 읽기
         
         Returns:
-            타입 변환된 값 또는 None (없으면)
+            int: 읽은 설정 수
         """
-        query = "SELECT * FROM user_settings WHERE setting_key = ?"
-        result = self.execute_query(query, (key,))
+        query = "SELECT * FROM user_settings ORDER BY setting_key"
+        rows = self.execute_query(query)
         
-        if not result:
-            self.logger.warning(f"설정 키 없음: {key}")
-            return None
+        with self._cache_lock:
+            SettingsModel._cache = {
+                row['setting_key']: (row, self._convert_type(row['setting_value'], row['setting_type']))
+                for row in rows
+            }
+            SettingsModel._cache_db = self.db
         
-        setting = result[0]
-        value = setting['setting_value']
-        setting_type = setting['setting_type']
+        self.logger.debug("설정 캐시 로드: %d개", len(rows))
+        return len(rows)
+    
+    def reload_cache(self):
+        """
+        DB 내용이 통째로 바뀐 뒤(백업 복원 등) 설정 캐시 다시 읽기
+        값이 달라진 설정은 리스너 호출 (캐시를 아직 읽지 않았으면 다음 조회 때 읽음)
         
-        # 타입 변환
-        converted_value = self._convert_type(value, setting_type)
+        Returns:
+            int: 값이 달라진 설정 수
+        """
+        with self._cache_lock:
+            if SettingsModel._cache is None:
+                return 0
+            old_values = {key: value for key, (_, value) in SettingsModel._cache.items()}
+            self.load_cache()
+            new_values = {key: value for key, (_, value) in SettingsModel._cache.items()}
+        
+        changed = [key for key in sorted(old_values.keys() | new_values.keys())
+                   if old_values.get(key) != new_values.get(key)]
+        for key in changed:
+            self._notify(key, old_values.get(key), new_values.get(key))
+        return len(changed)
+    
+    def _settings(self):
+        """
+        설정 캐시 반환 (없거나 다른 DB 연결이면 먼저 읽음) (내부 메서드)
         
-        return converted_value
+        Returns:
+            dict: {key: (설정 행 dict, 변환된 값)}
+        """
+        with self._cache_lock:
+            if SettingsModel._cache is None or SettingsModel._cache_db is not self.db:
+                self.load_cache()
+            return SettingsModel._cache
     
-    def set_setting(self, key, value):
+    def _cache_put(self, key, row):
         """
-        설정 값 변경
+        캐시에 설정 반영 후 리스너 호출 (내부 메서드)
         
         Args:
             key (str): 설정 키
-            value: 설정 값
+            row (dict): 설정 행 (None이면 삭제)
+        """
+        with self._cache_lock:
+            cache = self._settings()
+            old_value = cache[key][1] if key in cache else None
+            
+            if row is None:
+                cache.pop(key, None)
+                new_value = None
+            else:
+                new_value = self._convert_type(row['setting_value'], row['setting_type'])
+                cache[key] = (row, new_value)
+        
+        if old_value != new_value:
+            self._notify(key, old_value, new_value)
+    
+    def add_listener(self, listener):
+        """
+        설정 변경 리스너 등록
         
-        Returns:
-            bool: 성공 여부
+        Args:
+            listener (callable): listener(key, old_value, new_value)
+        """
+        with self._cache_lock:
+            if listener not in SettingsModel._listeners:
+                SettingsModel._listeners.append(listener)
+    
+    def remove_listener(self, listener):
         """
-        # 설정 존재 확인
-        query = "SELECT setting_type FROM user_settings WHERE setting_key = ?"
-        result = self.execute_query(query, (key,))
+        설정 변경 리스너 해제
         
-        if not result:
-            self.logger.warning(f"설정 키 없음: {key}")
-            return False
+        Args:
+            listener (callable): 등록한 리스너
+        """
+        with self._cache_lock:
+            if listener in SettingsModel._listeners:
+                SettingsModel._listeners.remove(listener)
+    
+    def _notify(self, key, old_value, new_value):
+        """
+        리스너 호출 (리스너 오류는 기록만 하고 계속) (내부 메서드)
         
-        setting_type = result[0]['setting_type']
+        Args:
+            key (str): 설정 키
+            old_value: 이전 값
+            new_value: 새 값
+        """
+        for listener in list(SettingsModel._listeners):
+            try:
+                listener(key, old_value, new_value)
+            except Exception as e:
+                self.logger.error("설정 리스너 오류 (%s): %s", key, e, exc_info=True)
+    
+    # === 조회 ===
+    
+    def get_setting(self, key):
+        """
+        설정 값 조회 (타입 변환 적용, 캐시)
         
-        # 값 검증
-        is_valid, error_msg = validate_setting_value(key, str(value), setting_type)
-        if not is_valid:
-            self.logger.warning(f"설정 값 검증 실패: {error_msg}")
-            return False
+        Args:
+            key (str): 설정 키
         
-        # 값 업데이트
-        update_query = """
-            UPDATE user_settings 
-            SET setting_value = ?, modified_date = ?
-            WHERE setting_key = ?
+        Returns:
+            타입 변환된 값 또는 None (없으면)
         """
-        params = (str(value), get_current_datetime(), key)
+        setting = self._settings().get(key)
         
-        result = self.execute_update(update_query, params)
+        if setting is None:
+            self.logger.warning(f"설정 키 없음: {key}")
+            return None
         
-        if result and result > 0:
-            self.logger.info(f"설정 변경: {key} = {value}")
-            return True
-        else:
-            return False
+        return setting[1]
     
     def get_all_settings(self):
         """
-        전체 설정 조회 (타입 변환 적용)
+        전체 설정 조회 (타입 변환 적용, 캐시)
         
         Returns:
             dict: {key: value} 형태의 설정 딕셔너리
         """
-        query = "SELECT * FROM user_settings ORDER BY setting_key"
-        result = self.execute_query(query)
+        settings = {key: value for key, (_, value) in sorted(self._settings().items())}
         
-        settings = {}
-        for row in result:
-            key = row['setting_key']
-            value = row['setting_value']
-            setting_type = row['setting_type']
-            
-            # 타입 변환
-            settings[key] = self._convert_type(value, setting_type)
-        
-        self.logger.info(f"전체 설정 조회: {len(settings)}개")
+        self.logger.debug("전체 설정 조회: %d개", len(settings))
         return settings
     
     def get_settings_by_type(self, setting_type):
@@ -129,57 +212,130 @@ class SettingsModel(BaseModel):
         Returns:
             dict: {key: value} 형태의 설정 딕셔너리
         """
-        query = "SELECT * FROM user_settings WHERE setting_type = ? ORDER BY setting_key"
-        result = self.execute_query(query, (setting_type,))
+        return {
+            key: value for key, (row, value) in sorted(self._settings().items())
+            if row['setting_type'] == setting_type
+        }
+    
+    def get_setting_info(self, key):
+        """
+        설정 상세 정보 조회 (타입, 설명 포함)
+        
+        Args:
+            key (str): 설정 키
+        
+        Returns:
+            dict: 설정 정보 또는 None
+        """
+        setting = self._settings().get(key)
+        return dict(setting[0]) if setting else None
+    
+    # === 변경 ===
+    
+    def validate_settings(self, settings_dict):
+        """
+        여러 설정 값 검증 (쓰기 없음)
         
-        settings = {}
-        for row in result:
-            key = row['setting_key']
-            value = row['setting_value']
-            settings[key] = self._convert_type(value, setting_type)
+        Args:
+            settings_dict (dict): {key: value, ...}
         
-        return settings
+        Returns:
+            dict: {실패한 키: 오류 메시지} (모두 유효하면 빈 dict)
+        """
+        cache = self._settings()
+        errors = {}
+        
+        for key, value in settings_dict.items():
+            if key not in cache:
+                errors[key] = f"설정 키 없음: {key}"
+                continue
+            
+            is_valid, error_msg = validate_setting_value(key, str(value), cache[key][0]['setting_type'])
+            if not is_valid:
+                errors[key] = error_msg
+        
+        return errors
+    
+    def set_setting(self, key, value):
+        """
+        설정 값 변경
+        
+        Args:
+            key (str): 설정 키
+            value: 설정 값
+        
+        Returns:
+            bool: 성공 여부
+        """
+        return self.set_settings({key: value})
+    
+    def set_settings(self, settings_dict):
+        """
+        여러 설정 값 변경 (모두 검증한 뒤 하나의 트랜잭션으로 저장)
+        하나라도 유효하지 않으면 아무것도 바꾸지 않음
+        
+        Args:
+            settings_dict (dict): {key: value, ...}
+        
+        Returns:
+            bool: 성공 여부
+        """
+        errors = self.validate_settings(settings_dict)
+        if errors:
+            for key, error_msg in errors.items():
+                self.logger.warning(f"설정 값 검증 실패: {error_msg}")
+            return False
+        
+        modified_date = get_current_datetime()
+        params_list = [(str(value), modified_date, key) for key, value in settings_dict.items()]
+        update_query = """
+            UPDATE user_settings 
+            SET setting_value = ?, modified_date = ?
+            WHERE setting_key = ?
+        """
+        
+        # execute_many는 오류 시 0을 반환하므로 건수가 다르면 예외로 롤백 (캐시도 그대로)
+        try:
+            with self.unit_of_work():
+                self._require_write(
+                    self.db.execute_many(update_query, params_list), len(params_list), '설정 변경'
+                )
+        except Exception as e:
+            self.logger.error(f"설정 변경 실패: {e}")
+            return False
+        
+        # 커밋된 뒤에만 캐시 반영
+        cache = self._settings()
+        for value, _, key in params_list:
+            row = dict(cache[key][0], setting_value=value, modified_date=modified_date)
+            self._cache_put(key, row)
+            self.logger.info(f"설정 변경: {key} = {value}")
+        
+        return True
     
     def reset_to_default(self, key=None):
         """
         기본값으로 초기화
         
         Args:
-            key (str, optional): 설정 키. None이면 전체 초기화
+            key (str, optional): 설정 키. None이면 전체 초기화 (하나의 트랜잭션)
         
         Returns:
             bool: 성공 여부
         """
-        # 기본값 정의 (init_data.sql과 동일)
-        default_settings = {
-            'daily_word_goal': '50',
-            'daily_time_goal': '30',
-            'flashcard_time_limit': '0',
-            'exam_time_limit': '0',
-            'question_time_limit': '30',
-            'theme_mode': 'light',
-            'font_size': '14',
-            'show_pronunciation': 'false',
-            'auto_save_enabled': 'true',
-            'auto_backup_enabled': 'true'
-        }
-        
         if key:
             # 특정 키만 초기화
-            if key not in default_settings:
+            if key not in self.DEFAULT_SETTINGS:
                 self.logger.warning(f"기본값 없음: {key}")
                 return False
             
-            return self.set_setting(key, default_settings[key])
-        else:
-            # 전체 초기화
-            success_count = 0
-            for k, v in default_settings.items():
-                if self.set_setting(k, v):
-                    success_count += 1
-            
-            self.logger.info(f"설정 초기화 완료: {success_count}개")
-            return success_count == len(default_settings)
+            return self.set_setting(key, self.DEFAULT_SETTINGS[key])
+        
+        # 전체 초기화
+        success = self.set_settings(self.DEFAULT_SETTINGS)
+        if success:
+            self.logger.info(f"설정 초기화 완료: {len(self.DEFAULT_SETTINGS)}개")
+        return success
     
     def add_setting(self, key, value, setting_type, description=None):
         """
@@ -195,7 +351,7 @@ class SettingsModel(BaseModel):
             bool: 성공 여부
         """
         # 중복 확인
-        if self.get_setting(key) is not None:
+        if key in self._settings():
             self.logger.warning(f"설정 키 중복: {key}")
             return False
         
@@ -216,6 +372,8 @@ class SettingsModel(BaseModel):
         result = self.execute_update(query, params)
         
         if result:
+            row = dict(zip(('setting_key', 'setting_value', 'setting_type', 'description', 'modified_date'), params))
+            self._cache_put(key, dict(row, setting_id=result))
             self.logger.info(f"설정 추가: {key} = {value}")
             return True
         else:
@@ -231,29 +389,20 @@ class SettingsModel(BaseModel):
         Returns:
             bool: 성공 여부
         """
+        if key not in self._settings():
+            self.logger.warning(f"설정 삭제 실패: {key} (존재하지 않음)")
+            return False
+        
         query = "DELETE FROM user_settings WHERE setting_key = ?"
         result = self.execute_update(query, (key,))
         
-        if result and result > 0:
-            self.logger.info(f"설정 삭제: {key}")
-            return True
-        else:
-            self.logger.warning(f"설정 삭제 실패: {key} (존재하지 않음)")
+        if result is None:
+            self.logger.warning(f"설정 삭제 실패: {key}")
             return False
-    
-    def get_setting_info(self, key):
-        """
-        설정 상세 정보 조회 (타입, 설명 포함)
-        
-        Args:
-            key (str): 설정 키
         
-        Returns:
-            dict: 설정 정보 또는 None
-        """
-        query = "SELECT * FROM user_settings WHERE setting_key = ?"
-        result = self.execute_query(query, (key,))
-        return result[0] if result else None
+        self._cache_put(key, None)
+        self.logger.info(f"설정 삭제: {key}")
+        return True
     
     def _convert_type(self, value, setting_type):
         """
@@ -339,6 +488,14 @@ if __name__ == "__main__":
         reset_value = model.get_setting('daily_word_goal')
         print(f"✓ daily_word_goal 초기화: {reset_value}")
     
+    # 변경 리스너
+    print("\n[변경 리스너]")
+    listener = lambda key, old, new: print(f"  → {key}: {old} → {new}")
+    model.add_listener(listener)
+    model.set_settings({'daily_word_goal': 70, 'font_size': 16})
+    model.reset_to_default()
+    model.remove_listener(listener)
+    
     # 새 설정 추가 테스트
     print("\n[새 설정 추가]")
     success = model.add_setting('test_setting', 'test_value', 'string', '테스트 설정')
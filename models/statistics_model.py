@@ -4,13 +4,14 @@
 """
 학습 통계 관리
 - 단어별 통계 조회/업데이트
-- 일일/주간 통계
+- 일일/주간 통계 (daily_stats 집계 테이블)
 - 개인화 점수 계산
 - 숙지도 관리
 """
 
 import sys
 import os
+import json
 
 # 프로젝트 루트를 sys.path에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -19,7 +20,9 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from models.base_model import BaseModel
-from utils.datetime_helper import get_current_datetime, get_today_start_end, calculate_days_between, parse_datetime
+from database.migrations import DAILY_STATS_REBUILD_QUERIES
+from utils.datetime_helper import get_current_datetime, get_today_start_end, parse_datetime
+from utils.review_scheduler import get_scheduler
 import config
 
 
@@ -43,9 +46,56 @@ class StatisticsModel(BaseModel):
         result = self.execute_query(query, (word_id,))
         return result[0] if result else None
     
+    # 학습 결과 1건 반영 UPSERT
+    # - 통계 행이 없으면 첫 시도 값으로 INSERT, 있으면 기존 행 기준으로 한 문장에서 갱신
+    # - DO UPDATE의 컬럼은 갱신 전 값, excluded.*는 INSERT하려던 값
+    #   (excluded.correct_count = 정답 1 / 오답 0, excluded.wrong_count = 그 반대)
+    # - 숙지도 규칙은 _calculate_mastery_level과 동일
+    UPSERT_STATISTICS_QUERY = """
+        INSERT INTO word_statistics (
+            word_id, total_attempts, correct_count, wrong_count, wrong_rate,
+            last_study_date, mastery_level, consecutive_correct
+        )
+        VALUES (
+            :word_id, 1, :correct, 1 - :correct, (1 - :correct) * 100.0,
+            :study_date, :first_level, :correct
+        )
+        ON CONFLICT(word_id) DO UPDATE SET
+            total_attempts = total_attempts + 1,
+            correct_count = correct_count + excluded.correct_count,
+            wrong_count = wrong_count + excluded.wrong_count,
+            wrong_rate = ROUND((wrong_count + excluded.wrong_count) * 100.0 / (total_attempts + 1), 2),
+            last_study_date = excluded.last_study_date,
+            consecutive_correct = CASE
+                WHEN excluded.correct_count = 1 THEN consecutive_correct + 1
+                ELSE 0
+            END,
+            mastery_level = CASE
+                WHEN excluded.correct_count = 1 AND consecutive_correct + 1 >= :level_up
+                    THEN MIN(mastery_level + 1, 5)
+                WHEN (wrong_count + excluded.wrong_count) * 100.0 / (total_attempts + 1) > 50
+                    AND mastery_level > 0
+                    THEN mastery_level - 1
+                ELSE mastery_level
+            END
+    """
+    
+    # 복습 일정 갱신 (스케줄러 계산 결과)
+    UPDATE_REVIEW_QUERY = """
+        UPDATE word_statistics
+        SET next_review_date = :next_review_date,
+            review_interval = :review_interval,
+            ease_factor = :ease_factor,
+            repetition = :repetition,
+            stability = :stability,
+            difficulty = :difficulty
+        WHERE word_id = :word_id
+    """
+    
     def update_word_statistics(self, word_id, is_correct):
         """
         단어 통계 업데이트 (학습 후 호출)
+        통계는 UPSERT 한 문장으로 원자적으로 갱신, 같은 트랜잭션에서 다음 복습일도 계산
         
         Args:
             word_id (int): 단어 ID
@@ -54,66 +104,146 @@ class StatisticsModel(BaseModel):
         Returns:
             bool: 성공 여부
         """
-        # 현재 통계 조회
-        stats = self.get_word_statistics(word_id)
+        try:
+            count = self._apply_study_results([(word_id, is_correct)])
+        except Exception as e:
+            self.logger.error(f"통계 업데이트 실패: word_id={word_id}, {e}")
+            return False
         
-        if not stats:
-            # 통계가 없으면 초기화
-            self.initialize_word_statistics(word_id)
-            stats = self.get_word_statistics(word_id)
+        if count:
+            self.logger.info("통계 업데이트: word_id=%s, 정답=%s", word_id, is_correct)
+            return True
+        else:
+            return False
+    
+    def update_word_statistics_batch(self, results):
+        """
+        여러 학습 결과를 한 트랜잭션으로 반영 (시험 채점 등)
+        같은 단어가 여러 번 있으면 순서대로 누적
         
-        # 통계 계산
-        total_attempts = stats['total_attempts'] + 1
+        Args:
+            results (iterable): [(word_id, is_correct), ...]
         
-        if is_correct:
-            correct_count = stats['correct_count'] + 1
-            wrong_count = stats['wrong_count']
-            consecutive_correct = stats['consecutive_correct'] + 1
-        else:
-            correct_count = stats['correct_count']
-            wrong_count = stats['wrong_count'] + 1
-            consecutive_correct = 0
-        
-        # 오답률 계산
-        wrong_rate = (wrong_count / total_attempts * 100) if total_attempts > 0 else 0.0
-        
-        # 숙지도 자동 조정
-        mastery_level = self._calculate_mastery_level(
-            stats['mastery_level'],
-            consecutive_correct,
-            wrong_rate
-        )
+        Returns:
+            int: 반영된 결과 수
+        """
+        results = list(results)
+        if not results:
+            return 0
+        
+        try:
+            count = self._apply_study_results(results)
+        except Exception as e:
+            self.logger.error(f"통계 일괄 업데이트 실패: {e}")
+            return 0
+        
+        self.logger.info("통계 일괄 업데이트: %d건", count)
+        return count
+    
+    def _apply_study_results(self, results):
+        """
+        학습 결과 반영 (내부 메서드)
+        1. 복습 상태 조회 (갱신 전 last_study_date가 필요하므로 UPSERT보다 먼저)
+        2. 통계 UPSERT
+        3. 스케줄러로 다음 복습일 계산 후 일괄 UPDATE
+        한 트랜잭션 안에서 실행하므로 조회한 상태와 갱신 사이에 다른 쓰기가 끼어들지 않음
+        
+        Args:
+            results (list): [(word_id, is_correct), ...]
+        
+        Returns:
+            int: 반영된 결과 수
+        
+        Raises:
+            RuntimeError: 통계/복습 일정 쓰기 실패 (트랜잭션 전체 롤백)
+        """
+        study_date = get_current_datetime()
+        params_list = [
+            self._build_statistics_params(word_id, is_correct, study_date)
+            for word_id, is_correct in results
+        ]
+        
+        # execute_many는 오류 시 0을 반환하므로 건수가 다르면 예외로 전체 롤백
+        with self.unit_of_work():
+            states = self._get_review_states({word_id for word_id, _ in results})
+            count = self._require_write(
+                self.db.execute_many(self.UPSERT_STATISTICS_QUERY, params_list),
+                len(params_list), '통계 UPSERT'
+            )
+            review_params = self._schedule_reviews(results, states, study_date)
+            self._require_write(
+                self.db.execute_many(self.UPDATE_REVIEW_QUERY, review_params),
+                len(review_params), '복습 일정 갱신'
+            )
+        
+        return count
+    
+    def _get_review_states(self, word_ids):
+        """
+        단어별 복습 상태 조회 (내부 메서드)
         
-        # 업데이트
+        Args:
+            word_ids (iterable): 단어 ID 목록
+        
+        Returns:
+            dict: {word_id: 상태 dict} (통계 행이 없는 단어는 제외)
+        """
         query = """
-            UPDATE word_statistics
-            SET total_attempts = ?,
-                correct_count = ?,
-                wrong_count = ?,
-                wrong_rate = ?,
-                last_study_date = ?,
-                mastery_level = ?,
-                consecutive_correct = ?
-            WHERE word_id = ?
+            SELECT word_id, last_study_date, review_interval, ease_factor,
+                   repetition, stability, difficulty
+            FROM word_statistics
+            WHERE word_id IN (SELECT value FROM json_each(?))
         """
-        params = (
-            total_attempts,
-            correct_count,
-            wrong_count,
-            round(wrong_rate, 2),
-            get_current_datetime(),
-            mastery_level,
-            consecutive_correct,
-            word_id
-        )
+        rows = self.db.execute_query(query, (json.dumps(sorted(word_ids)),))
+        return {row['word_id']: dict(row) for row in rows}
+    
+    def _schedule_reviews(self, results, states, study_date):
+        """
+        결과 순서대로 다음 복습 일정 계산 (내부 메서드)
+        같은 단어가 여러 번 나오면 직전 계산 결과를 이어서 사용
         
-        result = self.execute_update(query, params)
+        Args:
+            results (list): [(word_id, is_correct), ...]
+            states (dict): _get_review_states 결과 (계산 중 갱신됨)
+            study_date (str): 학습 일시
         
-        if result and result > 0:
-            self.logger.info(f"통계 업데이트: word_id={word_id}, 정답={is_correct}, 숙지도={mastery_level}")
-            return True
-        else:
-            return False
+        Returns:
+            list: UPDATE_REVIEW_QUERY 파라미터 리스트 (단어당 1건, 최종 상태)
+        """
+        scheduler = get_scheduler()
+        now = parse_datetime(study_date)
+        scheduled = {}
+        
+        for word_id, is_correct in results:
+            state = states.get(word_id, {})
+            new_state = scheduler.schedule(state, is_correct, now)
+            new_state['last_study_date'] = study_date
+            states[word_id] = new_state
+            scheduled[word_id] = dict(new_state, word_id=word_id)
+        
+        return list(scheduled.values())
+    
+    def _build_statistics_params(self, word_id, is_correct, study_date):
+        """
+        UPSERT_STATISTICS_QUERY 파라미터 생성 (내부 메서드)
+        
+        Args:
+            word_id (int): 단어 ID
+            is_correct (bool): 정답 여부
+            study_date (str): 학습 일시
+        
+        Returns:
+            dict: 이름 있는 파라미터
+        """
+        correct = 1 if is_correct else 0
+        return {
+            'word_id': word_id,
+            'correct': correct,
+            'study_date': study_date,
+            # 통계 행이 없을 때(첫 시도)의 숙지도
+            'first_level': self._calculate_mastery_level(0, correct, (1 - correct) * 100.0),
+            'level_up': config.MASTERY_LEVEL_UP_CONSECUTIVE
+        }
     
     def initialize_word_statistics(self, word_id):
         """
@@ -139,7 +269,7 @@ class StatisticsModel(BaseModel):
     
     def get_daily_statistics(self, date):
         """
-        특정 날짜의 학습 통계
+        특정 날짜의 학습 통계 (daily_stats 집계 테이블 조회)
         
         Args:
             date (str): ISO 8601 형식 날짜
@@ -147,42 +277,33 @@ class StatisticsModel(BaseModel):
         Returns:
             dict: {'total_words': 50, 'study_time': 25, 'accuracy': 80.0, 'sessions': 3}
         """
-        # 해당 날짜의 시작/종료 시간 계산
         date_obj = parse_datetime(date)
         if not date_obj:
             return None
         
-        start = date_obj.replace(hour=0, minute=0, second=0).strftime(config.ISO8601_FORMAT)
-        end = date_obj.replace(hour=23, minute=59, second=59).strftime(config.ISO8601_FORMAT)
-        
-        # 학습 세션 통계
         query = """
             SELECT 
-                COUNT(*) as session_count,
+                SUM(sessions) as session_count,
                 SUM(total_words) as total_words,
                 SUM(correct_count) as correct_count,
                 SUM(wrong_count) as wrong_count,
-                AVG(accuracy_rate) as avg_accuracy
-            FROM learning_sessions
-            WHERE start_time >= ? AND start_time <= ?
+                SUM(accuracy_sum) as accuracy_sum,
+                SUM(study_seconds) as study_seconds
+            FROM daily_stats
+            WHERE stat_date = ?
         """
-        result = self.execute_query(query, (start, end))
+        result = self.execute_query(query, (date_obj.strftime('%Y-%m-%d'),))
         
         if result and result[0]['total_words']:
             data = result[0]
-            return {
-                'total_words': data['total_words'] or 0,
-                'correct_count': data['correct_count'] or 0,
-                'wrong_count': data['wrong_count'] or 0,
-                'accuracy': round(data['avg_accuracy'] or 0.0, 2),
-                'sessions': data['session_count'] or 0
-            }
+            return self._format_daily_row(data)
         else:
             return {
                 'total_words': 0,
                 'correct_count': 0,
                 'wrong_count': 0,
                 'accuracy': 0.0,
+                'study_time': 0,
                 'sessions': 0
             }
     
@@ -197,7 +318,7 @@ class StatisticsModel(BaseModel):
     
     def get_weekly_statistics(self, start_date, end_date):
         """
-        주간 학습 통계
+        주간 학습 통계 (daily_stats 집계 테이블 조회, 기간 내 날짜 수만큼만 읽음)
         
         Args:
             start_date (str): 시작 날짜
@@ -208,15 +329,18 @@ class StatisticsModel(BaseModel):
         """
         query = """
             SELECT 
-                DATE(start_time) as date,
-                COUNT(*) as session_count,
+                stat_date as date,
+                SUM(sessions) as session_count,
                 SUM(total_words) as total_words,
                 SUM(correct_count) as correct_count,
-                AVG(accuracy_rate) as avg_accuracy
-            FROM learning_sessions
-            WHERE start_time >= ? AND start_time <= ?
-            GROUP BY DATE(start_time)
-            ORDER BY date
+                SUM(wrong_count) as wrong_count,
+                SUM(accuracy_sum) as accuracy_sum,
+                SUM(study_seconds) as study_seconds
+            FROM daily_stats
+            WHERE stat_date >= date(?) AND stat_date <= date(?)
+            GROUP BY stat_date
+            HAVING SUM(sessions) > 0
+            ORDER BY stat_date
         """
         
         result = self.execute_query(query, (start_date, end_date))
@@ -224,16 +348,106 @@ class StatisticsModel(BaseModel):
         # 결과 포맷팅
         stats = []
         for row in result:
-            stats.append({
-                'date': row['date'],
-                'total_words': row['total_words'] or 0,
-                'correct_count': row['correct_count'] or 0,
-                'accuracy': round(row['avg_accuracy'] or 0.0, 2),
-                'sessions': row['session_count'] or 0
-            })
+            stats.append(dict(self._format_daily_row(row), date=row['date']))
         
         return stats
     
+    def get_streak_summary(self, today=None):
+        """
+        연속 학습 기록 (현재/최장 연속 일수 및 연속 구간 이력)
+        학습한 날짜(daily_stats)를 날짜 - 순번으로 묶는 gaps-and-islands 쿼리 1회로 계산
+        - 연속된 날짜는 julianday(날짜) - ROW_NUMBER()가 같은 값
+        - 현재 연속 일수: 오늘로 끝나는 구간 (오늘 학습하지 않았으면 0)
+        
+        Args:
+            today (str, optional): 기준 날짜 (기본: 오늘)
+        
+        Returns:
+            dict: {
+                'current_streak': 7,
+                'longest_streak': 30,
+                'streaks': [{'start_date': '2026-10-11', 'end_date': '2026-10-17', 'days': 7}, ...]  # 최근 순
+            }
+        """
+        today_obj = parse_datetime(today or get_current_datetime())
+        today_date = today_obj.strftime('%Y-%m-%d')
+        
+        query = """
+            WITH study_days AS (
+                SELECT stat_date
+                FROM daily_stats
+                WHERE stat_date <= ?
+                GROUP BY stat_date
+                HAVING SUM(total_words) > 0
+            ),
+            islands AS (
+                SELECT
+                    stat_date,
+                    julianday(stat_date) - ROW_NUMBER() OVER (ORDER BY stat_date) as island
+                FROM study_days
+            )
+            SELECT
+                MIN(stat_date) as start_date,
+                MAX(stat_date) as end_date,
+                COUNT(*) as days
+            FROM islands
+            GROUP BY island
+            ORDER BY start_date DESC
+        """
+        streaks = self.execute_query(query, (today_date,))
+        
+        current_streak = 0
+        if streaks and streaks[0]['end_date'] == today_date:
+            current_streak = streaks[0]['days']
+        
+        return {
+            'current_streak': current_streak,
+            'longest_streak': max((streak['days'] for streak in streaks), default=0),
+            'streaks': streaks
+        }
+    
+    def rebuild_daily_stats(self):
+        """
+        daily_stats 집계 테이블 재구성 (원본 세션/시험 기록에서 다시 집계)
+        
+        Returns:
+            int: 집계된 (날짜, 세션 타입) 행 수 (실패 시 None)
+        """
+        try:
+            with self.unit_of_work():
+                # execute_update는 오류 시 None을 반환하므로 예외로 바꿔 DELETE까지 롤백
+                for query in DAILY_STATS_REBUILD_QUERIES:
+                    self._require_write(self.db.execute_update(query), action='일별 통계 재집계')
+            
+            count = self.execute_query("SELECT COUNT(*) as count FROM daily_stats")[0]['count']
+            self.logger.info(f"일별 통계 재집계 완료: {count}행")
+            return count
+        except Exception as e:
+            self.logger.error(f"일별 통계 재집계 실패: {e}")
+            return None
+    
+    def _format_daily_row(self, row):
+        """
+        daily_stats 합계 행을 통계 dict로 변환 (내부 메서드)
+        정답률은 세션별 정답률의 평균
+        
+        Args:
+            row (dict): SUM 집계 행
+        
+        Returns:
+            dict: 통계 정보
+        """
+        sessions = row['session_count'] or 0
+        accuracy = (row['accuracy_sum'] or 0.0) / sessions if sessions > 0 else 0.0
+        return {
+            'total_words': row['total_words'] or 0,
+            'correct_count': row['correct_count'] or 0,
+            'wrong_count': row['wrong_count'] or 0,
+            'accuracy': round(accuracy, 2),
+            'study_time': round((row['study_seconds'] or 0) / 60),
+            'sessions': sessions
+        }
+    
     def get_top_wrong_words(self, limit=20):
         """
         오답률 높은 단어 Top N
@@ -261,7 +475,7 @@ class StatisticsModel(BaseModel):
         """
         
         result = self.execute_query(query, (limit,))
-        self.logger.info(f"오답률 Top {limit} 조회: {len(result)}개")
+        self.logger.info("오답률 Top %s 조회: %d개", limit, len(result))
         return result
     
     def get_mastery_distribution(self):
@@ -294,7 +508,7 @@ class StatisticsModel(BaseModel):
     
     def calculate_personalization_score(self, word_id):
         """
-        개인화 우선순위 점수 계산
+        개인화 우선순위 점수 계산 (단어 1개)
         
         Args:
             word_id (int): 단어 ID
@@ -302,29 +516,105 @@ class StatisticsModel(BaseModel):
         Returns:
             float: 우선순위 점수 (높을수록 우선 출제)
         """
-        stats = self.get_word_statistics(word_id)
+        score_expr, params = self._build_personalization_score_expr()
+        query = f"""
+            SELECT {score_expr} as score
+            FROM words w
+            LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
+            WHERE w.word_id = ?
+        """
+        result = self.execute_query(query, params + (word_id,))
         
-        if not stats or stats['total_attempts'] == 0:
+        if not result:
             # 미학습 단어는 중간 우선순위
             return 50.0
         
-        # 마지막 학습일로부터 경과 일수
-        if stats['last_study_date']:
-            days_since = calculate_days_between(stats['last_study_date'], get_current_datetime())
-        else:
-            days_since = 999  # 매우 오래됨
+        return result[0]['score']
+    
+    def get_personalized_words(self, limit=None, filter_favorite=False):
+        """
+        개인화 우선순위 순 단어 목록 (점수 계산/정렬/상위 N개를 SQL 한 번으로)
         
-        # 가중치 적용 점수 계산
-        weights = config.PERSONALIZATION_WEIGHTS
+        Args:
+            limit (int, optional): 조회 개수
+            filter_favorite (bool): 즐겨찾기만 조회
         
-        score = (
-            stats['wrong_rate'] * weights['wrong_rate'] +
-            min(days_since, 30) * weights['days_since_last_study'] +  # 최대 30일
-            (5 - stats['mastery_level']) * 20 * weights['mastery_level'] +
-            min(stats['wrong_count'], 10) * 10 * weights['wrong_count']  # 최대 10회
-        )
+        Returns:
+            list: 단어 리스트 (get_all_words 컬럼 + personalization_score, 점수 높은 순)
+        """
+        score_expr, params = self._build_personalization_score_expr()
+        query = f"""
+            SELECT 
+                w.*,
+                COALESCE(ws.wrong_rate, 0) as wrong_rate,
+                COALESCE(ws.mastery_level, 0) as mastery_level,
+                ws.last_study_date,
+                {score_expr} as personalization_score
+            FROM words w
+            LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
+        """
+        
+        if filter_favorite:
+            query += " WHERE w.is_favorite = 1"
+        
+        query += " ORDER BY personalization_score DESC, w.word_id"
+        
+        if limit:
+            query += " LIMIT ?"
+            params += (limit,)
         
-        return round(score, 2)
+        words = self.execute_query(query, params)
+        self.logger.info("개인화 단어 목록: %d개", len(words))
+        return words
+    
+    def get_due_words(self, limit=None, filter_favorite=False, include_new=True):
+        """
+        복습 대상 단어 목록 (간격 반복)
+        - 복습 예정일이 오늘 이전인 단어: 예정일이 오래된 순 (idx_stats_next_review 사용)
+        - include_new: 이어서 아직 일정이 없는 단어 (학습 기록 없음)
+        
+        Args:
+            limit (int, optional): 조회 개수
+            filter_favorite (bool): 즐겨찾기만 조회
+            include_new (bool): 새 단어 포함 여부
+        
+        Returns:
+            list: 단어 리스트 (get_all_words 컬럼 + next_review_date, review_interval)
+        """
+        _, today_end = get_today_start_end()
+        favorite_filter = " AND w.is_favorite = 1" if filter_favorite else ""
+        
+        query = f"""
+            SELECT w.*, ws.next_review_date, ws.review_interval
+            FROM word_statistics ws
+            JOIN words w ON w.word_id = ws.word_id
+            WHERE ws.next_review_date <= ?{favorite_filter}
+            ORDER BY ws.next_review_date, ws.word_id
+        """
+        params = (today_end,)
+        if limit:
+            query += " LIMIT ?"
+            params += (limit,)
+        
+        words = self.execute_query(query, params)
+        
+        remaining = limit - len(words) if limit else None
+        if include_new and (remaining is None or remaining > 0):
+            new_query = f"""
+                SELECT w.*, NULL as next_review_date, NULL as review_interval
+                FROM words w
+                LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
+                WHERE ws.next_review_date IS NULL{favorite_filter}
+                ORDER BY w.word_id
+            """
+            new_params = ()
+            if remaining:
+                new_query += " LIMIT ?"
+                new_params = (remaining,)
+            words += self.execute_query(new_query, new_params)
+        
+        self.logger.info("복습 대상 단어: %d개", len(words))
+        return words
     
     def get_personalized_word_list(self, limit=None):
         """
@@ -336,37 +626,56 @@ class StatisticsModel(BaseModel):
         Returns:
             list: 단어 ID 리스트 (우선순위 순)
         """
-        query = """
-            SELECT 
-                w.word_id,
-                ws.wrong_rate,
-                ws.mastery_level,
-                ws.wrong_count,
-                ws.last_study_date,
-                ws.total_attempts
+        score_expr, params = self._build_personalization_score_expr()
+        query = f"""
+            SELECT w.word_id
             FROM words w
             LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
+            ORDER BY {score_expr} DESC, w.word_id
         """
         
-        words = self.execute_query(query)
+        if limit:
+            query += " LIMIT ?"
+            params += (limit,)
         
-        # 각 단어의 우선순위 점수 계산
-        word_scores = []
-        for word in words:
-            score = self.calculate_personalization_score(word['word_id'])
-            word_scores.append((word['word_id'], score))
+        word_ids = [row['word_id'] for row in self.execute_query(query, params)]
         
-        # 점수 순으로 정렬 (높은 점수 우선)
-        word_scores.sort(key=lambda x: x[1], reverse=True)
+        self.logger.info(f"개인화 단어 목록: {len(word_ids)}개")
+        return word_ids
+    
+    def _build_personalization_score_expr(self):
+        """
+        개인화 점수 SQL 식 생성 (내부 메서드)
+        words w LEFT JOIN word_statistics ws 기준, 가중치와 현재 시각은 파라미터로 전달
         
-        # word_id만 추출
-        word_ids = [word_id for word_id, score in word_scores]
+        점수 = 오답률 × w1 + min(경과일, 30) × w2 + (5 - 숙지도) × 20 × w3 + min(오답 횟수, 10) × 10 × w4
+        - 미학습 단어: 50.0 (중간 우선순위)
+        - 마지막 학습일 없음: 경과일 999 (매우 오래됨)
         
-        if limit:
-            word_ids = word_ids[:limit]
+        Returns:
+            tuple: (score_expr, params)
+        """
+        weights = config.PERSONALIZATION_WEIGHTS
         
-        self.logger.info(f"개인화 단어 목록: {len(word_ids)}개")
-        return word_ids
+        score_expr = """
+            CASE
+                WHEN ws.word_id IS NULL OR ws.total_attempts = 0 THEN 50.0
+                ELSE ROUND(
+                    ws.wrong_rate * ?
+                    + MIN(COALESCE(ABS(CAST(julianday(?) - julianday(ws.last_study_date) AS INTEGER)), 999), 30) * ?
+                    + (5 - ws.mastery_level) * 20 * ?
+                    + MIN(ws.wrong_count, 10) * 10 * ?
+                , 2)
+            END
+        """
+        params = (
+            weights['wrong_rate'],
+            get_current_datetime(),
+            weights['days_since_last_study'],
+            weights['mastery_level'],
+            weights['wrong_count']
+        )
+        return score_expr, params
     
     def _calculate_mastery_level(self, current_level, consecutive_correct, wrong_rate):
         """
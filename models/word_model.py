@@ -4,13 +4,19 @@
 """
 단어(words 테이블) CRUD 연산
 - 단어 조회/추가/수정/삭제
-- 검색 및 필터링
+- 검색 및 필터링 (전문 검색, 한글 초성 검색, 오타 허용 검색)
 - CSV 임포트/엑스포트
+- 대용량 조회용 스트리밍(제너레이터) API
 - 즐겨찾기 관리
 """
 
+import re
+import sqlite3
 import sys
 import os
+import json
+import random
+import itertools
 
 # 프로젝트 루트를 sys.path에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,9 +24,13 @@ project_root = os.path.dirname(current_dir)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+import config
 from models.base_model import BaseModel
 from utils.datetime_helper import get_current_datetime
 from utils.validators import validate_word
+from utils.korean_helper import to_choseong, build_choseong_suffixes
+from utils.fuzzy_helper import normalize_for_fuzzy, make_trigrams, min_shared_trigrams, levenshtein
+from utils.neighbor_index import word_features, rank_neighbors, build_neighbor_rows
 
 
 class WordModel(BaseModel):
@@ -40,6 +50,38 @@ class WordModel(BaseModel):
         Returns:
             list: 단어 리스트 (통계 정보 포함)
         """
+        query, params = self._build_word_list_query(filter_favorite, filter_unlearned)
+        
+        result = self.execute_query(query, params)
+        self.logger.info("전체 단어 조회: %d개", len(result))
+        return result
+    
+    def iter_all_words(self, filter_favorite=False, filter_unlearned=False, batch_size=None):
+        """
+        전체 단어 스트리밍 조회 (get_all_words의 제너레이터 버전)
+        대용량 단어장에서도 메모리 사용량이 일정함
+        
+        Args:
+            filter_favorite (bool): 즐겨찾기만 조회
+            filter_unlearned (bool): 미학습 단어만 조회
+            batch_size (int, optional): fetchmany 크기
+        
+        Yields:
+            sqlite3.Row: 단어 행 (통계 정보 포함)
+        """
+        query, params = self._build_word_list_query(filter_favorite, filter_unlearned)
+        yield from self.iter_query(query, params, batch_size)
+    
+    def get_word_by_id(self, word_id):
+        """
+        단어 ID로 조회
+        
+        Args:
+            word_id (int): 단어 ID
+        
+        Returns:
+            dict: 단어 정보 (없으면 None)
+        """
         query = """
             SELECT 
                 w.*,
@@ -48,77 +90,241 @@ class WordModel(BaseModel):
                 ws.last_study_date
             FROM words w
             LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
+            WHERE w.word_id = ?
+        """
+        result = self.execute_query(query, (word_id,))
+        return result[0] if result else None
+    
+    # search_type별 FTS5 컬럼 필터
+    FTS_COLUMNS = {
+        'english': 'english',
+        'korean': 'korean',
+        'memo': 'memo',
+        'all': 'english korean memo'
+    }
+    
+    def search_words(self, keyword, search_type='all', limit=None):
         """
+        단어 검색
+        - FTS5 인덱스 사용 시: 접두어 검색, 관련도(bm25) 순 정렬, snippet 포함
+          토큰 중간/끝 일치('과' → 사과, 'phant' → elephant)는 FTS로 찾을 수 없으므로
+          FTS 결과가 없으면 LIKE 부분 일치 검색으로 다시 찾음
+        - 인덱스 미사용 시: LIKE 부분 일치 검색 (word_id 순)
         
-        conditions = []
-        params = []
+        Args:
+            keyword (str): 검색 키워드
+            search_type (str): 'english', 'korean', 'memo', 'all', 'choseong', 'fuzzy'
+            limit (int, optional): 최대 결과 수
         
-        if filter_favorite:
-            conditions.append("w.is_favorite = 1")
+        Returns:
+            list: 검색 결과
+        """
+        if not keyword:
+            return self.get_all_words()
         
-        if filter_unlearned:
-            conditions.append("ws.total_attempts IS NULL OR ws.total_attempts = 0")
+        if search_type == 'choseong':
+            return self.search_words_by_choseong(keyword, limit=limit)
+        if search_type == 'fuzzy':
+            return self.search_words_fuzzy(keyword, limit=limit or 10)
         
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+        match_expr = None
+        if config.SEARCH_USE_FTS and self.db.fts_enabled:
+            match_expr = self._build_fts_match(keyword, search_type)
         
-        query += " ORDER BY w.word_id"
+        result = self._search_words_fts(match_expr, limit) if match_expr else []
+        if not result:
+            result = self._search_words_like(keyword, search_type, limit)
         
-        result = self.execute_query(query, tuple(params) if params else None)
-        self.logger.info(f"전체 단어 조회: {len(result)}개")
+        self.logger.info("검색 결과: '%s' - %d개", keyword, len(result))
         return result
     
-    def get_word_by_id(self, word_id):
+    def search_words_by_choseong(self, keyword, prefix_only=False, limit=None):
         """
-        단어 ID로 조회
+        한글 초성 검색 (예: 'ㅅㄱ' → 사과)
+        - 검색어도 초성으로 정규화 ('사ㄱ' → 'ㅅㄱ')
+        - word_choseong 접미사 색인의 범위 검색 (전체 스캔 없음)
+        - 정렬: 앞부분 일치 → 짧은 뜻 → word_id
         
         Args:
-            word_id (int): 단어 ID
+            keyword (str): 검색 키워드
+            prefix_only (bool): True면 뜻의 앞부분 일치만
+            limit (int, optional): 최대 결과 수
         
         Returns:
-            dict: 단어 정보 (없으면 None)
+            list: 검색 결과 (match_position 컬럼 포함)
+        """
+        pattern = to_choseong(keyword)
+        if not pattern:
+            return []
+        
+        position_condition = "AND position = 0" if prefix_only else ""
+        query = f"""
+            SELECT 
+                w.*,
+                COALESCE(ws.wrong_rate, 0) as wrong_rate,
+                COALESCE(ws.mastery_level, 0) as mastery_level,
+                ws.last_study_date,
+                m.match_position
+            FROM (
+                SELECT word_id, MIN(position) as match_position
+                FROM word_choseong
+                WHERE suffix GLOB ? {position_condition}
+                GROUP BY word_id
+            ) m
+            JOIN words w ON w.word_id = m.word_id
+            LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
+            ORDER BY m.match_position, length(w.korean), w.word_id
+        """
+        params = [pattern + '*']
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        result = self.execute_query(query, tuple(params))
+        self.logger.info("초성 검색 결과: '%s' - %d개", keyword, len(result))
+        return result
+    
+    def search_words_fuzzy(self, keyword, limit=10, max_distance=None):
+        """
+        오타 허용 영어 단어 검색 (예: 'recieve' → receive)
+        1. word_trigrams 색인에서 트라이그램을 많이 공유하는 후보 추출 (길이 범위 제한)
+        2. 후보만 편집 거리 계산 후 가까운 순 정렬
+        
+        Args:
+            keyword (str): 검색 키워드
+            limit (int): 최대 결과 수
+            max_distance (int, optional): 허용 편집 거리 (기본: 단어 길이에 따라 자동)
+        
+        Returns:
+            list: 검색 결과 (distance 컬럼 포함, 거리 → 공유 트라이그램 수 순)
+        """
+        target = normalize_for_fuzzy(keyword)
+        trigrams = sorted(make_trigrams(target))
+        if not trigrams:
+            return []
+        
+        if max_distance is None:
+            max_distance = min(config.FUZZY_MAX_DISTANCE, max(1, len(target) // 3))
+        
+        placeholders = ', '.join('?' * len(trigrams))
+        query = f"""
+            SELECT 
+                w.*,
+                COALESCE(ws.wrong_rate, 0) as wrong_rate,
+                COALESCE(ws.mastery_level, 0) as mastery_level,
+                ws.last_study_date,
+                c.shared
+            FROM (
+                SELECT word_id, COUNT(*) as shared
+                FROM word_trigrams
+                WHERE trigram IN ({placeholders})
+                AND word_length BETWEEN ? AND ?
+                GROUP BY word_id
+                HAVING COUNT(*) >= ?
+                ORDER BY shared DESC
+                LIMIT ?
+            ) c
+            JOIN words w ON w.word_id = c.word_id
+            LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
+        """
+        params = (
+            *trigrams,
+            len(target) - max_distance,
+            len(target) + max_distance,
+            min_shared_trigrams(target, max_distance),
+            limit * config.FUZZY_CANDIDATE_FACTOR
+        )
+        
+        results = []
+        for row in self.execute_query(query, params):
+            distance = levenshtein(target, normalize_for_fuzzy(row['english']), max_distance)
+            if distance <= max_distance:
+                row['distance'] = distance
+                results.append(row)
+        
+        results.sort(key=lambda r: (r['distance'], -r['shared'], r['word_id']))
+        results = results[:limit]
+        
+        self.logger.info("유사 검색 결과: '%s' - %d개", keyword, len(results))
+        return results
+    
+    def _build_fts_match(self, keyword, search_type):
+        """
+        검색 키워드를 FTS5 MATCH 식으로 변환
+        - 단어(토큰)마다 접두어 검색("tok"*), 여러 토큰은 AND
+        
+        Args:
+            keyword (str): 검색 키워드
+            search_type (str): 'english', 'korean', 'memo', 'all'
+        
+        Returns:
+            str: MATCH 식 (토큰이 없으면 None)
+        """
+        tokens = re.findall(r'\w+', keyword)
+        if not tokens:
+            return None
+        
+        columns = self.FTS_COLUMNS.get(search_type, self.FTS_COLUMNS['all'])
+        terms = ' '.join(f'"{token}"*' for token in tokens)
+        return f"{{{columns}}} : ({terms})"
+    
+    def _search_words_fts(self, match_expr, limit=None):
+        """
+        FTS5 인덱스 검색
+        
+        Args:
+            match_expr (str): MATCH 식
+            limit (int, optional): 최대 결과 수
+        
+        Returns:
+            list: 검색 결과 (snippet 컬럼 포함)
         """
         query = """
             SELECT 
                 w.*,
                 COALESCE(ws.wrong_rate, 0) as wrong_rate,
                 COALESCE(ws.mastery_level, 0) as mastery_level,
-                ws.last_study_date
-            FROM words w
+                ws.last_study_date,
+                snippet(words_fts, -1, ?, ?, '…', 10) as snippet
+            FROM words_fts
+            JOIN words w ON w.word_id = words_fts.rowid
             LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
-            WHERE w.word_id = ?
+            WHERE words_fts MATCH ?
+            ORDER BY words_fts.rank, w.word_id
         """
-        result = self.execute_query(query, (word_id,))
-        return result[0] if result else None
+        params = [config.SEARCH_HIGHLIGHT_OPEN, config.SEARCH_HIGHLIGHT_CLOSE, match_expr]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        return self.execute_query(query, tuple(params))
     
-    def search_words(self, keyword, search_type='all'):
+    def _search_words_like(self, keyword, search_type, limit=None):
         """
-        단어 검색
+        LIKE 부분 일치 검색 (FTS5 미사용 시)
         
         Args:
             keyword (str): 검색 키워드
             search_type (str): 'english', 'korean', 'memo', 'all'
+            limit (int, optional): 최대 결과 수
         
         Returns:
             list: 검색 결과
         """
-        if not keyword:
-            return self.get_all_words()
-        
         keyword_pattern = f"%{keyword}%"
         
         if search_type == 'english':
             condition = "w.english LIKE ?"
-            params = (keyword_pattern,)
+            params = [keyword_pattern]
         elif search_type == 'korean':
             condition = "w.korean LIKE ?"
-            params = (keyword_pattern,)
+            params = [keyword_pattern]
         elif search_type == 'memo':
             condition = "w.memo LIKE ?"
-            params = (keyword_pattern,)
+            params = [keyword_pattern]
         else:  # 'all'
             condition = "(w.english LIKE ? OR w.korean LIKE ? OR w.memo LIKE ?)"
-            params = (keyword_pattern, keyword_pattern, keyword_pattern)
+            params = [keyword_pattern, keyword_pattern, keyword_pattern]
         
         query = f"""
             SELECT 
@@ -131,10 +337,11 @@ class WordModel(BaseModel):
             WHERE {condition}
             ORDER BY w.word_id
         """
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
         
-        result = self.execute_query(query, params)
-        self.logger.info(f"검색 결과: '{keyword}' - {len(result)}개")
-        return result
+        return self.execute_query(query, tuple(params))
     
     def add_word(self, english, korean, memo=None, is_favorite=0):
         """
@@ -175,14 +382,21 @@ class WordModel(BaseModel):
             get_current_datetime()
         )
         
-        word_id = self.execute_update(query, params)
-        
-        if word_id:
-            self.logger.info(f"단어 추가 완료: {english} - {korean} (ID: {word_id})")
-            
-            # word_statistics 초기화
-            self._initialize_statistics(word_id)
+        # 단어 + 통계 + 검색 색인을 한 번에 커밋 (하나라도 실패하면 전체 롤백)
+        try:
+            with self.unit_of_work():
+                word_id = self._require_write(self.execute_update(query, params), action='단어 추가')
+                
+                # word_statistics 초기화
+                self._initialize_statistics(word_id)
+                self._index_choseong(word_id, params[1])
+                self._index_trigrams(word_id, params[0])
+                self._index_neighbors(word_id, params[0], params[1])
+        except (RuntimeError, sqlite3.Error) as e:
+            self.logger.error(f"단어 추가 실패 (롤백): {english} - {korean}: {e}")
+            return None
         
+        self.logger.info("단어 추가 완료: %s - %s (ID: %s)", english, korean, word_id)
         return word_id
     
     def update_word(self, word_id, **kwargs):
@@ -201,7 +415,7 @@ class WordModel(BaseModel):
         
         # 존재 확인
         if not self.exists('words', 'word_id', word_id):
-            self.logger.warning(f"단어 수정 실패: word_id={word_id} 존재하지 않음")
+            self.logger.warning("단어 수정 실패: word_id=%s 존재하지 않음", word_id)
             return False
         
         # 입력 검증 (english, korean이 있는 경우)
@@ -213,7 +427,7 @@ class WordModel(BaseModel):
             
             is_valid, error_msg = validate_word(english, korean, memo)
             if not is_valid:
-                self.logger.warning(f"단어 수정 검증 실패: {error_msg}")
+                self.logger.warning("단어 수정 검증 실패: %s", error_msg)
                 return False
         
         # modified_date 자동 추가
@@ -221,10 +435,25 @@ class WordModel(BaseModel):
         
         # UPDATE 쿼리 실행
         query, params = self._build_update_query('words', 'word_id', word_id, **kwargs)
-        result = self.execute_update(query, params)
+        try:
+            with self.unit_of_work():
+                result = self._require_write(
+                    self.execute_update(query, params, return_rowcount=True), action='단어 수정'
+                )
+                
+                # 뜻/단어가 바뀌면 검색 색인 갱신 (실패하면 수정까지 롤백)
+                if result and 'korean' in kwargs:
+                    self._index_choseong(word_id, kwargs['korean'])
+                if result and 'english' in kwargs:
+                    self._index_trigrams(word_id, kwargs['english'])
+                if result and ('english' in kwargs or 'korean' in kwargs):
+                    self._index_neighbors(word_id, english, korean)
+        except (RuntimeError, sqlite3.Error) as e:
+            self.logger.error("단어 수정 실패 (롤백): word_id=%s: %s", word_id, e)
+            return False
         
-        if result and result > 0:
-            self.logger.info(f"단어 수정 완료: word_id={word_id}")
+        if result > 0:
+            self.logger.info("단어 수정 완료: word_id=%s", word_id)
             return True
         else:
             return False
@@ -274,41 +503,132 @@ class WordModel(BaseModel):
     
     def import_from_csv(self, csv_data, skip_duplicates=True):
         """
-        CSV 데이터 일괄 추가
+        CSV 데이터 일괄 추가 (bulk_import 사용)
         
         Args:
-            csv_data (list): [{'english': '...', 'korean': '...', 'memo': '...'}, ...]
+            csv_data (iterable): [{'english': '...', 'korean': '...', 'memo': '...'}, ...]
             skip_duplicates (bool): True면 중복 건너뛰기, False면 오류
         
         Returns:
-            dict: {'success': 10, 'failed': 2, 'errors': [...]}
+            dict: {'success': 10, 'failed': 2, 'duplicate': 1, 'errors': [...]}
+        """
+        return self.bulk_import(csv_data, skip_duplicates)
+    
+    def bulk_import(self, rows, skip_duplicates=True):
+        """
+        단어 대량 추가 (한 트랜잭션)
+        1. 청크 단위로 행 검증 후 임시 테이블(import_staging)에 executemany로 적재
+        2. 파일 내 중복 / 기존 단어 중복을 집합 연산(JOIN) 한 번으로 판정
+        3. INSERT ... SELECT로 words, word_statistics 일괄 생성 + 검색 색인 적재
+        
+        Args:
+            rows (iterable): [{'english': '...', 'korean': '...', 'memo': '...'}, ...]
+                             리스트 또는 제너레이터 (iter_csv 스트리밍 결과 등)
+            skip_duplicates (bool): True면 중복/오류 행 건너뛰기,
+                                    False면 첫 실패 행에서 중단 (이전 행까지만 추가)
+        
+        Returns:
+            dict: {'success': 10, 'failed': 2, 'duplicate': 1, 'errors': [...],
+                   'total': 13, 'aborted': False}
+                  failed = 검증 실패 + 중복, total = 읽은 행 수
+                  aborted = DB 오류로 전체 롤백 (아무것도 추가되지 않음, errors에 오류 내용)
         """
+        failures = []  # (row_no, is_duplicate, message)
+        read_count = 0
+        staged_count = 0
         success_count = 0
-        failed_count = 0
-        errors = []
+        numbered_rows = enumerate(rows, 1)  # 행 번호는 1부터
         
-        for i, data in enumerate(csv_data, 1):
-            english = data.get('english', '').strip()
-            korean = data.get('korean', '').strip()
-            memo = data.get('memo', '').strip() if data.get('memo') else None
-            
-            word_id = self.add_word(english, korean, memo)
-            
-            if word_id:
-                success_count += 1
-            else:
-                failed_count += 1
-                errors.append(f"행 {i}: {english} - {korean}")
-                if not skip_duplicates:
-                    break
+        try:
+            with self.unit_of_work():
+                self._prepare_import_staging()
+                
+                # 1. 청크 단위 검증 후 임시 테이블에 적재 (전체 행을 메모리에 두지 않음)
+                while True:
+                    chunk = list(itertools.islice(numbered_rows, config.CSV_CHUNK_SIZE))
+                    if not chunk:
+                        break
+                    read_count += len(chunk)
+                    
+                    staged = []
+                    for i, data in chunk:
+                        english = (data.get('english') or '').strip()
+                        korean = (data.get('korean') or '').strip()
+                        memo = (data.get('memo') or '').strip() or None
+                        
+                        is_valid, error_msg = validate_word(english, korean, memo)
+                        if is_valid:
+                            staged.append((i, english, korean, memo))
+                        else:
+                            failures.append((i, False, f"행 {i}: {english} - {korean} ({error_msg})"))
+                    
+                    if staged:
+                        self._require_write(self.execute_many(
+                            "INSERT INTO import_staging (row_no, english, korean, memo) VALUES (?, ?, ?, ?)",
+                            staged
+                        ), len(staged), '임포트 임시 테이블 적재')
+                        staged_count += len(staged)
+                
+                # 2. 중복 판정: 기존 단어 또는 파일 안의 앞선 행과 같은 (english, korean)
+                self._require_write(self.execute_update("""
+                    UPDATE import_staging
+                    SET is_duplicate = 1
+                    WHERE EXISTS (
+                        SELECT 1 FROM words w
+                        WHERE w.english = import_staging.english AND w.korean = import_staging.korean
+                    )
+                    OR EXISTS (
+                        SELECT 1 FROM import_staging p
+                        WHERE p.english = import_staging.english
+                        AND p.korean = import_staging.korean
+                        AND p.row_no < import_staging.row_no
+                    )
+                """), action='중복 판정')
+                failures.extend(
+                    (dup['row_no'], True, f"행 {dup['row_no']}: {dup['english']} - {dup['korean']} (중복)")
+                    for dup in self.iter_query(
+                        "SELECT row_no, english, korean FROM import_staging WHERE is_duplicate = 1"
+                    )
+                )
+                failures.sort()
+                
+                # 중복 허용 안 함: 첫 실패 행에서 중단
+                stop_row = None
+                if failures and not skip_duplicates:
+                    stop_row = failures[0][0]
+                    failures = failures[:1]
+                
+                # 3. 일괄 추가
+                if staged_count:
+                    success_count = self._insert_staged_words(stop_row)
+        except (RuntimeError, sqlite3.Error) as e:
+            # 적재/색인 중 하나라도 실패하면 전체 롤백 (일부 단어만 추가되지 않음)
+            self.logger.error("CSV 임포트 실패 (전체 롤백): %s", e)
+            return {
+                'success': 0,
+                'failed': 0,
+                'duplicate': 0,
+                'errors': [f"임포트 실패: {e}"],
+                'total': read_count,
+                'aborted': True
+            }
+        
+        if success_count > config.NEIGHBOR_INCREMENTAL_MAX_WORDS:
+            self.rebuild_neighbor_index()
         
+        duplicate_count = sum(1 for _, is_duplicate, _ in failures if is_duplicate)
         result = {
             'success': success_count,
-            'failed': failed_count,
-            'errors': errors
+            'failed': len(failures),
+            'duplicate': duplicate_count,
+            'errors': [message for _, _, message in failures],
+            'total': read_count,
+            'aborted': False
         }
         
-        self.logger.info(f"CSV 임포트 완료: 성공 {success_count}개, 실패 {failed_count}개")
+        self.logger.info(
+            "CSV 임포트 완료: 성공 %d개, 실패 %d개 (중복 %d개)", success_count, len(failures), duplicate_count
+        )
         return result
     
     def export_to_csv(self):
@@ -320,9 +640,141 @@ class WordModel(BaseModel):
         """
         query = "SELECT english, korean, memo FROM words ORDER BY word_id"
         result = self.execute_query(query)
-        self.logger.info(f"CSV 엑스포트: {len(result)}개 단어")
+        self.logger.info("CSV 엑스포트: %d개 단어", len(result))
         return result
     
+    def iter_export_to_csv(self, batch_size=None):
+        """
+        전체 단어 스트리밍 내보내기 (export_to_csv의 제너레이터 버전)
+        
+        Args:
+            batch_size (int, optional): fetchmany 크기
+        
+        Yields:
+            sqlite3.Row: english, korean, memo 컬럼 행
+        """
+        query = "SELECT english, korean, memo FROM words ORDER BY word_id"
+        yield from self.iter_query(query, batch_size=batch_size)
+    
+    # sample_random_words: 임의 ID 추출 반복 횟수 (이후 ORDER BY RANDOM()으로 보충)
+    SAMPLE_MAX_ROUNDS = 3
+    
+    def sample_random_words(self, count):
+        """
+        무작위 단어 추출 (word_id 범위에서 임의 ID를 뽑아 기본 키로 조회)
+        전체 단어를 읽거나 정렬하지 않으므로 단어장 크기와 무관하게 일정한 비용
+        - 삭제로 비어 있는 ID는 건너뛰고 부족한 만큼 다시 추출
+        - ID가 매우 듬성듬성하면 마지막에 ORDER BY RANDOM()으로 보충
+        
+        Args:
+            count (int): 추출할 단어 수
+        
+        Returns:
+            list: [{'word_id', 'english', 'korean'}, ...] (무작위 순서, 단어가 부족하면 전체)
+        """
+        bounds = self.execute_query("SELECT MIN(word_id) as min_id, MAX(word_id) as max_id FROM words")
+        if not bounds or bounds[0]['min_id'] is None or count <= 0:
+            return []
+        
+        id_range = range(bounds[0]['min_id'], bounds[0]['max_id'] + 1)
+        query = """
+            SELECT word_id, english, korean
+            FROM words
+            WHERE word_id IN (SELECT value FROM json_each(?))
+        """
+        
+        sampled = {}
+        tried = set()
+        for _ in range(self.SAMPLE_MAX_ROUNDS):
+            need = count - len(sampled)
+            if need <= 0 or len(tried) >= len(id_range):
+                break
+            
+            # 빈 ID를 감안해 필요한 수의 2배를 추출
+            candidates = [
+                word_id for word_id in random.sample(id_range, min(need * 2, len(id_range)))
+                if word_id not in tried
+            ]
+            tried.update(candidates)
+            
+            for row in self.execute_query(query, (json.dumps(candidates),)):
+                if len(sampled) < count:
+                    sampled[row['word_id']] = row
+        
+        need = count - len(sampled)
+        if need > 0 and len(tried) < len(id_range):
+            fill_query = """
+                SELECT word_id, english, korean
+                FROM words
+                WHERE word_id NOT IN (SELECT value FROM json_each(?))
+                ORDER BY RANDOM()
+                LIMIT ?
+            """
+            for row in self.execute_query(fill_query, (json.dumps(list(sampled)), need)):
+                sampled[row['word_id']] = row
+        
+        words = list(sampled.values())
+        random.shuffle(words)
+        return words
+    
+    def get_neighbor_words(self, word_ids):
+        """
+        여러 단어의 유사 단어(이웃) 일괄 조회 (객관식 오답 선택지용)
+        
+        Args:
+            word_ids (iterable): 단어 ID 목록
+        
+        Returns:
+            dict: {word_id: [{'word_id', 'english', 'korean', 'similarity'}, ...]} (유사도 높은 순)
+        """
+        query = """
+            SELECT n.word_id as source_id, w.word_id, w.english, w.korean, n.similarity
+            FROM word_neighbors n
+            JOIN words w ON w.word_id = n.neighbor_id
+            WHERE n.word_id IN (SELECT value FROM json_each(?))
+            ORDER BY n.word_id, n.similarity DESC, n.neighbor_id
+        """
+        neighbors = {}
+        for row in self.execute_query(query, (json.dumps(sorted(set(word_ids))),)):
+            source_id = row.pop('source_id')
+            neighbors.setdefault(source_id, []).append(row)
+        return neighbors
+    
+    def rebuild_neighbor_index(self, workers=None):
+        """
+        유사 단어(이웃) 색인 전체 재계산
+        계산은 트랜잭션 밖에서(큰 단어장은 프로세스 풀), 교체는 한 트랜잭션으로
+        
+        Args:
+            workers (int, optional): 프로세스 수 (기본: 단어 수에 따라 자동)
+        
+        Returns:
+            int: 저장된 이웃 행 수 (실패 시 None)
+        """
+        try:
+            words = [
+                (row['word_id'], row['english'], row['korean'])
+                for row in self.iter_query("SELECT word_id, english, korean FROM words")
+            ]
+            rows = build_neighbor_rows(words, workers=workers)
+            
+            # execute_many는 오류 시 0을 반환하므로 건수가 다르면 예외로 DELETE까지 롤백
+            with self.unit_of_work():
+                self._require_write(self.db.execute_update("DELETE FROM word_neighbors"), action='이웃 색인 삭제')
+                self._require_write(
+                    self.db.execute_many(
+                        "INSERT INTO word_neighbors (word_id, neighbor_id, similarity) VALUES (?, ?, ?)",
+                        rows
+                    ),
+                    len(rows), '이웃 색인 저장'
+                )
+            
+            self.logger.info("유사 단어 색인 재계산: %d개 단어, %d행", len(words), len(rows))
+            return len(rows)
+        except Exception as e:
+            self.logger.error("유사 단어 색인 재계산 실패: %s", e)
+            return None
+    
     def get_word_count(self, filter_favorite=False):
         """
         단어 수 조회
@@ -338,9 +790,126 @@ class WordModel(BaseModel):
         else:
             return self.get_count('words')
     
+    def _build_word_list_query(self, filter_favorite=False, filter_unlearned=False):
+        """
+        단어 목록 조회 쿼리 생성 (내부 헬퍼 메서드)
+        
+        Args:
+            filter_favorite (bool): 즐겨찾기만 조회
+            filter_unlearned (bool): 미학습 단어만 조회
+        
+        Returns:
+            tuple: (query, params)
+        """
+        query = """
+            SELECT 
+                w.*,
+                COALESCE(ws.wrong_rate, 0) as wrong_rate,
+                COALESCE(ws.mastery_level, 0) as mastery_level,
+                ws.last_study_date
+            FROM words w
+            LEFT JOIN word_statistics ws ON w.word_id = ws.word_id
+        """
+        
+        conditions = []
+        params = []
+        
+        if filter_favorite:
+            conditions.append("w.is_favorite = 1")
+        
+        if filter_unlearned:
+            conditions.append("ws.total_attempts IS NULL OR ws.total_attempts = 0")
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
+        query += " ORDER BY w.word_id"
+        
+        return query, (tuple(params) if params else None)
+    
+    def _prepare_import_staging(self):
+        """
+        임포트 임시 테이블 준비 (내부 메서드, 트랜잭션 안에서 호출)
+        TEMP 테이블은 쓰기 연결에만 보이므로 트랜잭션 밖에서 조회하지 않음
+        """
+        self.execute_update("""
+            CREATE TEMP TABLE IF NOT EXISTS import_staging (
+                row_no INTEGER PRIMARY KEY,
+                english TEXT NOT NULL,
+                korean TEXT NOT NULL,
+                memo TEXT,
+                is_duplicate INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self.execute_update(
+            "CREATE INDEX IF NOT EXISTS temp.idx_import_staging_word ON import_staging(english, korean)"
+        )
+        self.execute_update("DELETE FROM import_staging")
+    
+    def _insert_staged_words(self, stop_row=None):
+        """
+        임시 테이블의 중복 아닌 행을 words / word_statistics / 검색 색인에 추가 (내부 메서드)
+        
+        Args:
+            stop_row (int, optional): 이 행 번호부터는 추가하지 않음
+        
+        Returns:
+            int: 추가된 단어 수
+        """
+        last_id = self.execute_query("SELECT COALESCE(MAX(word_id), 0) as last_id FROM words")[0]['last_id']
+        
+        query = """
+            INSERT INTO words (english, korean, memo, is_favorite, created_date)
+            SELECT english, korean, memo, 0, ?
+            FROM import_staging
+            WHERE is_duplicate = 0
+        """
+        params = [get_current_datetime()]
+        if stop_row is not None:
+            query += " AND row_no < ?"
+            params.append(stop_row)
+        query += " ORDER BY row_no"
+        
+        self._require_write(self.execute_update(query, tuple(params)), action='단어 일괄 추가')
+        self._require_write(self.execute_update("""
+            INSERT INTO word_statistics (word_id)
+            SELECT word_id FROM words WHERE word_id > ?
+        """, (last_id,)), action='통계 일괄 초기화')
+        
+        new_words = self.execute_query(
+            "SELECT word_id, english, korean FROM words WHERE word_id > ? ORDER BY word_id",
+            (last_id,)
+        )
+        choseong_rows = [
+            (word['word_id'], position, suffix)
+            for word in new_words
+            for position, suffix in build_choseong_suffixes(word['korean'])
+        ]
+        self._require_write(self.execute_many(
+            "INSERT INTO word_choseong (word_id, position, suffix) VALUES (?, ?, ?)",
+            choseong_rows
+        ), len(choseong_rows), '초성 색인 적재')
+        trigram_rows = [
+            (trigram, len(normalize_for_fuzzy(word['english'])), word['word_id'])
+            for word in new_words
+            for trigram in make_trigrams(word['english'])
+        ]
+        self._require_write(self.execute_many(
+            "INSERT INTO word_trigrams (trigram, word_length, word_id) VALUES (?, ?, ?)",
+            trigram_rows
+        ), len(trigram_rows), '트라이그램 색인 적재')
+        
+        # 소량이면 유사 단어 색인 증분 갱신 (대량은 bulk_import에서 전체 재계산)
+        if len(new_words) <= config.NEIGHBOR_INCREMENTAL_MAX_WORDS:
+            for word in new_words:
+                self._index_neighbors(word['word_id'], word['english'], word['korean'])
+        
+        self._require_write(self.execute_update("DELETE FROM import_staging"), action='임시 테이블 정리')
+        return len(new_words)
+    
     def _initialize_statistics(self, word_id):
         """
-        새 단어의 통계 초기화 (내부 메서드)
+        새 단어의 통계 초기화 (내부 메서드, 실패 시 RuntimeError)
         
         Args:
             word_id (int): 단어 ID
@@ -349,7 +918,115 @@ class WordModel(BaseModel):
             INSERT INTO word_statistics (word_id)
             VALUES (?)
         """
-        self.execute_update(query, (word_id,))
+        self._require_write(self.execute_update(query, (word_id,)), action='통계 초기화')
+    
+    def _index_choseong(self, word_id, korean):
+        """
+        단어의 초성 검색 색인 갱신 (내부 메서드, 실패 시 RuntimeError)
+        
+        Args:
+            word_id (int): 단어 ID
+            korean (str): 한국어 뜻
+        """
+        self._require_write(
+            self.execute_update("DELETE FROM word_choseong WHERE word_id = ?", (word_id,), return_rowcount=True),
+            action='초성 색인 삭제'
+        )
+        rows = [(word_id, position, suffix) for position, suffix in build_choseong_suffixes(korean)]
+        if rows:
+            self._require_write(self.execute_many(
+                "INSERT INTO word_choseong (word_id, position, suffix) VALUES (?, ?, ?)",
+                rows
+            ), len(rows), '초성 색인 추가')
+    
+    def _index_trigrams(self, word_id, english):
+        """
+        단어의 트라이그램 색인 갱신 (내부 메서드, 실패 시 RuntimeError)
+        
+        Args:
+            word_id (int): 단어 ID
+            english (str): 영어 단어
+        """
+        self._require_write(
+            self.execute_update("DELETE FROM word_trigrams WHERE word_id = ?", (word_id,), return_rowcount=True),
+            action='트라이그램 색인 삭제'
+        )
+        word_length = len(normalize_for_fuzzy(english))
+        rows = [(trigram, word_length, word_id) for trigram in make_trigrams(english)]
+        if rows:
+            self._require_write(self.execute_many(
+                "INSERT INTO word_trigrams (trigram, word_length, word_id) VALUES (?, ?, ?)",
+                rows
+            ), len(rows), '트라이그램 색인 추가')
+    
+    def _index_neighbors(self, word_id, english, korean):
+        """
+        단어의 유사 단어(이웃) 색인 증분 갱신 (내부 메서드, _index_trigrams 이후 호출, 실패 시 RuntimeError)
+        - 후보: 트라이그램을 많이 공유하는 단어 NEIGHBOR_CANDIDATE_LIMIT개 (word_trigrams 인덱스)
+        - 이 단어의 이웃을 다시 계산하고, 이웃들의 목록에도 이 단어를 넣은 뒤 상위 K개만 유지
+        - 수정 시 다른 단어 목록에 남은 예전 유사도는 지움 (빈자리는 전체 재계산 때 채워짐)
+        
+        Args:
+            word_id (int): 단어 ID
+            english (str): 영어 단어
+            korean (str): 한국어 뜻
+        """
+        features = word_features(english, korean)
+        candidate_query = """
+            SELECT w.word_id, w.english, w.korean
+            FROM (
+                SELECT word_id, COUNT(*) as shared
+                FROM word_trigrams
+                WHERE trigram IN (SELECT value FROM json_each(?)) AND word_id != ?
+                GROUP BY word_id
+                ORDER BY shared DESC, word_id
+                LIMIT ?
+            ) t
+            JOIN words w ON w.word_id = t.word_id
+        """
+        rows = self.execute_query(
+            candidate_query,
+            (json.dumps(sorted(features[2])), word_id, config.NEIGHBOR_CANDIDATE_LIMIT)
+        )
+        neighbors = rank_neighbors(
+            word_id,
+            features,
+            ((row['word_id'], word_features(row['english'], row['korean'])) for row in rows)
+        )
+        
+        self._require_write(self.execute_update(
+            "DELETE FROM word_neighbors WHERE word_id = ? OR neighbor_id = ?",
+            (word_id, word_id),
+            return_rowcount=True
+        ), action='유사 단어 색인 삭제')
+        if not neighbors:
+            return
+        
+        insert_query = """
+            INSERT OR REPLACE INTO word_neighbors (word_id, neighbor_id, similarity)
+            VALUES (?, ?, ?)
+        """
+        self._require_write(
+            self.execute_many(insert_query, [(word_id, neighbor_id, score) for neighbor_id, score in neighbors]),
+            len(neighbors), '유사 단어 색인 추가'
+        )
+        self._require_write(
+            self.execute_many(insert_query, [(neighbor_id, word_id, score) for neighbor_id, score in neighbors]),
+            len(neighbors), '유사 단어 역방향 색인 추가'
+        )
+        # 이웃들의 목록을 상위 K개로 정리 (문장 하나라 실패와 '지울 행 없음'을 구분 가능)
+        self._require_write(self.execute_update("""
+            DELETE FROM word_neighbors
+            WHERE word_id IN (SELECT value FROM json_each(?1))
+            AND neighbor_id NOT IN (
+                SELECT k.neighbor_id FROM word_neighbors k
+                WHERE k.word_id = word_neighbors.word_id
+                ORDER BY k.similarity DESC, k.neighbor_id
+                LIMIT ?2
+            )
+        """, (json.dumps([neighbor_id for neighbor_id, _ in neighbors]), config.NEIGHBOR_COUNT),
+            return_rowcount=True
+        ), action='유사 단어 색인 정리')
 
 
 # 테스트 코드
@@ -11,6 +11,7 @@ pytest 공통 설정 및 fixture
 import pytest
 import sys
 import os
+import shutil
 import tempfile
 
 # 프로젝트 루트를 sys.path에 추가
@@ -20,6 +21,16 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 import config
+
+# 테스트 로그는 임시 디렉토리에 기록 (저장소의 logs/에 쓰지 않음)
+# 로거는 모듈 import 시 파일 핸들러를 만들므로 프로젝트 모듈 import 전에 경로 변경
+TEST_LOG_DIR = tempfile.mkdtemp(prefix='word_test_logs_')
+config.LOG_DIR = TEST_LOG_DIR
+config.LOG_FILE = os.path.join(TEST_LOG_DIR, 'app.log')
+config.DB_SLOW_QUERY_LOG_FILE = os.path.join(TEST_LOG_DIR, 'slow_query.log')
+config.DB_QUERY_STATS_DUMP_FILE = os.path.join(TEST_LOG_DIR, 'query_stats.json')
+config.TRACE_FILE = os.path.join(TEST_LOG_DIR, 'traces', 'trace.json')
+
 from database.db_connection import DBConnection
 from models.word_model import WordModel
 from models.settings_model import SettingsModel
@@ -28,6 +39,15 @@ from models.learning_model import LearningModel
 from models.exam_model import ExamModel
 
 
+def pytest_unconfigure():
+    """
+    테스트 종료 시 로그 출력 마무리 후 임시 로그 디렉토리 삭제
+    """
+    from utils.logger import shutdown_logging
+    shutdown_logging()
+    shutil.rmtree(TEST_LOG_DIR, ignore_errors=True)
+
+
 @pytest.fixture(scope='function')
 def test_db():
     """
@@ -63,6 +83,28 @@ def test_db():
     DBConnection._connection = None
 
 
+@pytest.fixture(scope='function')
+def pooled_db(test_db):
+    """
+    연결 풀 모드(WAL + 읽기 전용 연결)로 다시 연 테스트용 DB
+    """
+    original_pool_enabled = config.DB_POOL_ENABLED
+    config.DB_POOL_ENABLED = True
+    
+    test_db.close()
+    DBConnection._instance = None
+    DBConnection._connection = None
+    db = DBConnection()
+    
+    yield db
+    
+    db.close()
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(config.DATABASE_PATH + suffix):
+            os.remove(config.DATABASE_PATH + suffix)
+    config.DB_POOL_ENABLED = original_pool_enabled
+
+
 @pytest.fixture(scope='function')
 def word_model(test_db):
     """WordModel 인스턴스"""
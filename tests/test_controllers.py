@@ -0,0 +1,120 @@
+# 2026-10-17 - 스마트 단어장 - Controller 단위테스트
+# 파일 위치: C:\dev\word\tests\test_controllers.py - v1.0
+
+"""
+Controller 계층 단위테스트
+- ExamController (시험 종료 트랜잭션)
+- FlashcardController (답변 제출 트랜잭션)
+- WordController (CSV 임포트 결과 보고)
+"""
+
+import pytest
+
+from controllers.exam_controller import ExamController
+from controllers.flashcard_controller import FlashcardController
+from controllers.word_controller import WordController
+
+
+@pytest.fixture(scope='function')
+def block_statistics_updates(test_db):
+    """word_statistics 갱신이 항상 실패하도록 만드는 트리거"""
+    test_db.get_connection().execute("""
+        CREATE TRIGGER fail_statistics_update BEFORE UPDATE ON word_statistics
+        BEGIN SELECT RAISE(ABORT, 'statistics locked'); END
+    """)
+
+
+class TestExamController:
+    """ExamController 테스트"""
+    
+    def _start_exam(self, exam_model):
+        """주관식 시험 생성 후 앞 3문제만 정답 제출"""
+        controller = ExamController()
+        success, _, exam_id = controller.create_exam('short_answer', 'en_to_ko', 5)
+        assert success is True
+        
+        for i, question in enumerate(list(controller.exam_questions)):
+            controller.submit_answer(question['correct_answer'] if i < 3 else '오답')
+        return controller, exam_id
+    
+    def test_finish_exam(self, exam_model, statistics_model, inserted_words):
+        """시험 종료 시 채점/통계/점수가 함께 반영되는지 테스트"""
+        controller, exam_id = self._start_exam(exam_model)
+        
+        success, _, result = controller.finish_exam()
+        assert success is True
+        assert result['score'] == 60.0
+        
+        exam = exam_model.get_exam_detail(exam_id)['exam']
+        assert (exam['correct_count'], exam['wrong_count'], exam['score']) == (3, 2, 60.0)
+        assert exam_model.get_wrong_note_count() == 2
+        attempts = [statistics_model.get_word_statistics(word_id)['total_attempts'] for word_id in inserted_words]
+        assert attempts == [1] * 5
+    
+    def test_finish_exam_rolls_back_on_statistics_failure(self, exam_model, statistics_model,
+                                                          inserted_words, block_statistics_updates):
+        """통계 반영 실패 시 채점/오답 노트/점수까지 전체 롤백 테스트"""
+        controller, exam_id = self._start_exam(exam_model)
+        
+        success, _, result = controller.finish_exam()
+        assert success is False
+        assert result is None
+        
+        exam = exam_model.get_exam_detail(exam_id)['exam']
+        assert (exam['correct_count'], exam['wrong_count'], exam['score']) == (0, 0, 0.0)
+        assert exam_model.get_count('exam_questions', 'exam_id = ? AND user_answer IS NOT NULL', (exam_id,)) == 0
+        assert exam_model.get_wrong_note_count() == 0
+        assert statistics_model.get_word_statistics(inserted_words[0])['total_attempts'] == 0
+
+
+class TestFlashcardController:
+    """FlashcardController 테스트"""
+    
+    def test_submit_answer_rolls_back_on_statistics_failure(self, exam_model, inserted_words,
+                                                            block_statistics_updates):
+        """통계 반영 실패 시 학습 이력도 저장되지 않는지 테스트"""
+        controller = FlashcardController()
+        success, _, _ = controller.start_session('flashcard_en_ko', 'sequential')
+        assert success is True
+        
+        success, _, result = controller.submit_answer(controller.current_words[0]['korean'], 1.0)
+        assert success is False
+        assert result is None
+        assert exam_model.get_count('learning_history') == 0
+
+
+class TestWordController:
+    """WordController 테스트"""
+    
+    def _write_csv(self, tmp_path, rows):
+        file_path = tmp_path / 'import.csv'
+        file_path.write_text('\n'.join(['english,korean,memo'] + rows) + '\n', encoding='utf-8')
+        return str(file_path)
+    
+    def test_import_from_csv_empty_file(self, word_model, tmp_path):
+        """데이터 행이 없는 CSV는 빈 파일로 보고되는지 테스트"""
+        success, message, stats = WordController().import_from_csv(self._write_csv(tmp_path, []))
+        
+        assert success is False
+        assert message == "CSV 파일이 비어있습니다."
+        assert stats is None
+    
+    def test_import_from_csv_reports_aborted_import(self, word_model, test_db, tmp_path):
+        """DB 오류로 롤백된 임포트는 빈 파일이 아닌 오류로 보고되는지 테스트"""
+        test_db.get_connection().execute("""
+            CREATE TRIGGER fail_word_insert BEFORE INSERT ON words
+            BEGIN SELECT RAISE(ABORT, 'words locked'); END
+        """)
+        file_path = self._write_csv(tmp_path, ['apple,사과,', 'banana,바나나,'])
+        
+        success, message, stats = WordController().import_from_csv(file_path)
+        
+        assert success is False
+        assert "CSV 파일이 비어있습니다." not in message
+        assert '임포트 실패' in message
+        assert stats is None
+        assert word_model.get_count('words') == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -10,8 +10,219 @@ Model 계층 단위테스트
 - ExamModel
 """
 
+import json
+import sqlite3
+
 import pytest
 
+import config
+from database import migrations
+from database.backup_service import BackupService
+from database.db_connection import DBConnection, get_performance_pragmas
+from database.query_stats import get_query_stats
+from utils.tracing import start_tracing, stop_tracing
+from models.settings_model import SettingsModel
+
+
+class TestDBConnection:
+    """DBConnection 테스트"""
+    
+    def test_pool_mode_uses_wal(self, pooled_db):
+        """연결 풀 모드 WAL 저널 테스트"""
+        mode = pooled_db.get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == 'wal'
+    
+    def test_pool_read_not_blocked_by_write(self, pooled_db):
+        """쓰기 트랜잭션 진행 중에도 읽기 가능 테스트"""
+        writer = pooled_db.get_connection()
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute(
+            "INSERT INTO words (english, korean, created_date) VALUES ('pool', '풀', '2025-10-20T00:00:00')"
+        )
+        
+        # 커밋 전: 읽기 연결은 기다리지 않고 커밋된 데이터만 조회
+        result = pooled_db.execute_query("SELECT COUNT(*) as count FROM words")
+        assert result[0]['count'] == 0
+        
+        writer.commit()
+        result = pooled_db.execute_query("SELECT COUNT(*) as count FROM words")
+        assert result[0]['count'] == 1
+    
+    def test_performance_profile(self, test_db, monkeypatch):
+        """성능 프로필 PRAGMA 적용 및 진단 테스트"""
+        diagnostics = test_db.get_pragma_diagnostics()
+        assert diagnostics['profile'] == config.DB_PERFORMANCE_PROFILE
+        assert all(values['matches'] for values in diagnostics['pragmas'].values())
+        
+        monkeypatch.setattr(config, 'DB_PERFORMANCE_PROFILE', 'throughput')
+        monkeypatch.setattr(config, 'DB_PRAGMA_OVERRIDES', {'cache_size': -4000})
+        test_db.close()
+        DBConnection._instance = None
+        db = DBConnection()
+        pragmas = db.get_pragma_diagnostics()['pragmas']
+        assert pragmas['synchronous']['effective'] == 'off'
+        assert pragmas['journal_mode']['effective'] == 'wal'
+        assert pragmas['cache_size']['effective'] == -4000
+        db.close()
+    
+    def test_performance_profile_default_and_unknown(self, test_db, monkeypatch):
+        """기본 프로필은 durable, 알 수 없는 프로필은 경고 후 durable 사용 테스트"""
+        assert test_db.get_pragma_diagnostics()['pragmas']['synchronous']['effective'] == 'full'
+        
+        warnings = []
+        monkeypatch.setattr('database.db_connection.logger.warning', warnings.append)
+        monkeypatch.setattr(config, 'DB_PERFORMANCE_PROFILE', 'no_such_profile')
+        assert get_performance_pragmas() == config.DB_PERFORMANCE_PROFILES['durable']
+        get_performance_pragmas()
+        assert len(warnings) == 1 and 'no_such_profile' in warnings[0]
+        
+        diagnostics = test_db.get_pragma_diagnostics()
+        assert diagnostics['profile'] == 'durable'
+        assert diagnostics['configured_profile'] == 'no_such_profile'
+    
+    def test_transaction_commit(self, word_model):
+        """트랜잭션 블록 종료 시 일괄 커밋 테스트"""
+        with word_model.unit_of_work():
+            word_model.add_word('tx1', '트랜잭션1')
+            word_model.add_word('tx2', '트랜잭션2')
+            assert word_model.db.get_connection().in_transaction
+        
+        assert not word_model.db.get_connection().in_transaction
+        assert word_model.get_word_count() == 2
+    
+    def test_transaction_rollback(self, word_model):
+        """예외 발생 시 전체 롤백 테스트"""
+        with pytest.raises(RuntimeError):
+            with word_model.unit_of_work():
+                word_model.add_word('rollback', '롤백')
+                raise RuntimeError("강제 오류")
+        
+        assert word_model.get_word_count() == 0
+    
+    def test_nested_transaction_savepoint(self, word_model):
+        """중첩 트랜잭션(SAVEPOINT) 부분 롤백 테스트"""
+        with word_model.unit_of_work():
+            word_model.add_word('outer', '바깥')
+            with pytest.raises(RuntimeError):
+                with word_model.unit_of_work():
+                    word_model.add_word('inner', '안쪽')
+                    raise RuntimeError("안쪽 블록 오류")
+        
+        words = word_model.get_all_words()
+        assert [w['english'] for w in words] == ['outer']
+    
+    def test_migrations(self, test_db, monkeypatch):
+        """user_version 마이그레이션 및 실패 시 전체 롤백 테스트"""
+        connection = test_db.get_connection()
+        assert migrations.get_schema_version(connection) == migrations.LATEST_VERSION
+        assert migrations.apply_migrations(connection) == migrations.LATEST_VERSION
+        
+        def failing_step(conn):
+            conn.execute("CREATE TABLE migration_probe (id INTEGER)")
+            conn.execute("SELECT * FROM no_such_table")
+        
+        connection.execute("PRAGMA user_version = 0")
+        monkeypatch.setattr(migrations, 'MIGRATIONS', migrations.MIGRATIONS + [(99, 'failing', failing_step)])
+        monkeypatch.setattr(migrations, 'LATEST_VERSION', 99)
+        with pytest.raises(sqlite3.Error):
+            migrations.apply_migrations(connection)
+        assert migrations.get_schema_version(connection) == 0
+        assert not migrations.object_exists(connection, 'migration_probe')
+    
+    def test_migrations_repair_skipped_fts(self, test_db, inserted_words, monkeypatch):
+        """FTS5 없이 건너뛴 검색 인덱스를 최신 버전 DB에서도 나중에 보충하는지 테스트"""
+        connection = test_db.get_connection()
+        for trigger in ('trg_words_fts_insert', 'trg_words_fts_delete', 'trg_words_fts_update'):
+            connection.execute(f"DROP TRIGGER {trigger}")
+        connection.execute("DROP TABLE words_fts")
+        
+        monkeypatch.setattr(migrations, 'is_fts5_available', lambda conn: False)
+        assert migrations.apply_migrations(connection) == migrations.LATEST_VERSION
+        assert not migrations.object_exists(connection, 'words_fts')
+        
+        monkeypatch.undo()
+        migrations.apply_migrations(connection)
+        assert migrations.object_exists(connection, 'words_fts')
+        count = connection.execute("SELECT COUNT(*) FROM words_fts WHERE words_fts MATCH 'apple'").fetchone()[0]
+        assert count == 1
+    
+    def test_query_stats(self, test_db, monkeypatch):
+        """SQL 정규화별 실행 통계 및 느린 쿼리 EXPLAIN 기록 테스트"""
+        stats = get_query_stats()
+        stats.reset()
+        monkeypatch.setattr(config, 'DB_SLOW_QUERY_MS', 0)
+        monkeypatch.setattr(config, 'DB_SLOW_QUERY_EXPLAIN', True)
+        
+        for word_id in (1, 2, 3):
+            test_db.execute_query(f"SELECT * FROM words WHERE word_id = {word_id}")
+        test_db.execute_query("SELECT * FROM no_such_table")
+        
+        report = {row['sql']: row for row in stats.snapshot()}
+        entry = report["SELECT * FROM words WHERE word_id = ?"]
+        assert entry['calls'] == 3
+        assert sum(entry['histogram'].values()) == 3
+        assert entry['plan'] and 'words' in entry['plan'][0]
+        assert report["SELECT * FROM no_such_table"]['errors'] == 1
+    
+    def test_tracing_spans(self, word_model, inserted_words, tmp_path):
+        """Model/DB 트레이싱 구간 중첩 및 Chrome 트레이스 저장 테스트"""
+        start_tracing()
+        word_model.get_word_by_id(inserted_words[0])
+        trace_file = tmp_path / 'trace.json'
+        assert stop_tracing(str(trace_file)) >= 2
+        
+        events = [e for e in json.loads(trace_file.read_text(encoding='utf-8'))['traceEvents'] if e['ph'] == 'X']
+        model_span = next(e for e in events if e['name'] == 'WordModel.get_word_by_id')
+        db_span = next(e for e in events if e['cat'] == 'db')
+        assert model_span['ts'] <= db_span['ts'] + 1
+        assert db_span['ts'] + db_span['dur'] <= model_span['ts'] + model_span['dur'] + 1
+    
+    def test_tracing_unit_of_work_span(self, word_model, tmp_path):
+        """unit_of_work 구간이 블록 안의 쿼리 전체를 포함하는지 테스트"""
+        start_tracing()
+        with word_model.unit_of_work():
+            word_model.execute_update(
+                "INSERT INTO words (english, korean, created_date) VALUES ('uow', '작업', '2025-10-20T00:00:00')"
+            )
+        trace_file = tmp_path / 'trace.json'
+        stop_tracing(str(trace_file))
+        
+        events = [e for e in json.loads(trace_file.read_text(encoding='utf-8'))['traceEvents'] if e['ph'] == 'X']
+        uow_span = next(e for e in events if e['name'] == 'WordModel.unit_of_work')
+        insert_span = next(e for e in events if e['cat'] == 'db' and e['name'].startswith('INSERT INTO words'))
+        assert uow_span['ts'] <= insert_span['ts'] + 1
+        assert insert_span['ts'] + insert_span['dur'] <= uow_span['ts'] + uow_span['dur'] + 1
+    
+    def test_backup_rotate_restore(self, word_model, settings_model, inserted_words, tmp_path, monkeypatch):
+        """온라인 백업, 보관 정책(압축/개수), 검사 후 복원 테스트"""
+        monkeypatch.setattr(config, 'BACKUP_KEEP_COUNT', 2)
+        monkeypatch.setattr(config, 'BACKUP_PAGES_PER_STEP', 1)
+        service = BackupService(str(tmp_path))
+        
+        for _ in range(3):
+            assert service.create_backup() is not None
+        assert service.rotate_backups() == 1
+        
+        backups = service.list_backups()
+        assert [b['compressed'] for b in backups] == [False, True]
+        result = service.verify_backup(backups[1]['path'])
+        assert result['ok'] and result['word_count'] == len(inserted_words)
+        
+        word_model.delete_word(inserted_words[0])
+        settings_model.set_setting('theme_mode', 'dark')
+        changes = []
+        listener = lambda key, old, new: changes.append((key, old, new))
+        settings_model.add_listener(listener)
+        try:
+            assert service.restore_backup(backups[1]['path'])
+        finally:
+            settings_model.remove_listener(listener)
+        
+        # 복원된 데이터와 설정 캐시 (복원 전 값이 남지 않음)
+        assert word_model.get_word_by_id(inserted_words[0]) is not None
+        assert settings_model.get_setting('theme_mode') == 'light'
+        assert ('theme_mode', 'dark', 'light') in changes
+
 
 class TestWordModel:
     """WordModel 테스트"""
@@ -47,6 +258,81 @@ class TestWordModel:
         assert len(results) >= 1
         assert results[0]['english'] == 'apple'
     
+    def test_search_words_prefix_and_snippet(self, word_model, inserted_words):
+        """FTS 접두어 검색 및 강조 snippet 테스트"""
+        results = word_model.search_words('app', 'english')
+        assert [r['english'] for r in results] == ['apple']
+        assert '<b>apple</b>' in results[0]['snippet']
+        
+        # 메모 검색: '동물' 접두어
+        results = word_model.search_words('동물', 'memo')
+        assert {r['english'] for r in results} == {'dog', 'elephant'}
+    
+    def test_search_words_infix_fallback(self, word_model, inserted_words):
+        """접두어가 아닌 중간/끝 일치는 LIKE 검색으로 찾는지 테스트"""
+        assert [r['english'] for r in word_model.search_words('과', 'korean')] == ['apple']
+        assert [r['english'] for r in word_model.search_words('끼', 'korean')] == ['elephant']
+        assert [r['english'] for r in word_model.search_words('phant', 'english')] == ['elephant']
+        assert word_model.search_words('xyz', 'all') == []
+    
+    def test_search_words_choseong(self, word_model, inserted_words):
+        """초성 검색 (접두/중간 일치) 테스트"""
+        results = word_model.search_words('ㅅㄱ', 'choseong')
+        assert [r['english'] for r in results] == ['apple']
+        
+        # 중간 일치: 코끼리 → ㅋㄲㄹ
+        results = word_model.search_words('ㄲㄹ', 'choseong')
+        assert [r['english'] for r in results] == ['elephant']
+        assert word_model.search_words_by_choseong('ㄲㄹ', prefix_only=True) == []
+        
+        # 뜻 수정 시 색인 갱신
+        word_model.update_word(inserted_words[0], korean='능금')
+        assert word_model.search_words('ㅅㄱ', 'choseong') == []
+        assert len(word_model.search_words('ㄴㄱ', 'choseong')) == 1
+    
+    def test_search_words_fuzzy(self, word_model, inserted_words):
+        """오타 허용 검색 테스트"""
+        word_model.add_word('receive', '받다', None)
+        word_model.add_word('recipe', '요리법', None)
+        
+        results = word_model.search_words('recieve', 'fuzzy')
+        assert results[0]['english'] == 'receive'
+        assert results[0]['distance'] == 2
+        
+        results = word_model.search_words_fuzzy('elefant')
+        assert [r['english'] for r in results] == ['elephant']
+        
+        # 단어 수정 시 색인 갱신
+        word_model.update_word(inserted_words[3], english='doge')
+        assert word_model.search_words_fuzzy('dogs')[0]['english'] == 'doge'
+    
+    def test_search_index_follows_updates(self, word_model, inserted_words):
+        """단어 수정/삭제 시 검색 인덱스 동기화 테스트"""
+        word_model.update_word(inserted_words[1], english='novel')
+        assert word_model.search_words('book', 'english') == []
+        assert len(word_model.search_words('nov', 'english')) == 1
+        
+        word_model.delete_word(inserted_words[1])
+        assert word_model.search_words('nov', 'english') == []
+    
+    def test_index_failure_rolls_back_word_writes(self, word_model, test_db, inserted_words):
+        """검색 색인 쓰기 실패 시 단어 추가/수정/일괄 추가 전체 롤백 테스트"""
+        word_count = word_model.get_count('words')
+        choseong_count = word_model.get_count('word_choseong')
+        test_db.get_connection().execute("DROP TABLE word_trigrams")
+        
+        assert word_model.add_word('broken', '고장') is None
+        assert word_model.get_count('words') == word_count
+        assert word_model.get_count('word_statistics') == word_count
+        assert word_model.get_count('word_choseong') == choseong_count
+        
+        assert word_model.update_word(inserted_words[0], english='changed') is False
+        assert word_model.get_word_by_id(inserted_words[0])['english'] != 'changed'
+        
+        result = word_model.bulk_import([{'english': 'bulk', 'korean': '대량'}])
+        assert result['success'] == 0 and result['errors']
+        assert word_model.get_count('words') == word_count
+    
     def test_update_word(self, word_model, inserted_words):
         """단어 수정 테스트"""
         word_id = inserted_words[0]
@@ -77,10 +363,130 @@ class TestWordModel:
         new_state = word_model.toggle_favorite(word_id)
         assert new_state == 0
     
+    def test_iter_all_words(self, word_model, inserted_words):
+        """전체 단어 스트리밍 조회 테스트"""
+        streamed = list(word_model.iter_all_words(batch_size=2))
+        materialized = word_model.get_all_words()
+        
+        assert len(streamed) == len(inserted_words)
+        assert [row['word_id'] for row in streamed] == [w['word_id'] for w in materialized]
+        assert streamed[0]['english'] == materialized[0]['english']
+    
+    def test_iter_export_to_csv(self, word_model, inserted_words, tmp_path):
+        """스트리밍 CSV 엑스포트 테스트"""
+        from utils.csv_handler import write_csv_rows, read_csv
+        
+        file_path = str(tmp_path / 'export.csv')
+        success, row_count = write_csv_rows(file_path, word_model.iter_export_to_csv(batch_size=2))
+        assert success is True
+        assert row_count == len(inserted_words)
+        assert len(read_csv(file_path)) == len(inserted_words)
+    
+    def test_bulk_import(self, word_model, statistics_model, inserted_words):
+        """대량 임포트 (중복/검증 실패 처리) 테스트"""
+        rows = [
+            {'english': 'grape', 'korean': '포도', 'memo': '과일'},
+            {'english': 'apple', 'korean': '사과', 'memo': None},   # 기존 단어와 중복
+            {'english': 'melon', 'korean': '', 'memo': None},       # 검증 실패
+            {'english': 'grape', 'korean': '포도', 'memo': None},   # 파일 내 중복
+            {'english': 'lemon', 'korean': '레몬', 'memo': None},
+        ]
+        result = word_model.bulk_import(rows)
+        
+        assert result['success'] == 2
+        assert result['failed'] == 3
+        assert result['duplicate'] == 2
+        assert result['errors'][0].startswith('행 2:')
+        assert word_model.get_word_count() == len(inserted_words) + 2
+        
+        # 통계 행과 검색 색인도 함께 생성
+        grape = word_model.search_words('ㅍㄷ', 'choseong')[0]
+        assert grape['english'] == 'grape'
+        assert statistics_model.get_word_statistics(grape['word_id']) is not None
+        assert word_model.search_words_fuzzy('lemmon')[0]['english'] == 'lemon'
+    
+    def test_bulk_import_stops_on_first_failure(self, word_model, inserted_words):
+        """중복 불허 시 첫 실패 행에서 중단 테스트"""
+        rows = [
+            {'english': 'grape', 'korean': '포도'},
+            {'english': 'book', 'korean': '책'},
+            {'english': 'lemon', 'korean': '레몬'},
+        ]
+        result = word_model.bulk_import(rows, skip_duplicates=False)
+        
+        assert result['success'] == 1
+        assert result['failed'] == 1
+        assert word_model.search_words('lemon', 'english') == []
+    
+    def test_bulk_import_streams_csv_chunks(self, word_model, tmp_path):
+        """CSV 청크 스트리밍 읽기 → 대량 임포트 테스트"""
+        import itertools
+        from utils.csv_handler import iter_csv, count_csv_rows
+        
+        file_path = tmp_path / 'import.csv'
+        lines = ['english,korean,memo'] + [f'word{i},뜻{i},' for i in range(7)] + [',빈값,', '']
+        file_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        assert count_csv_rows(str(file_path)) == 8
+        
+        progress = []
+        chunks = iter_csv(str(file_path), chunk_size=3,
+                          progress_callback=lambda read, skipped: progress.append((read, skipped)))
+        result = word_model.bulk_import(itertools.chain.from_iterable(chunks))
+        
+        assert result['success'] == 7
+        assert result['total'] == 7
+        assert result['aborted'] is False
+        assert progress == [(3, 0), (6, 0), (8, 1)]
+    
+    def test_neighbor_index(self, word_model):
+        """유사 단어(이웃) 색인 증분 갱신 및 재계산 테스트"""
+        ids = {
+            english: word_model.add_word(english, korean)
+            for english, korean in [('apple', '사과'), ('apply', '적용하다'), ('banana', '바나나'),
+                                    ('bandana', '두건'), ('pineapple', '파인애플')]
+        }
+        
+        neighbors = word_model.get_neighbor_words([ids['apple'], ids['banana']])
+        assert neighbors[ids['apple']][0]['english'] == 'apply'
+        assert neighbors[ids['banana']][0]['english'] == 'bandana'
+        
+        # 나중에 추가된 단어도 기존 단어의 이웃 목록에 들어감
+        apply_neighbors = [w['english'] for w in word_model.get_neighbor_words([ids['apply']])[ids['apply']]]
+        assert 'pineapple' in apply_neighbors
+        
+        # 수정 시 이웃 재계산
+        word_model.update_word(ids['bandana'], english='bandage')
+        assert word_model.get_neighbor_words([ids['banana']])[ids['banana']][0]['english'] == 'bandage'
+        
+        incremental = word_model.execute_query("SELECT COUNT(*) as count FROM word_neighbors")[0]['count']
+        rebuilt = word_model.rebuild_neighbor_index(workers=1)
+        assert rebuilt >= incremental
+        
+        # 저장이 실패하면 DELETE까지 롤백되어 기존 색인이 유지됨
+        word_model.db.get_connection().execute("""
+            CREATE TRIGGER fail_neighbor_insert BEFORE INSERT ON word_neighbors
+            BEGIN SELECT RAISE(ABORT, 'neighbors locked'); END
+        """)
+        assert word_model.rebuild_neighbor_index(workers=1) is None
+        assert word_model.execute_query("SELECT COUNT(*) as count FROM word_neighbors")[0]['count'] == rebuilt
+    
     def test_get_word_count(self, word_model, inserted_words):
         """단어 수 조회 테스트"""
         count = word_model.get_word_count()
         assert count == len(inserted_words)
+    
+    def test_sample_random_words(self, word_model, inserted_words):
+        """무작위 단어 추출 테스트 (삭제로 빈 ID 포함)"""
+        word_model.delete_word(inserted_words[1])
+        remaining = set(inserted_words) - {inserted_words[1]}
+        
+        sampled = word_model.sample_random_words(3)
+        assert len(sampled) == 3
+        assert len({w['word_id'] for w in sampled}) == 3
+        assert {w['word_id'] for w in sampled} <= remaining
+        
+        # 단어 수보다 많이 요청하면 전체 반환
+        assert {w['word_id'] for w in word_model.sample_random_words(100)} == remaining
 
 
 class TestSettingsModel:
@@ -121,6 +527,45 @@ class TestSettingsModel:
         # boolean
         bool_value = settings_model.get_setting('show_pronunciation')
         assert isinstance(bool_value, bool)
+    
+    def test_set_settings_failure_keeps_cache(self, settings_model, test_db):
+        """일괄 변경 중 한 건이 실패하면 DB와 캐시 모두 그대로인지 테스트"""
+        test_db.get_connection().execute("""
+            CREATE TRIGGER fail_font_size BEFORE UPDATE ON user_settings
+            WHEN NEW.setting_key = 'font_size'
+            BEGIN SELECT RAISE(ABORT, 'font_size locked'); END
+        """)
+        
+        assert settings_model.set_settings({'theme_mode': 'dark', 'font_size': 16}) is False
+        assert settings_model.get_setting('theme_mode') == 'light'
+        assert settings_model.get_setting('font_size') == 14
+        settings_model.load_cache()
+        assert settings_model.get_setting('theme_mode') == 'light'
+    
+    def test_settings_cache_and_listeners(self, settings_model):
+        """설정 캐시 write-through 및 변경 리스너 테스트"""
+        changes = []
+        listener = lambda key, old, new: changes.append((key, old, new))
+        settings_model.add_listener(listener)
+        try:
+            assert settings_model.set_settings({'daily_word_goal': 80, 'font_size': 16}) is True
+            assert SettingsModel().get_setting('daily_word_goal') == 80
+            row = settings_model.execute_query(
+                "SELECT setting_value FROM user_settings WHERE setting_key = 'font_size'"
+            )
+            assert row[0]['setting_value'] == '16'
+            
+            # 하나라도 유효하지 않으면 아무것도 바꾸지 않음
+            assert settings_model.set_settings({'daily_word_goal': 90, 'font_size': 'big'}) is False
+            assert settings_model.get_setting('daily_word_goal') == 80
+            
+            assert settings_model.reset_to_default() is True
+            assert settings_model.get_setting('font_size') == 14
+        finally:
+            settings_model.remove_listener(listener)
+        
+        assert ('daily_word_goal', 50, 80) in changes
+        assert ('font_size', 16, 14) in changes
 
 
 class TestStatisticsModel:
@@ -150,6 +595,91 @@ class TestStatisticsModel:
         assert stats['correct_count'] == 1
         assert stats['consecutive_correct'] == 1
     
+    def test_update_word_statistics_matches_rules(self, statistics_model, inserted_words):
+        """UPSERT 통계 갱신이 기존 계산 규칙(숙지도/오답률/연속 정답)과 일치하는지 테스트"""
+        answers = [False, False, True, True, True, True, False, True, True, True, False]
+        word_id = inserted_words[0]
+        
+        # 통계 행이 없는 상태에서 시작
+        statistics_model.execute_update("DELETE FROM word_statistics WHERE word_id = ?", (word_id,))
+        
+        expected = {'total_attempts': 0, 'correct_count': 0, 'wrong_count': 0,
+                    'mastery_level': 0, 'consecutive_correct': 0}
+        for is_correct in answers:
+            assert statistics_model.update_word_statistics(word_id, is_correct) is True
+            
+            expected['total_attempts'] += 1
+            expected['correct_count'] += int(is_correct)
+            expected['wrong_count'] += int(not is_correct)
+            expected['consecutive_correct'] = expected['consecutive_correct'] + 1 if is_correct else 0
+            wrong_rate = expected['wrong_count'] / expected['total_attempts'] * 100
+            expected['mastery_level'] = statistics_model._calculate_mastery_level(
+                expected['mastery_level'], expected['consecutive_correct'], wrong_rate
+            )
+            
+            stats = statistics_model.get_word_statistics(word_id)
+            for key, value in expected.items():
+                assert stats[key] == value, key
+            assert stats['wrong_rate'] == round(wrong_rate, 2)
+    
+    def test_update_word_statistics_batch(self, statistics_model, inserted_words):
+        """통계 일괄 갱신이 순차 갱신과 같은 결과인지 테스트"""
+        results = [(inserted_words[0], True), (inserted_words[1], False),
+                   (inserted_words[0], True), (inserted_words[0], True)]
+        assert statistics_model.update_word_statistics_batch(results) == 4
+        
+        for is_correct in (True, True, True):
+            statistics_model.update_word_statistics(inserted_words[2], is_correct)
+        
+        batched = statistics_model.get_word_statistics(inserted_words[0])
+        sequential = statistics_model.get_word_statistics(inserted_words[2])
+        for key in ('total_attempts', 'correct_count', 'mastery_level', 'consecutive_correct'):
+            assert batched[key] == sequential[key]
+        assert statistics_model.get_word_statistics(inserted_words[1])['wrong_rate'] == 100.0
+    
+    def test_update_word_statistics_batch_rolls_back(self, statistics_model, inserted_words):
+        """일괄 갱신 중 한 건이라도 실패하면 전체 롤백 테스트"""
+        before = statistics_model.get_word_statistics(inserted_words[0])
+        
+        # 존재하지 않는 단어 → 외래키 위반으로 UPSERT 실패
+        assert statistics_model.update_word_statistics_batch([(inserted_words[0], True), (999999, True)]) == 0
+        
+        after = statistics_model.get_word_statistics(inserted_words[0])
+        assert after['total_attempts'] == before['total_attempts']
+        assert after['next_review_date'] == before['next_review_date']
+    
+    def test_update_word_statistics_schedules_review(self, statistics_model, inserted_words):
+        """학습 결과로 다음 복습일(SM-2)이 계산되는지 테스트"""
+        word_id = inserted_words[0]
+        statistics_model.update_word_statistics_batch([(word_id, True), (word_id, True)])
+        
+        stats = statistics_model.get_word_statistics(word_id)
+        assert stats['repetition'] == 2
+        assert stats['review_interval'] == 6
+        assert stats['next_review_date'] > stats['last_study_date']
+        
+        statistics_model.update_word_statistics(word_id, False)
+        stats = statistics_model.get_word_statistics(word_id)
+        assert stats['repetition'] == 0
+        assert stats['review_interval'] == 1
+    
+    def test_get_due_words(self, statistics_model, inserted_words):
+        """복습 대상(예정일 지남 → 새 단어) 조회 테스트"""
+        statistics_model.update_word_statistics(inserted_words[0], True)
+        statistics_model.execute_update(
+            "UPDATE word_statistics SET next_review_date = ? WHERE word_id = ?",
+            ('2000-01-01T00:00:00', inserted_words[1])
+        )
+        
+        words = statistics_model.get_due_words()
+        word_ids = [w['word_id'] for w in words]
+        assert word_ids[0] == inserted_words[1]
+        assert inserted_words[0] not in word_ids
+        assert len(word_ids) == len(inserted_words) - 1
+        
+        assert [w['word_id'] for w in statistics_model.get_due_words(include_new=False)] == [inserted_words[1]]
+        assert len(statistics_model.get_due_words(limit=2)) == 2
+    
     def test_get_today_statistics(self, statistics_model, sample_session):
         """오늘의 통계 테스트"""
         stats = statistics_model.get_today_statistics()
@@ -157,12 +687,89 @@ class TestStatisticsModel:
         assert 'total_words' in stats
         assert 'accuracy' in stats
     
+    def test_daily_stats_incremental(self, statistics_model, learning_model, sample_session):
+        """세션 종료 시 daily_stats 증분 갱신 및 재집계 일치 테스트"""
+        stats = statistics_model.get_today_statistics()
+        assert stats['sessions'] == 1
+        assert stats['total_words'] == 3
+        
+        # 같은 세션을 다시 종료해도 중복 집계되지 않음 (변경 전 값 차감)
+        learning_model.end_session(sample_session, 4, 4, 0)
+        stats = statistics_model.get_today_statistics()
+        assert (stats['sessions'], stats['total_words'], stats['correct_count']) == (1, 4, 4)
+        assert stats['accuracy'] == 100.0
+        
+        before = statistics_model.execute_query("SELECT * FROM daily_stats ORDER BY stat_date, session_type")
+        assert statistics_model.rebuild_daily_stats() == 1
+        after = statistics_model.execute_query("SELECT * FROM daily_stats ORDER BY stat_date, session_type")
+        assert before == after
+        
+        # 재집계 INSERT가 실패하면 DELETE까지 롤백되어 기존 집계가 유지됨
+        statistics_model.db.get_connection().execute("""
+            CREATE TRIGGER fail_daily_stats_insert BEFORE INSERT ON daily_stats
+            BEGIN SELECT RAISE(ABORT, 'daily_stats locked'); END
+        """)
+        assert statistics_model.rebuild_daily_stats() is None
+        assert statistics_model.execute_query("SELECT * FROM daily_stats ORDER BY stat_date, session_type") == before
+        
+        weekly = statistics_model.get_weekly_statistics('2000-01-01T00:00:00', '2999-12-31T23:59:59')
+        assert len(weekly) == 1
+        assert weekly[0]['total_words'] == 4
+    
+    def test_get_streak_summary(self, statistics_model):
+        """연속 학습 일수(gaps-and-islands) 테스트 - 30일 제한 없음"""
+        from datetime import date, timedelta
+        
+        today = date(2026, 3, 10)
+        study_days = [today - timedelta(days=i) for i in range(45)]       # 오늘까지 45일 연속
+        study_days += [today - timedelta(days=i) for i in range(50, 110)]  # 과거 60일 연속
+        statistics_model.execute_many(
+            "INSERT INTO daily_stats (stat_date, session_type, sessions, total_words) VALUES (?, 'flashcard', 1, 5)",
+            [(day.isoformat(),) for day in study_days]
+        )
+        
+        summary = statistics_model.get_streak_summary(today.isoformat())
+        assert summary['current_streak'] == 45
+        assert summary['longest_streak'] == 60
+        assert [s['days'] for s in summary['streaks']] == [45, 60]
+        
+        # 오늘 학습하지 않았으면 현재 연속 일수 0
+        tomorrow = (today + timedelta(days=1)).isoformat()
+        assert statistics_model.get_streak_summary(tomorrow)['current_streak'] == 0
+    
     def test_calculate_personalization_score(self, statistics_model, inserted_words):
         """개인화 점수 계산 테스트"""
         word_id = inserted_words[0]
         score = statistics_model.calculate_personalization_score(word_id)
         assert score >= 0
         assert isinstance(score, float)
+    
+    def test_get_personalized_words(self, statistics_model, inserted_words):
+        """개인화 점수 일괄 계산/정렬 테스트"""
+        from datetime import datetime, timedelta
+        
+        two_days_ago = (datetime.now() - timedelta(days=2, hours=1)).strftime('%Y-%m-%dT%H:%M:%S')
+        statistics_model.execute_update("""
+            UPDATE word_statistics
+            SET total_attempts = 4, wrong_count = 3, wrong_rate = 75.0,
+                mastery_level = 1, last_study_date = ?
+            WHERE word_id = ?
+        """, (two_days_ago, inserted_words[2]))
+        statistics_model.execute_update("""
+            UPDATE word_statistics
+            SET total_attempts = 10, wrong_count = 0, wrong_rate = 0,
+                mastery_level = 5, last_study_date = ?
+            WHERE word_id = ?
+        """, (two_days_ago, inserted_words[4]))
+        
+        # 75×0.4 + 2×0.3 + 4×20×0.2 + 3×10×0.1 = 49.6, 미학습 = 50.0, 2×0.3 = 0.6
+        assert statistics_model.calculate_personalization_score(inserted_words[2]) == 49.6
+        assert statistics_model.calculate_personalization_score(inserted_words[4]) == 0.6
+        
+        words = statistics_model.get_personalized_words()
+        assert [w['word_id'] for w in words[-2:]] == [inserted_words[2], inserted_words[4]]
+        assert words[0]['personalization_score'] == 50.0
+        assert statistics_model.get_personalized_word_list(limit=2) == [w['word_id'] for w in words[:2]]
 
 
 class TestLearningModel:
@@ -200,6 +807,12 @@ class TestLearningModel:
         """세션 이력 조회 테스트"""
         history = learning_model.get_session_history(sample_session)
         assert len(history) == 3
+    
+    def test_iter_session_history(self, learning_model, sample_session):
+        """세션 이력 스트리밍 조회 테스트"""
+        history = list(learning_model.iter_session_history(sample_session, batch_size=1))
+        assert len(history) == 3
+        assert history[0]['english'] == 'apple'
 
 
 class TestExamModel:
@@ -217,7 +830,7 @@ class TestExamModel:
         word_id = word_model.add_word('exam_test', '시험테스트', None)
         
         # 시험 생성
-        exam_id = exam_model.create_exam('short_answer', 'en_to_ko', 1)
+        exam_id = exam_model.create_exam('short_answer', 'en_to_ko', config.MIN_EXAM_QUESTIONS)
         
         # 문제 저장
         question_id = exam_model.save_exam_question(
@@ -226,6 +839,34 @@ class TestExamModel:
         assert question_id is not None
         assert question_id > 0
     
+    def test_save_and_grade_exam_bulk(self, exam_model, word_model, inserted_words):
+        """시험 문제 일괄 저장 및 일괄 채점(오답 노트 반영) 테스트"""
+        exam_id = exam_model.create_exam('short_answer', 'en_to_ko', 5)
+        questions = [
+            {'word_id': word_id, 'question_number': i, 'correct_answer': f'정답{i}'}
+            for i, word_id in enumerate(inserted_words, 1)
+        ]
+        
+        question_ids = exam_model.save_exam_questions(exam_id, questions)
+        assert sorted(question_ids) == [1, 2, 3, 4, 5]
+        
+        answers = [
+            (question_ids[q['question_number']], q['correct_answer'] if q['question_number'] <= 3 else '오답', q['question_number'] <= 3)
+            for q in questions
+        ]
+        with exam_model.unit_of_work():
+            assert exam_model.grade_exam(exam_id, answers) is True
+            assert exam_model.finish_exam(exam_id, 60.0, 30) is True
+        
+        assert len(exam_model.get_wrong_questions(exam_id)) == 2
+        notes = exam_model.execute_query("SELECT word_id, wrong_count FROM wrong_note ORDER BY word_id")
+        assert [(n['word_id'], n['wrong_count']) for n in notes] == [(inserted_words[3], 1), (inserted_words[4], 1)]
+        
+        # 다시 틀리면 미해결 노트의 wrong_count 증가 (중복 행 없음)
+        exam_model.grade_exam(exam_id, answers)
+        notes = exam_model.execute_query("SELECT wrong_count FROM wrong_note")
+        assert [n['wrong_count'] for n in notes] == [2, 2]
+    
     def test_finish_exam(self, exam_model, word_model, statistics_model):
         """시험 종료 테스트"""
         # 테스트용 단어들 추가
@@ -236,7 +877,7 @@ class TestExamModel:
             statistics_model.initialize_word_statistics(word_id)
         
         # 시험 생성
-        exam_id = exam_model.create_exam('short_answer', 'en_to_ko', 3)
+        exam_id = exam_model.create_exam('short_answer', 'en_to_ko', config.MIN_EXAM_QUESTIONS)
         
         # 문제들 저장
         for i, word_id in enumerate(word_ids):
@@ -266,7 +907,7 @@ class TestExamModel:
             statistics_model.initialize_word_statistics(word_id)
         
         # 시험 생성
-        exam_id = exam_model.create_exam('short_answer', 'en_to_ko', 3)
+        exam_id = exam_model.create_exam('short_answer', 'en_to_ko', config.MIN_EXAM_QUESTIONS)
         
         # 문제들 저장 (모두 오답으로)
         for i, word_id in enumerate(word_ids):
@@ -282,6 +923,40 @@ class TestExamModel:
         # 오답 조회
         wrong = exam_model.get_wrong_questions(exam_id)
         assert len(wrong) == 3
+    
+    def test_wrong_note_upsert_and_pagination(self, exam_model, inserted_words):
+        """오답 노트 UPSERT (단어당 미해결 1행) 및 정렬/페이지 조회 테스트"""
+        exam_model.add_to_wrong_note(None, inserted_words[0])
+        exam_model.add_to_wrong_note(None, inserted_words[1])
+        exam_model.add_to_wrong_note(None, inserted_words[0])
+        
+        assert exam_model.get_wrong_note_count() == 2
+        frequent = exam_model.get_unresolved_wrong_notes(order_by='frequent')
+        assert [(n['word_id'], n['wrong_count']) for n in frequent] == [(inserted_words[0], 2), (inserted_words[1], 1)]
+        
+        page = exam_model.get_unresolved_wrong_notes(limit=1, offset=1, order_by='recent')
+        assert len(page) == 1
+        
+        # 해결 후 다시 틀리면 새 노트
+        assert exam_model.mark_wrong_note_resolved(inserted_words[0]) is True
+        # 직전 INSERT가 있어도 해결할 노트가 없으면 False (lastrowid와 rowcount 구분)
+        assert exam_model.mark_wrong_note_resolved(inserted_words[0]) is False
+        exam_model.add_to_wrong_note(None, inserted_words[0])
+        assert exam_model.get_count('wrong_note', 'word_id = ?', (inserted_words[0],)) == 2
+        assert exam_model.get_wrong_note_count() == 2
+    
+    def test_resolve_wrong_notes(self, exam_model, statistics_model, inserted_words):
+        """연속 정답 기준 도달 시 오답 노트 자동 해결 테스트"""
+        word_id = inserted_words[0]
+        exam_model.add_to_wrong_note(None, word_id)
+        
+        for _ in range(2):
+            statistics_model.update_word_statistics(word_id, True)
+        assert exam_model.resolve_wrong_notes([word_id]) == 0
+        
+        statistics_model.update_word_statistics(word_id, True)
+        assert exam_model.resolve_wrong_notes([word_id]) == 1
+        assert exam_model.get_wrong_note_count() == 0
 
 
 if __name__ == "__main__":
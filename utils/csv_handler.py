@@ -3,7 +3,7 @@
 
 """
 CSV 파일 임포트/엑스포트
-- 단어 데이터 읽기/쓰기
+- 단어 데이터 읽기/쓰기 (청크 단위 스트리밍 읽기/쓰기 지원)
 - CSV 구조 검증
 - 에러 처리
 """
@@ -11,6 +11,8 @@ CSV 파일 임포트/엑스포트
 import csv
 import sys
 import os
+import itertools
+import mmap
 # 프로젝트 루트를 sys.path에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
@@ -26,7 +28,7 @@ logger = get_logger(__name__)
 
 def read_csv(file_path):
     """
-    CSV 파일 읽기
+    CSV 파일 읽기 (전체를 리스트로 반환, 대용량 파일은 iter_csv 사용)
     
     Args:
         file_path (str): CSV 파일 경로
@@ -35,9 +37,38 @@ def read_csv(file_path):
         list: 단어 데이터 리스트 [{'english': '...', 'korean': '...', 'memo': '...'}, ...]
               None: 읽기 실패 시
     """
+    try:
+        data = [row for chunk in iter_csv(file_path) for row in chunk]
+    except (ValueError, OSError) as e:
+        logger.error(f"CSV 파일 읽기 실패: {e}")
+        return None
+    
+    logger.info(f"CSV 파일 읽기 완료: {len(data)}개 단어")
+    return data
+
+
+def iter_csv(file_path, chunk_size=None, progress_callback=None):
+    """
+    CSV 파일 청크 단위 스트리밍 읽기 (제너레이터)
+    파일 전체를 메모리에 올리지 않고 chunk_size 행씩 검증/정제하여 반환
+    
+    Args:
+        file_path (str): CSV 파일 경로
+        chunk_size (int, optional): 청크 크기 (기본: config.CSV_CHUNK_SIZE)
+        progress_callback (callable, optional): 청크마다 호출
+                                                callback(read_rows, skipped_rows)
+    
+    Yields:
+        list: 정제된 단어 데이터 청크 [{'english': '...', 'korean': '...', 'memo': '...'}, ...]
+    
+    Raises:
+        ValueError: 파일 없음, 헤더/필수 컬럼 누락, 인코딩 오류 등 읽기 실패
+    """
+    chunk_size = chunk_size or config.CSV_CHUNK_SIZE
+    
     if not os.path.exists(file_path):
         logger.error(f"CSV 파일을 찾을 수 없습니다: {file_path}")
-        return None
+        raise ValueError(f"CSV 파일을 찾을 수 없습니다: {file_path}")
     
     try:
         with open(file_path, 'r', encoding=config.CSV_ENCODING, newline='') as f:
@@ -46,43 +77,51 @@ def read_csv(file_path):
             # 헤더 검증
             if not reader.fieldnames:
                 logger.error("CSV 파일에 헤더가 없습니다")
-                return None
+                raise ValueError("CSV 파일에 헤더가 없습니다")
             
             # 필수 컬럼 확인
-            required_cols = set(config.CSV_REQUIRED_COLUMNS)
-            file_cols = set(reader.fieldnames)
-            
-            missing_cols = required_cols - file_cols
+            missing_cols = set(config.CSV_REQUIRED_COLUMNS) - set(reader.fieldnames)
             if missing_cols:
                 logger.error(f"필수 컬럼이 누락되었습니다: {missing_cols}")
-                return None
+                raise ValueError(f"필수 컬럼이 누락되었습니다: {', '.join(missing_cols)}")
+            
+            read_rows = 0
+            skipped_rows = 0
+            chunk = []
             
-            # 데이터 읽기
-            data = []
             for row_num, row in enumerate(reader, start=2):  # 헤더 다음 줄부터
+                read_rows += 1
+                
                 # 필수 컬럼 값 확인
                 if not row.get('english') or not row.get('korean'):
                     logger.warning(f"행 {row_num}: 영어 또는 한국어 값이 비어있습니다. 건너뜁니다.")
+                    skipped_rows += 1
                     continue
                 
                 # 데이터 정제
-                word_data = {
+                chunk.append({
                     'english': sanitize_string(row['english'], config.MAX_ENGLISH_LENGTH),
                     'korean': sanitize_string(row['korean'], config.MAX_KOREAN_LENGTH),
-                    'memo': sanitize_string(row.get('memo', ''), config.MAX_MEMO_LENGTH)
-                }
+                    'memo': sanitize_string(row.get('memo') or '', config.MAX_MEMO_LENGTH)
+                })
                 
-                data.append(word_data)
+                if len(chunk) >= chunk_size:
+                    if progress_callback:
+                        progress_callback(read_rows, skipped_rows)
+                    yield chunk
+                    chunk = []
             
-            logger.info(f"CSV 파일 읽기 완료: {len(data)}개 단어")
-            return data
+            if progress_callback:
+                progress_callback(read_rows, skipped_rows)
+            if chunk:
+                yield chunk
             
     except UnicodeDecodeError:
         logger.error(f"파일 인코딩 오류. UTF-8 형식으로 저장해주세요: {file_path}")
-        return None
-    except Exception as e:
+        raise ValueError("파일 인코딩 오류. UTF-8 형식으로 저장해주세요")
+    except csv.Error as e:
         logger.error(f"CSV 파일 읽기 실패: {e}")
-        return None
+        raise ValueError(f"CSV 파일 읽기 실패: {e}")
 
 
 def write_csv(file_path, data):
@@ -96,9 +135,30 @@ def write_csv(file_path, data):
     Returns:
         bool: 성공 여부
     """
-    if not data:
+    success, _ = write_csv_rows(file_path, data)
+    return success
+
+
+def write_csv_rows(file_path, rows):
+    """
+    CSV 파일 스트리밍 쓰기
+    리스트뿐 아니라 제너레이터(iter_query 결과 등)도 받아 한 행씩 기록
+    
+    Args:
+        file_path (str): CSV 파일 경로
+        rows (iterable): 단어 데이터 (dict 또는 sqlite3.Row, english/korean/memo 키)
+    
+    Returns:
+        tuple: (bool, int)
+            - bool: 성공 여부
+            - int: 기록한 행 수 (데이터가 없으면 0, 쓰기 오류 시 None)
+    """
+    rows = iter(rows)
+    first_row = next(rows, None)
+    
+    if first_row is None:
         logger.warning("저장할 데이터가 없습니다")
-        return False
+        return (False, 0)
     
     try:
         # 디렉토리가 없으면 생성
@@ -106,6 +166,7 @@ def write_csv(file_path, data):
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
         
+        row_count = 0
         with open(file_path, 'w', encoding=config.CSV_ENCODING, newline='') as f:
             # 헤더 정의
             fieldnames = ['english', 'korean', 'memo']
@@ -115,20 +176,35 @@ def write_csv(file_path, data):
             writer.writeheader()
             
             # 데이터 쓰기
-            for item in data:
-                row = {
-                    'english': item.get('english', ''),
-                    'korean': item.get('korean', ''),
-                    'memo': item.get('memo', '')
-                }
+            for item in itertools.chain((first_row,), rows):
+                row = {field: _get_field(item, field) for field in fieldnames}
                 writer.writerow(row)
+                row_count += 1
         
-        logger.info(f"CSV 파일 저장 완료: {file_path} ({len(data)}개 단어)")
-        return True
+        logger.info(f"CSV 파일 저장 완료: {file_path} ({row_count}개 단어)")
+        return (True, row_count)
         
     except Exception as e:
         logger.error(f"CSV 파일 쓰기 실패: {e}")
-        return False
+        return (False, None)
+
+
+def _get_field(item, field):
+    """
+    dict / sqlite3.Row 공통 필드 조회 (없거나 None이면 빈 문자열)
+    
+    Args:
+        item (dict or sqlite3.Row): 데이터 행
+        field (str): 필드 이름
+    
+    Returns:
+        str: 필드 값
+    """
+    try:
+        value = item[field]
+    except (KeyError, IndexError):
+        return ''
+    return value if value is not None else ''
 
 
 def validate_csv_structure(file_path, preview_lines=5):
@@ -226,7 +302,9 @@ def parse_csv_row(row):
 
 def count_csv_rows(file_path):
     """
-    CSV 파일의 행 수 계산 (헤더 제외)
+    CSV 파일의 행 수 계산 (헤더 제외, 진행률 표시용)
+    CSV 파싱 없이 mmap으로 줄바꿈 바이트만 블록 단위로 센다 (대용량 파일도 메모리 일정)
+    따옴표 안 줄바꿈이 있으면 실제 행 수보다 클 수 있음
     
     Args:
         file_path (str): CSV 파일 경로
@@ -238,13 +316,31 @@ def count_csv_rows(file_path):
         return 0
     
     try:
-        with open(file_path, 'r', encoding=config.CSV_ENCODING, newline='') as f:
-            reader = csv.reader(f, delimiter=config.CSV_DELIMITER)
-            # 헤더 건너뛰기
-            next(reader, None)
-            # 행 수 계산
-            return sum(1 for row in reader if any(row))  # 빈 행 제외
-    except Exception as e:
+        if os.path.getsize(file_path) == 0:
+            return 0
+        
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                block_size = config.CSV_COUNT_BLOCK_SIZE
+                
+                line_count = 0
+                for offset in range(0, size, block_size):
+                    line_count += mm[offset:offset + block_size].count(b'\n')
+                
+                # 마지막 줄에 줄바꿈이 없는 경우
+                if mm[size - 1:size] != b'\n':
+                    line_count += 1
+                
+                # 파일 끝의 빈 줄 제외
+                end = size
+                while end > 0 and mm[end - 1:end] in (b'\n', b'\r'):
+                    if mm[end - 1:end] == b'\n' and end < size:
+                        line_count -= 1
+                    end -= 1
+        
+        return max(line_count - 1, 0)  # 헤더 제외
+    except (OSError, ValueError) as e:
         logger.error(f"행 수 계산 실패: {e}")
         return 0
 
@@ -0,0 +1,124 @@
+# 2026-10-17 - 스마트 단어장 - 유사 검색 유틸리티
+# 파일 위치: C:\dev\word\utils\fuzzy_helper.py - v1.0
+
+"""
+오타 허용(유사) 검색용 유틸리티
+- 문자 트라이그램(3-gram) 생성: 색인 및 후보 추출용
+- 편집 거리(Levenshtein) 계산: 후보 순위 결정용
+"""
+
+
+def normalize_for_fuzzy(text):
+    """
+    유사 검색용 문자열 정규화 (소문자, 앞뒤 공백 제거)
+    
+    Args:
+        text (str): 원본 문자열
+    
+    Returns:
+        str: 정규화된 문자열
+    """
+    return (text or '').strip().lower()
+
+
+def make_trigrams(text):
+    """
+    문자 트라이그램 집합 생성
+    앞뒤를 공백 1개로 패딩 (단어 경계 표시, 짧은 단어도 트라이그램 생성)
+    
+    Args:
+        text (str): 원본 문자열 (예: 'cat')
+    
+    Returns:
+        set: 트라이그램 집합 (예: {' ca', 'cat', 'at '})
+    """
+    normalized = normalize_for_fuzzy(text)
+    if not normalized:
+        return set()
+    
+    padded = f" {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def min_shared_trigrams(text, max_distance):
+    """
+    편집 거리 max_distance 이내 단어가 최소한 공유해야 하는 트라이그램 수
+    편집 1회는 트라이그램을 최대 3개까지 바꿈
+    
+    Args:
+        text (str): 검색어
+        max_distance (int): 허용 편집 거리
+    
+    Returns:
+        int: 최소 공유 트라이그램 수 (1 이상)
+    """
+    return max(1, len(make_trigrams(text)) - 3 * max_distance)
+
+
+def levenshtein(a, b, max_distance=None):
+    """
+    두 문자열의 편집 거리 (삽입/삭제/치환 각 1)
+    Myers 비트 병렬 알고리즘: 짧은 쪽 문자열을 비트 벡터로 두고 긴 쪽을 한 글자씩 처리
+    
+    Args:
+        a (str): 문자열 1
+        b (str): 문자열 2
+        max_distance (int, optional): 이 값을 넘으면 max_distance + 1 반환
+    
+    Returns:
+        int: 편집 거리
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+    if not b:
+        return len(a)
+    
+    # 짧은 문자열(b)의 글자별 위치 비트마스크
+    peq = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    
+    mask = (1 << len(b)) - 1
+    last_bit = 1 << (len(b) - 1)
+    pv = mask
+    mv = 0
+    distance = len(b)
+    
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        
+        if ph & last_bit:
+            distance += 1
+        elif mh & last_bit:
+            distance -= 1
+        
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=" * 50)
+    print("fuzzy_helper 테스트")
+    print("=" * 50)
+    
+    print(f"트라이그램 (cat): {sorted(make_trigrams('cat'))}")
+    print(f"편집 거리 (recieve, receive): {levenshtein('recieve', 'receive')}")
+    print(f"편집 거리 (kitten, sitting): {levenshtein('kitten', 'sitting')}")
+    print(f"편집 거리 상한 (apple, banana, 2): {levenshtein('apple', 'banana', 2)}")
+    print(f"최소 공유 트라이그램 (recieve, 2): {min_shared_trigrams('recieve', 2)}")
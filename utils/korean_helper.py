@@ -0,0 +1,121 @@
+# 2026-10-17 - 스마트 단어장 - 한글 초성 유틸리티
+# 파일 위치: C:\dev\word\utils\korean_helper.py - v1.0
+
+"""
+한글 초성(choseong) 추출 및 초성 검색용 문자열 정규화
+- 완성형 음절(가~힣)은 초성으로 변환 (사과 → ㅅㄱ)
+- 호환 자음(ㄱ~ㅎ)은 그대로 유지
+- 영문/숫자는 소문자로 유지, 공백/기호는 제거
+"""
+
+# 완성형 한글 음절 범위
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+
+# 초성 하나당 음절 수 (중성 21 × 종성 28)
+SYLLABLES_PER_CHOSEONG = 588
+
+# 초성 순서 (유니코드 음절 배열 순)
+CHOSEONG_LIST = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+
+CHOSEONG_SET = frozenset(CHOSEONG_LIST)
+
+
+def is_hangul_syllable(char):
+    """
+    완성형 한글 음절 여부
+    
+    Args:
+        char (str): 문자 1개
+    
+    Returns:
+        bool: 음절 여부
+    """
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
+
+
+def get_choseong(char):
+    """
+    한글 음절의 초성 반환
+    
+    Args:
+        char (str): 문자 1개
+    
+    Returns:
+        str: 초성 (한글 음절이 아니면 None)
+    """
+    if not is_hangul_syllable(char):
+        return None
+    return CHOSEONG_LIST[(ord(char) - HANGUL_SYLLABLE_START) // SYLLABLES_PER_CHOSEONG]
+
+
+def to_choseong(text):
+    """
+    문자열을 초성 검색용 문자열로 변환
+    색인과 검색어 모두 이 함수로 정규화
+    
+    Args:
+        text (str): 원본 문자열 (예: '사과, 능금')
+    
+    Returns:
+        str: 초성 문자열 (예: 'ㅅㄱㄴㄱ')
+    """
+    if not text:
+        return ''
+    
+    result = []
+    for char in text:
+        choseong = get_choseong(char)
+        if choseong:
+            result.append(choseong)
+        elif char in CHOSEONG_SET:
+            result.append(char)
+        elif char.isascii() and char.isalnum():
+            result.append(char.lower())
+    
+    return ''.join(result)
+
+
+def is_choseong_query(text):
+    """
+    검색어가 초성만으로 이루어졌는지 확인
+    
+    Args:
+        text (str): 검색어
+    
+    Returns:
+        bool: 공백 제외 모든 문자가 호환 자음이면 True
+    """
+    chars = [c for c in text if not c.isspace()] if text else []
+    return bool(chars) and all(c in CHOSEONG_SET for c in chars)
+
+
+def build_choseong_suffixes(text):
+    """
+    초성 문자열의 모든 접미사 생성 (중간 일치 검색 색인용)
+    
+    Args:
+        text (str): 원본 문자열
+    
+    Returns:
+        list: [(position, suffix), ...] - position 0이 전체 문자열
+    """
+    choseong = to_choseong(text)
+    return [(i, choseong[i:]) for i in range(len(choseong))]
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=" * 50)
+    print("korean_helper 테스트")
+    print("=" * 50)
+    
+    for sample in ['사과', '컴퓨터', '큰 동물', '사과, 능금', 'IT 관련']:
+        print(f"{sample} → {to_choseong(sample)}")
+    
+    print(f"\n접미사: {build_choseong_suffixes('코끼리')}")
+    print(f"초성 검색어 여부 ('ㅅㄱ'): {is_choseong_query('ㅅㄱ')}")
+    print(f"초성 검색어 여부 ('사과'): {is_choseong_query('사과')}")
@@ -6,12 +6,23 @@
 - 콘솔 + 파일 로그 동시 출력
 - 로그 레벨별 포매팅
 - 로그 파일 로테이션
+- 큐 로깅 (config.LOG_QUEUE_ENABLED): 호출 스레드는 큐에 넣기만 하고
+  메시지 포매팅과 콘솔/파일 출력은 QueueListener 스레드에서 처리
+  (전용 로그 파일을 지정한 로거도 같은 큐를 거쳐 리스너에서 해당 파일로 분배)
+- 속도 제한 (config.LOG_RATE_LIMITS): 답변마다 남는 INFO 로그 등 폭주 방지
+
+핫 패스에서는 f-string 대신 %-스타일 인자를 사용 (레벨이 꺼져 있으면 포매팅 안 함)
+    logger.info("통계 업데이트: word_id=%s", word_id)
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # 프로젝트 루트를 sys.path에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,6 +32,191 @@ if project_root not in sys.path:
 
 import config
 
+# 큐 로깅 공유 상태 (모든 로거가 하나의 큐/리스너 사용)
+_queue_handler = None
+_queue_listener = None
+_queue_router = None
+_queue_lock = threading.Lock()
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    포매팅을 리스너 스레드로 미루는 QueueHandler
+    기본 QueueHandler.prepare()는 호출 스레드에서 메시지를 포매팅하므로 레코드를 그대로 넣음
+    (예외 정보만 호출 시점에 문자열로 고정)
+    로그 인자로 넘긴 가변 객체는 기록 직후 수정하지 않아야 함
+    """
+    
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class QueueRouter(logging.Handler):
+    """
+    리스너 스레드 쪽 분배 핸들러
+    전용 로그 파일을 지정한 로거의 레코드는 그 로거의 핸들러로, 나머지는 기본 핸들러로 보냄
+    """
+    
+    def __init__(self, default_handlers):
+        """
+        Args:
+            default_handlers (list): 기본 콘솔/파일 핸들러
+        """
+        super().__init__()
+        self.default_handlers = default_handlers
+        self.routes = {}  # 로거 이름: 핸들러 목록
+    
+    def handle(self, record):
+        for handler in self.routes.get(record.name, self.default_handlers):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+    
+    def emit(self, record):
+        self.handle(record)
+    
+    def close(self):
+        for handlers in [self.default_handlers, *self.routes.values()]:
+            for handler in handlers:
+                handler.close()
+        super().close()
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    로거별 속도 제한 필터
+    - 같은 메시지 템플릿(record.msg)마다 interval초 구간당 max_records건까지 통과
+    - 초과분은 버리고, 다음 구간 첫 레코드에 생략 건수를 덧붙임
+    - WARNING 이상은 항상 통과
+    """
+    
+    MAX_TEMPLATES = 1000
+    
+    def __init__(self, max_records, interval):
+        """
+        Args:
+            max_records (int): 구간당 최대 건수
+            interval (float): 구간 길이 (초)
+        """
+        super().__init__()
+        self.max_records = max_records
+        self.interval = interval
+        self._windows = {}  # 템플릿: [구간 시작, 통과 건수, 생략 건수]
+        self._lock = threading.Lock()
+    
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        
+        now = time.monotonic()
+        with self._lock:
+            # f-string 메시지처럼 템플릿이 매번 다르면 구간 정보가 쌓이므로 주기적으로 비움
+            if len(self._windows) > self.MAX_TEMPLATES:
+                self._windows.clear()
+            
+            window = self._windows.get(record.msg)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window else 0
+                self._windows[record.msg] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} (직전 {suppressed}건 생략)"
+                return True
+            
+            if window[1] < self.max_records:
+                window[1] += 1
+                return True
+            
+            window[2] += 1
+            return False
+
+
+def _create_handlers(log_file, level, formatter):
+    """
+    콘솔 + 로테이팅 파일 핸들러 생성 (내부 함수)
+    
+    Args:
+        log_file (str): 로그 파일 경로
+        level (int): 핸들러 로그 레벨
+        formatter (logging.Formatter): 포매터
+    
+    Returns:
+        list: [콘솔 핸들러, 파일 핸들러]
+    """
+    # 콘솔 핸들러 설정
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(level)
+    console_handler.setFormatter(formatter)
+    
+    # 로그 디렉토리가 없으면 생성
+    log_dir = os.path.dirname(log_file)
+    if not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+    
+    # 로테이팅 파일 핸들러 (10MB, 5개 백업)
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=config.LOG_MAX_BYTES,
+        backupCount=config.LOG_BACKUP_COUNT,
+        encoding='utf-8'
+    )
+    file_handler.setLevel(level)
+    file_handler.setFormatter(formatter)
+    
+    return [console_handler, file_handler]
+
+
+def _get_queue_handler(formatter, name=None, log_file=None):
+    """
+    공유 큐 핸들러 반환 (처음 호출 시 리스너 스레드 시작) (내부 함수)
+    
+    Args:
+        formatter (logging.Formatter): 리스너 쪽 핸들러 포매터
+        name (str, optional): 전용 로그 파일을 쓰는 로거 이름
+        log_file (str, optional): name 로거의 레코드를 보낼 로그 파일 경로
+    
+    Returns:
+        DeferredQueueHandler: 큐 핸들러
+    """
+    global _queue_handler, _queue_listener, _queue_router
+    
+    with _queue_lock:
+        if _queue_handler is None:
+            log_queue = queue.SimpleQueue()
+            # 레벨은 각 로거에서 거름 (리스너 쪽 핸들러는 모두 통과)
+            _queue_router = QueueRouter(_create_handlers(config.LOG_FILE, logging.NOTSET, formatter))
+            _queue_listener = QueueListener(log_queue, _queue_router, respect_handler_level=True)
+            _queue_listener.start()
+            _queue_handler = DeferredQueueHandler(log_queue)
+            atexit.register(shutdown_logging)
+        
+        if log_file is not None and name not in _queue_router.routes:
+            _queue_router.routes[name] = _create_handlers(log_file, logging.NOTSET, formatter)
+        return _queue_handler
+
+
+def shutdown_logging():
+    """
+    큐 리스너 종료 (남은 로그를 모두 쓴 뒤 반환, 프로그램 종료 시 자동 호출)
+    """
+    global _queue_handler, _queue_listener, _queue_router
+    
+    with _queue_lock:
+        if _queue_listener is not None:
+            _queue_listener.stop()
+            for handler in _queue_listener.handlers:
+                handler.close()
+            _queue_listener = None
+            _queue_router = None
+        
+        if _queue_handler is not None:
+            for logger in list(logging.Logger.manager.loggerDict.values()):
+                if isinstance(logger, logging.Logger) and _queue_handler in logger.handlers:
+                    logger.removeHandler(_queue_handler)
+            _queue_handler = None
+
 
 def setup_logger(name, log_file=None, level=None):
     """
@@ -28,7 +224,8 @@ def setup_logger(name, log_file=None, level=None):
     
     Args:
         name (str): 로거 이름 (일반적으로 __name__ 사용)
-        log_file (str, optional): 로그 파일 경로. None이면 config.LOG_FILE 사용
+        log_file (str, optional): 전용 로그 파일 경로. None이면 config.LOG_FILE 사용
+                                  (큐 로깅이면 리스너에서 이 파일로 분배)
         level (int, optional): 로그 레벨. None이면 config.LOG_LEVEL 사용
     
     Returns:
@@ -52,31 +249,17 @@ def setup_logger(name, log_file=None, level=None):
         datefmt=config.LOG_DATE_FORMAT
     )
     
-    # 콘솔 핸들러 설정
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    if config.LOG_QUEUE_ENABLED:
+        # 큐 핸들러 (출력은 리스너 스레드)
+        logger.addHandler(_get_queue_handler(formatter, name, log_file))
+    else:
+        for handler in _create_handlers(log_file or config.LOG_FILE, level, formatter):
+            logger.addHandler(handler)
     
-    # 파일 핸들러 설정
-    if log_file is None:
-        log_file = config.LOG_FILE
-    
-    # 로그 디렉토리가 없으면 생성
-    log_dir = os.path.dirname(log_file)
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # 로테이팅 파일 핸들러 (10MB, 5개 백업)
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=config.LOG_MAX_BYTES,
-        backupCount=config.LOG_BACKUP_COUNT,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # 속도 제한
+    rate_limit = config.LOG_RATE_LIMITS.get(name)
+    if rate_limit:
+        logger.addFilter(RateLimitFilter(*rate_limit))
     
     # 상위 로거로 전파 방지 (중복 로그 방지)
     logger.propagate = False
@@ -113,7 +296,7 @@ def log_exception(logger, exception, message="예외 발생"):
         exception (Exception): 예외 객체
         message (str): 추가 메시지
     """
-    logger.error(f"{message}: {type(exception).__name__}: {str(exception)}", exc_info=True)
+    logger.error("%s: %s: %s", message, type(exception).__name__, exception, exc_info=True)
 
 
 # 테스트 코드 (직접 실행 시에만 동작)
@@ -138,6 +321,16 @@ if __name__ == "__main__":
     except Exception as e:
         log_exception(test_logger, e, "테스트 예외")
     
+    # 속도 제한 테스트 (구간당 3건)
+    test_logger.addFilter(RateLimitFilter(3, 0.5))
+    for i in range(10):
+        test_logger.info("답변 처리: %d", i)
+    time.sleep(0.6)
+    test_logger.info("답변 처리: %d", 10)
+    
+    # 큐에 남은 로그 출력
+    shutdown_logging()
+    
     print("\n로그 파일 위치:", config.LOG_FILE)
     print("로거 테스트 완료")
-    print("=" * 50)
\ No newline at end of file
+    print("=" * 50)
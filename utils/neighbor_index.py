@@ -0,0 +1,277 @@
+# 2026-10-17 - 스마트 단어장 - 유사 단어(이웃) 계산
+# 파일 위치: C:\dev\word\utils\neighbor_index.py - v1.0
+
+"""
+객관식 오답 선택지용 유사 단어(이웃) 계산
+- 유사도: 영어 트라이그램 Jaccard + 한국어 뜻 공통 음절 Jaccard + 영어 길이 비율 (가중합)
+- rank_neighbors(): 후보 목록에서 한 단어의 상위 K개 이웃 (증분 갱신용)
+- build_neighbor_rows(): 전체 단어의 상위 K개 이웃 일괄 계산 (큰 단어장은 프로세스 풀)
+
+영어 또는 뜻이 같은 단어는 이웃에서 제외 (다른 뜻의 같은 단어는 오답이 아니므로)
+"""
+
+import heapq
+import sys
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+from utils.fuzzy_helper import normalize_for_fuzzy, make_trigrams
+from utils.korean_helper import is_hangul_syllable
+
+# 일괄 계산 작업자(프로세스)별 공유 데이터 (_init_worker에서 설정)
+_worker_state = {}
+
+
+def word_features(english, korean):
+    """
+    유사도 계산용 단어 특징
+    
+    Args:
+        english (str): 영어 단어
+        korean (str): 한국어 뜻
+    
+    Returns:
+        tuple: (정규화 영어, 정규화 뜻, 트라이그램 집합, 한글 음절 집합, 영어 길이)
+    """
+    normalized = normalize_for_fuzzy(english)
+    return (
+        normalized,
+        (korean or '').strip(),
+        make_trigrams(english),
+        {char for char in korean or '' if is_hangul_syllable(char)},
+        len(normalized)
+    )
+
+
+def _jaccard(a, b):
+    """
+    두 집합의 Jaccard 유사도
+    
+    Args:
+        a (set): 집합 1
+        b (set): 집합 2
+    
+    Returns:
+        float: 0.0 ~ 1.0
+    """
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def _weighted_similarity(features_a, features_b, weights):
+    """
+    두 단어의 유사도 가중합 (반올림 없음, 일괄 계산용)
+    
+    Args:
+        features_a (tuple): word_features 결과
+        features_b (tuple): word_features 결과
+        weights (tuple): (영어, 뜻, 길이) 가중치
+    
+    Returns:
+        float: 0.0 ~ 1.0
+    """
+    length_a, length_b = features_a[4], features_b[4]
+    longer = length_a if length_a > length_b else length_b
+    length_ratio = (length_a + length_b - longer) / longer if longer else 0.0
+    
+    return (
+        weights[0] * _jaccard(features_a[2], features_b[2])
+        + weights[1] * _jaccard(features_a[3], features_b[3])
+        + weights[2] * length_ratio
+    )
+
+
+def _weights():
+    """
+    config.NEIGHBOR_SIMILARITY_WEIGHTS를 (영어, 뜻, 길이) 튜플로 반환
+    
+    Returns:
+        tuple: 가중치
+    """
+    weights = config.NEIGHBOR_SIMILARITY_WEIGHTS
+    return (weights['english'], weights['korean'], weights['length'])
+
+
+def similarity(features_a, features_b):
+    """
+    두 단어의 유사도 (config.NEIGHBOR_SIMILARITY_WEIGHTS 가중합)
+    
+    Args:
+        features_a (tuple): word_features 결과
+        features_b (tuple): word_features 결과
+    
+    Returns:
+        float: 0.0 ~ 1.0 (소수점 4자리)
+    """
+    return round(_weighted_similarity(features_a, features_b, _weights()), 4)
+
+
+def rank_neighbors(word_id, features, candidates, k=None):
+    """
+    후보 중 유사도 상위 K개 이웃
+    
+    Args:
+        word_id (int): 기준 단어 ID
+        features (tuple): 기준 단어의 word_features
+        candidates (iterable): [(word_id, features), ...]
+        k (int, optional): 이웃 수 (기본: config.NEIGHBOR_COUNT)
+    
+    Returns:
+        list: [(neighbor_id, similarity), ...] 유사도 높은 순
+    """
+    weights = _weights()
+    english, korean = features[0], features[1]
+    scored = [
+        (_weighted_similarity(features, candidate_features, weights), -candidate_id)
+        for candidate_id, candidate_features in candidates
+        if candidate_id != word_id
+        and candidate_features[0] != english
+        and candidate_features[1] != korean
+    ]
+    return [
+        (-negative_id, round(score, 4))
+        for score, negative_id in heapq.nlargest(k or config.NEIGHBOR_COUNT, scored)
+        if score > 0
+    ]
+
+
+def _feature_keys(features):
+    """
+    후보 검색용 역색인 키 (트라이그램 'e:', 한글 음절 'k:')
+    
+    Args:
+        features (tuple): word_features 결과
+    
+    Returns:
+        list: 키 목록
+    """
+    return [f"e:{trigram}" for trigram in features[2]] + [f"k:{syllable}" for syllable in features[3]]
+
+
+def _init_worker(word_ids, features, postings, k):
+    """
+    일괄 계산 작업자 초기화 (프로세스마다 한 번)
+    
+    Args:
+        word_ids (list): 단어 ID (위치 = 인덱스)
+        features (list): 단어별 word_features
+        postings (dict): {키: [단어 인덱스, ...]}
+        k (int): 이웃 수
+    """
+    _worker_state.update(word_ids=word_ids, features=features, postings=postings, k=k)
+
+
+def _neighbors_for_range(start, end):
+    """
+    start ~ end-1 번째 단어의 이웃 계산 (작업자에서 실행)
+    공유 키가 많은 후보 NEIGHBOR_CANDIDATE_LIMIT개만 유사도 계산
+    
+    Args:
+        start (int): 시작 인덱스
+        end (int): 끝 인덱스 (미포함)
+    
+    Returns:
+        list: [(word_id, neighbor_id, similarity), ...]
+    """
+    word_ids = _worker_state['word_ids']
+    features = _worker_state['features']
+    postings = _worker_state['postings']
+    k = _worker_state['k']
+    
+    rows = []
+    for index in range(start, end):
+        shared = Counter()
+        for key in _feature_keys(features[index]):
+            shared.update(postings.get(key, ()))
+        shared.pop(index, None)
+        
+        candidates = [
+            (word_ids[candidate], features[candidate])
+            for candidate, _ in shared.most_common(config.NEIGHBOR_CANDIDATE_LIMIT)
+        ]
+        word_id = word_ids[index]
+        rows.extend(
+            (word_id, neighbor_id, score)
+            for neighbor_id, score in rank_neighbors(word_id, features[index], candidates, k)
+        )
+    return rows
+
+
+def build_neighbor_rows(words, k=None, workers=None):
+    """
+    전체 단어의 이웃 일괄 계산
+    - 트라이그램/음절 역색인으로 후보를 좁힘 (너무 흔한 키는 NEIGHBOR_MAX_POSTING 초과 시 제외)
+    - 단어가 NEIGHBOR_PARALLEL_MIN_WORDS개 이상이면 프로세스 풀로 분할 계산
+    
+    Args:
+        words (iterable): [(word_id, english, korean), ...]
+        k (int, optional): 단어당 이웃 수 (기본: config.NEIGHBOR_COUNT)
+        workers (int, optional): 프로세스 수 (1이면 현재 프로세스에서 계산)
+    
+    Returns:
+        list: [(word_id, neighbor_id, similarity), ...]
+    """
+    word_ids = []
+    features = []
+    for word_id, english, korean in words:
+        word_ids.append(word_id)
+        features.append(word_features(english, korean))
+    
+    postings = {}
+    for index, word_features_ in enumerate(features):
+        for key in _feature_keys(word_features_):
+            postings.setdefault(key, []).append(index)
+    postings = {
+        key: indexes for key, indexes in postings.items()
+        if 1 < len(indexes) <= config.NEIGHBOR_MAX_POSTING
+    }
+    
+    k = k or config.NEIGHBOR_COUNT
+    if workers is None:
+        workers = os.cpu_count() if len(word_ids) >= config.NEIGHBOR_PARALLEL_MIN_WORDS else 1
+    
+    if workers <= 1 or len(word_ids) < 2:
+        _init_worker(word_ids, features, postings, k)
+        try:
+            return _neighbors_for_range(0, len(word_ids))
+        finally:
+            _worker_state.clear()
+    
+    # 작업자 수의 4배로 나눠 작업량 불균형 완화
+    chunk_size = max(1, -(-len(word_ids) // (workers * 4)))
+    ranges = [(start, min(start + chunk_size, len(word_ids))) for start in range(0, len(word_ids), chunk_size)]
+    
+    rows = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(word_ids, features, postings, k)
+    ) as executor:
+        for chunk_rows in executor.map(_neighbors_for_range, *zip(*ranges)):
+            rows.extend(chunk_rows)
+    return rows
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=" * 50)
+    print("neighbor_index 테스트")
+    print("=" * 50)
+    
+    samples = [
+        (1, 'apple', '사과'), (2, 'apply', '적용하다'), (3, 'ample', '충분한'),
+        (4, 'maple', '단풍나무'), (5, 'banana', '바나나'), (6, 'bandana', '두건'),
+        (7, 'application', '적용, 지원서'), (8, 'pineapple', '파인애플')
+    ]
+    for word_id, neighbor_id, score in build_neighbor_rows(samples, k=3, workers=1):
+        print(f"  {samples[word_id - 1][1]} → {samples[neighbor_id - 1][1]}: {score}")
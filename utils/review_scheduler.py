@@ -0,0 +1,247 @@
+# 2026-10-17 - 스마트 단어장 - 간격 반복 스케줄러
+# 파일 위치: C:\dev\word\utils\review_scheduler.py - v1.0
+
+"""
+간격 반복(Spaced Repetition) 복습 일정 계산
+- SM2Scheduler: SuperMemo SM-2 (간격 × 난이도 계수)
+- FSRSScheduler: FSRS-4.5 방식 (기억 안정도/난이도 모델)
+- get_scheduler(): config.REVIEW_SCHEDULER에 따라 스케줄러 선택
+
+정답/오답만 기록하므로 평가 등급은 정답=Good, 오답=Again으로 변환
+"""
+
+import math
+import sys
+import os
+from datetime import timedelta
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+from utils.datetime_helper import parse_datetime
+
+
+class ReviewScheduler:
+    """
+    스케줄러 기본 클래스
+    
+    state (dict) 키:
+        review_interval (float): 현재 복습 간격 (일)
+        ease_factor (float): SM-2 난이도 계수
+        repetition (int): 연속 성공 복습 횟수
+        stability (float): FSRS 기억 안정도 (일)
+        difficulty (float): FSRS 난이도 (1~10)
+        last_study_date (str): 직전 학습 일시 (없으면 None)
+    """
+    name = None
+    
+    def schedule(self, state, is_correct, now):
+        """
+        답변 결과로 다음 복습 일정 계산
+        
+        Args:
+            state (dict): 현재 복습 상태 (값이 None이면 새 단어)
+            is_correct (bool): 정답 여부
+            now (datetime): 현재 시각
+        
+        Returns:
+            dict: 갱신된 복습 상태 + next_review_date (ISO 8601 문자열)
+        """
+        raise NotImplementedError
+    
+    def _finish(self, new_state, now):
+        """
+        간격 상한 적용 후 next_review_date 계산 (공통)
+        
+        Args:
+            new_state (dict): 갱신된 상태 (review_interval 포함)
+            now (datetime): 현재 시각
+        
+        Returns:
+            dict: next_review_date가 추가된 상태
+        """
+        interval = min(new_state['review_interval'], config.REVIEW_MAX_INTERVAL)
+        new_state['review_interval'] = round(interval, 4)
+        new_state['next_review_date'] = (now + timedelta(days=interval)).strftime(config.ISO8601_FORMAT)
+        return new_state
+
+
+class SM2Scheduler(ReviewScheduler):
+    """
+    SuperMemo SM-2
+    - 성공: 1일 → 6일 → 이전 간격 × 난이도 계수
+    - 실패: 연속 횟수 초기화, 1일 후 복습
+    - 난이도 계수: 최소 1.3, 실패할수록 감소
+    """
+    name = 'sm2'
+    
+    # 정답/오답을 SM-2 평가(0~5)로 변환
+    QUALITY_CORRECT = 4
+    QUALITY_WRONG = 1
+    
+    def schedule(self, state, is_correct, now):
+        quality = self.QUALITY_CORRECT if is_correct else self.QUALITY_WRONG
+        ease = state.get('ease_factor') or config.SM2_INITIAL_EASE
+        repetition = state.get('repetition') or 0
+        interval = state.get('review_interval') or 0
+        
+        if quality >= 3:
+            if repetition == 0:
+                interval = 1
+            elif repetition == 1:
+                interval = 6
+            else:
+                interval = round(interval * ease)
+            repetition += 1
+        else:
+            repetition = 0
+            interval = 1
+        
+        ease = max(1.3, ease + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)))
+        
+        return self._finish({
+            'review_interval': interval,
+            'ease_factor': round(ease, 4),
+            'repetition': repetition,
+            'stability': state.get('stability'),
+            'difficulty': state.get('difficulty')
+        }, now)
+
+
+class FSRSScheduler(ReviewScheduler):
+    """
+    FSRS-4.5 방식
+    - 기억 안정도(S): 회상 확률이 90%로 떨어지기까지의 일수
+    - 난이도(D): 1~10, 실패할수록 증가 (평균으로 회귀)
+    - 다음 간격: 목표 기억 유지율(config.FSRS_REQUEST_RETENTION)에 도달하는 시점
+    """
+    name = 'fsrs'
+    
+    # FSRS-4.5 기본 가중치
+    WEIGHTS = (
+        0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+        0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755
+    )
+    DECAY = -0.5
+    FACTOR = 19 / 81
+    
+    # 평가 등급 (Again=1, Hard=2, Good=3, Easy=4)
+    RATING_CORRECT = 3
+    RATING_WRONG = 1
+    
+    def schedule(self, state, is_correct, now):
+        w = self.WEIGHTS
+        rating = self.RATING_CORRECT if is_correct else self.RATING_WRONG
+        stability = state.get('stability')
+        difficulty = state.get('difficulty')
+        repetition = state.get('repetition') or 0
+        
+        if not stability or not difficulty:
+            # 첫 복습
+            stability = w[rating - 1]
+            difficulty = self._initial_difficulty(rating)
+        else:
+            elapsed_days = self._elapsed_days(state.get('last_study_date'), now)
+            retrievability = (1 + self.FACTOR * elapsed_days / stability) ** self.DECAY
+            
+            if is_correct:
+                stability = stability * (
+                    1 + math.exp(w[8]) * (11 - difficulty) * stability ** -w[9]
+                    * (math.exp(w[10] * (1 - retrievability)) - 1)
+                )
+            else:
+                stability = min(stability, (
+                    w[11] * difficulty ** -w[12] * ((stability + 1) ** w[13] - 1)
+                    * math.exp(w[14] * (1 - retrievability))
+                ))
+            
+            # 난이도 갱신 + 평균(Good 초기 난이도)으로 회귀
+            difficulty = difficulty - w[6] * (rating - 3)
+            difficulty = w[7] * self._initial_difficulty(3) + (1 - w[7]) * difficulty
+        
+        difficulty = min(max(difficulty, 1.0), 10.0)
+        repetition = repetition + 1 if is_correct else 0
+        
+        retention = config.FSRS_REQUEST_RETENTION
+        interval = stability / self.FACTOR * (retention ** (1 / self.DECAY) - 1)
+        
+        return self._finish({
+            'review_interval': max(interval, 1 if is_correct else 0),
+            'ease_factor': state.get('ease_factor'),
+            'repetition': repetition,
+            'stability': round(stability, 4),
+            'difficulty': round(difficulty, 4)
+        }, now)
+    
+    def _initial_difficulty(self, rating):
+        """
+        등급별 초기 난이도
+        
+        Args:
+            rating (int): 평가 등급 (1~4)
+        
+        Returns:
+            float: 초기 난이도
+        """
+        w = self.WEIGHTS
+        return w[4] - (rating - 3) * w[5]
+    
+    def _elapsed_days(self, last_study_date, now):
+        """
+        직전 학습 이후 경과 일수
+        
+        Args:
+            last_study_date (str): 직전 학습 일시
+            now (datetime): 현재 시각
+        
+        Returns:
+            float: 경과 일수 (기록 없으면 0)
+        """
+        last = parse_datetime(last_study_date) if last_study_date else None
+        if last is None:
+            return 0.0
+        return max((now - last).total_seconds() / 86400, 0.0)
+
+
+SCHEDULERS = {
+    SM2Scheduler.name: SM2Scheduler,
+    FSRSScheduler.name: FSRSScheduler,
+}
+
+
+def get_scheduler(name=None):
+    """
+    스케줄러 인스턴스 반환
+    
+    Args:
+        name (str, optional): 'sm2' | 'fsrs' (기본: config.REVIEW_SCHEDULER)
+    
+    Returns:
+        ReviewScheduler: 스케줄러 (알 수 없는 이름이면 SM-2)
+    """
+    scheduler_class = SCHEDULERS.get(name or config.REVIEW_SCHEDULER, SM2Scheduler)
+    return scheduler_class()
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    from datetime import datetime
+    
+    print("=" * 50)
+    print("review_scheduler 테스트")
+    print("=" * 50)
+    
+    for scheduler_name in SCHEDULERS:
+        scheduler = get_scheduler(scheduler_name)
+        state = {}
+        now = datetime(2026, 1, 1, 9, 0, 0)
+        print(f"\n[{scheduler_name}]")
+        for is_correct in [True, True, True, False, True]:
+            state = scheduler.schedule(state, is_correct, now)
+            print(f"  정답={is_correct}: 간격 {state['review_interval']}일 → {state['next_review_date']}")
+            state['last_study_date'] = now.strftime(config.ISO8601_FORMAT)
+            now = parse_datetime(state['next_review_date'])
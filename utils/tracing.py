@@ -0,0 +1,274 @@
+# 2026-10-17 - 스마트 단어장 - 실행 구간 추적 (트레이싱)
+# 파일 위치: C:\dev\word\utils\tracing.py - v1.0
+
+"""
+Controller → Model → DB 호출 구간 추적 (Chrome/Perfetto 트레이스 JSON)
+- trace_methods(category): 클래스의 공개 메서드 전체를 구간으로 기록 (Controller 클래스 데코레이터,
+  BaseModel 하위 클래스는 자동 적용)
+- traced() / span(): 함수 하나 / 코드 블록 하나를 구간으로 기록
+- DBConnection은 쿼리마다 'db' 구간 기록 (정규화된 SQL 이름)
+- 기록 중이 아니면 플래그 확인만 하고 바로 원래 함수 호출
+
+사용 예:
+    start_tracing()
+    ExamController().create_exam('multiple_choice', 'en_to_ko', 20)
+    stop_tracing('logs/traces/create_exam.json')   # chrome://tracing 또는 ui.perfetto.dev에서 열기
+
+config.TRACING_ENABLED이면 시작 시 자동 기록, 종료 시 config.TRACE_FILE로 저장
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+# 프로젝트 루트를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import config
+
+# 기록 상태 (모든 스레드 공유)
+_active = False
+_events = []
+_dropped = 0
+_thread_ids = set()
+_origin = time.perf_counter()
+_lock = threading.Lock()
+
+
+def is_tracing():
+    """
+    기록 중 여부
+    
+    Returns:
+        bool: 기록 중이면 True
+    """
+    return _active
+
+
+def start_tracing():
+    """
+    기록 시작 (이전 기록은 버림)
+    """
+    global _active, _dropped, _origin
+    
+    with _lock:
+        _events.clear()
+        _thread_ids.clear()
+        _dropped = 0
+        _origin = time.perf_counter()
+        _active = True
+
+
+def stop_tracing(path=None):
+    """
+    기록 중지 (path를 주면 트레이스 파일 저장)
+    
+    Args:
+        path (str, optional): 저장 경로
+    
+    Returns:
+        int: 기록된 구간 수
+    """
+    global _active
+    
+    _active = False
+    if path:
+        export_trace(path)
+    with _lock:
+        return sum(1 for event in _events if event['ph'] == 'X')
+
+
+def add_complete_event(name, category, started, duration, args=None):
+    """
+    완료된 구간 하나 기록 (Chrome 트레이스 'X' 이벤트)
+    
+    Args:
+        name (str): 구간 이름
+        category (str): 분류 ('controller', 'model', 'db' 등)
+        started (float): 시작 시각 (time.perf_counter 값)
+        duration (float): 소요 시간 (초)
+        args (dict, optional): 추가 정보
+    """
+    global _dropped
+    
+    if not _active:
+        return
+    
+    thread = threading.current_thread()
+    event = {
+        'name': name,
+        'cat': category,
+        'ph': 'X',
+        'ts': round((started - _origin) * 1_000_000, 3),
+        'dur': round(duration * 1_000_000, 3),
+        'pid': os.getpid(),
+        'tid': thread.ident,
+    }
+    if args:
+        event['args'] = args
+    
+    with _lock:
+        if len(_events) >= config.TRACE_MAX_EVENTS:
+            _dropped += 1
+            return
+        if thread.ident not in _thread_ids:
+            _thread_ids.add(thread.ident)
+            _events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': event['pid'], 'tid': thread.ident,
+                'args': {'name': thread.name},
+            })
+        _events.append(event)
+
+
+@contextmanager
+def span(name, category='app', **args):
+    """
+    코드 블록을 구간으로 기록
+    
+    Args:
+        name (str): 구간 이름
+        category (str): 분류
+        **args: 추가 정보 (트레이스 뷰어에 표시)
+    """
+    if not _active:
+        yield
+        return
+    
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        args['error'] = type(e).__name__
+        raise
+    finally:
+        add_complete_event(name, category, started, time.perf_counter() - started, args)
+
+
+def traced(name=None, category='app'):
+    """
+    함수 호출을 구간으로 기록하는 데코레이터
+    
+    Args:
+        name (str, optional): 구간 이름 (기본: 함수의 __qualname__)
+        category (str): 분류
+    
+    Returns:
+        callable: 데코레이터
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _active:
+                return func(*args, **kwargs)
+            
+            started = time.perf_counter()
+            error = None
+            try:
+                return func(*args, **kwargs)
+            except BaseException as e:
+                error = {'error': type(e).__name__}
+                raise
+            finally:
+                add_complete_event(span_name, category, started, time.perf_counter() - started, error)
+        
+        wrapper.__traced__ = True
+        return wrapper
+    return decorator
+
+
+def trace_methods(category):
+    """
+    클래스의 공개 메서드(밑줄로 시작하지 않는 일반 함수)를 모두 traced로 감싸는 클래스 데코레이터
+    제너레이터 함수와 @contextmanager 함수는 호출 시점에 실행되지 않으므로 제외
+    (필요하면 함수 안에서 span()으로 직접 기록)
+    
+    Args:
+        category (str): 분류
+    
+    Returns:
+        callable: 클래스 데코레이터
+    """
+    def decorator(cls):
+        for attr_name, value in list(vars(cls).items()):
+            if (
+                attr_name.startswith('_')
+                or not inspect.isfunction(value)
+                or inspect.isgeneratorfunction(inspect.unwrap(value))
+                or getattr(value, '__traced__', False)
+            ):
+                continue
+            setattr(cls, attr_name, traced(f"{cls.__name__}.{attr_name}", category)(value))
+        return cls
+    return decorator
+
+
+def export_trace(path):
+    """
+    기록된 구간을 Chrome 트레이스 JSON으로 저장
+    
+    Args:
+        path (str): 저장 경로
+    
+    Returns:
+        str: 저장 경로
+    """
+    with _lock:
+        events = list(_events)
+        dropped = _dropped
+    
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'dropped_events': dropped},
+        }, f, ensure_ascii=False)
+    return path
+
+
+def _export_on_exit():
+    """
+    종료 시 트레이스 저장 (config.TRACING_ENABLED) (내부 함수)
+    """
+    if _events:
+        stop_tracing(config.TRACE_FILE)
+
+
+if config.TRACING_ENABLED:
+    start_tracing()
+    atexit.register(_export_on_exit)
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=" * 50)
+    print("tracing 테스트")
+    print("=" * 50)
+    
+    @trace_methods('demo')
+    class Demo:
+        def outer(self):
+            with span('inner block', 'demo', step=1):
+                time.sleep(0.01)
+            return self.leaf()
+        
+        def leaf(self):
+            time.sleep(0.005)
+            return 'ok'
+    
+    start_tracing()
+    Demo().outer()
+    path = os.path.join(tempfile.gettempdir(), 'word_trace_demo.json')
+    print(f"구간 {stop_tracing(path)}개 저장: {path}")